@@ -0,0 +1,36 @@
+import argparse
+import asyncio
+from infrastructure.repositories.columnar_charging_station_repository import ColumnarChargingStationRepository
+from infrastructure.repositories.in_memory_malfunction_report_repository import InMemoryMalfunctionReportRepository
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.api.http_server import ReportHttpServer
+from domain.services.malfunction_report_service import MalfunctionReportService
+
+
+def build_service() -> MalfunctionReportService:
+    """Wire the service with the Berlin stations, like the Streamlit app"""
+    station_repo = ColumnarChargingStationRepository()
+    for station in LadesaeulenregisterLoader().load_berlin_stations():
+        station_repo.save(station)
+    return MalfunctionReportService(InMemoryMalfunctionReportRepository(), station_repo)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP/JSON API for malfunction reports")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    args = parser.parse_args()
+    
+    server = ReportHttpServer(
+        build_service(), args.host, args.port, max_concurrency=args.max_concurrency
+    )
+    print(f"🔌 Serving malfunction report API on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,32 @@
+import os
+from collections import Counter
 import streamlit as st
 import pandas as pd
+import pydeck as pdk
 from uuid import uuid4
+from datetime import datetime, timedelta
 
 # Import your real domain logic
-from infrastructure.repositories.in_memory_charging_station_repository import InMemoryChargingStationRepository
+from infrastructure.repositories.columnar_charging_station_repository import ColumnarChargingStationRepository
+from infrastructure.repositories.shared_memory_charging_station_repository import (
+    SharedStationDataset, SharedMemoryChargingStationRepository
+)
 from infrastructure.repositories.in_memory_malfunction_report_repository import InMemoryMalfunctionReportRepository
+from infrastructure.repositories.indexing_malfunction_report_repository import IndexingMalfunctionReportRepository
 from domain.services.malfunction_report_service import MalfunctionReportService
 from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.regional_statistics_loader import RegionalStatisticsLoader
+from infrastructure.data.background_station_loader import BackgroundStationLoader
+from infrastructure.data.bulk_export import BulkExporter, available_formats
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+from domain.services.ticket_priority_queue import ImpactScorer, TicketPriorityQueue
+from domain.services.repair_time_analytics import RepairTimeAnalytics
+from infrastructure.analytics.coverage_analytics import CoverageAnalytics
+from infrastructure.analytics.coverage_gap_raster import CoverageGapRaster
+from infrastructure.analytics.status_history import StatusHistoryStore
+from infrastructure.geometry.boundary_geometry import (
+    BoundaryGeometry, DISTRICT_SHAPEFILE, POSTAL_CODE_SHAPEFILE
+)
 from domain.enums.malfunction_type import MalfunctionType
 from domain.enums.report_status import ReportStatus
 from domain.value_objects.station_id import StationId # Make sure this import is at the top
@@ -17,19 +37,88 @@ st.set_page_config(page_title="Berlin EV Support", layout="wide", page_icon="
 # --- INITIALIZE SYSTEM (The "Brain") ---
 @st.cache_resource
 def init_system():
-    station_repo = InMemoryChargingStationRepository()
-    report_repo = InMemoryMalfunctionReportRepository()
+    # Descriptions are indexed on save for the dashboard's full-text search
+    report_repo = IndexingMalfunctionReportRepository(InMemoryMalfunctionReportRepository())
     
     # Load REAL Berlin stations from your CSV
     loader = LadesaeulenregisterLoader()
-    berlin_stations = loader.load_berlin_stations()
-    for station in berlin_stations:
-        station_repo.save(station)
+    statistics = RegionalStatisticsLoader()
+    population = statistics.load_population()
+    status_history = StatusHistoryStore()
+    shared_dataset = os.environ.get("CHARGEHUB_SHARED_DATASET")
+    if shared_dataset:
+        # Several Streamlit processes map one station table and status array
+        dataset = SharedStationDataset.open_or_create(shared_dataset, loader.load_berlin_stations)
+        station_repo = SharedMemoryChargingStationRepository(dataset)
+        density = Counter(station.postal_code for station in station_repo.find_all())
+        status_history.track(station_repo.find_all())
+        warmup = None
+    else:
+        # Fill the repository in the background so the first page renders right away
+        station_repo = ColumnarChargingStationRepository()
+        density = Counter()
+        
+        def on_batch(batch):
+            density.update(station.postal_code for station in batch)
+            status_history.track(batch)
         
-    service = MalfunctionReportService(report_repo, station_repo)
-    return service, station_repo
+        warmup = BackgroundStationLoader(loader, station_repo, on_batch=on_batch).start()
+    
+    # Rank open tickets by population, traffic and station density per PLZ
+    scorer = ImpactScorer(density, population, statistics.load_traffic())
+    coverage = CoverageAnalytics(station_repo, population, statistics.load_districts())
+    
+    repair_times = RepairTimeAnalytics()
+    # Derived views subscribe here instead of rescanning the repositories
+    events = InProcessEventBus()
+    status_history.subscribe(events)
+    service = MalfunctionReportService(
+        report_repo, station_repo, TicketPriorityQueue(scorer), repair_times, events
+    )
+    return service, station_repo, report_repo, coverage, repair_times, status_history, warmup, events
+
+service, station_repo, report_repo, coverage, repair_times, status_history, warmup, events = init_system()
+
+progress = warmup.progress() if warmup is not None else None
+loading = progress is not None and not progress.done
+if loading:
+    st.info(
+        f"⏳ Loading charging stations in the background: {progress.loaded:,} loaded so far. "
+        "Search already covers the loaded stations."
+    )
+    st.button("🔄 Refresh")
+elif progress is not None and progress.error is not None:
+    st.error(f"Loading charging stations failed: {progress.error}")
+
+
+def search_stations(query: str, limit: int = 500):
+    """Loaded stations whose operator, postal code or address contain the query"""
+    needle = query.casefold()
+    matches = []
+    for station in station_repo.find_all():
+        if needle in f"{station.name} {station.postal_code} {station.address or ''}".casefold():
+            matches.append(station)
+            if len(matches) == limit:
+                break
+    return matches
+
+
+@st.cache_resource
+def init_coverage_raster():
+    # Built once all stations are loaded, then kept current by status events
+    raster = CoverageGapRaster(station_repo)
+    raster.subscribe(events)
+    return raster
+
+
+@st.cache_resource
+def init_boundaries():
+    # Simplified levels are computed once and cached on disk
+    return {
+        "Bezirke": BoundaryGeometry(DISTRICT_SHAPEFILE, "Gemeinde_n"),
+        "Postleitzahlen": BoundaryGeometry(POSTAL_CODE_SHAPEFILE, "plz"),
+    }
 
-service, station_repo = init_system()
 
 # --- TABS FOR DIFFERENT VIEWS ---
 tab1, tab2, tab3 = st.tabs(["📢 Report Issue", "👷 Operator Dashboard", "📊 Network Stats"])
@@ -43,17 +132,41 @@ with tab1:
     with col1:
         with st.container(border=True):
             st.subheader("Station Selection")
-            all_stations = station_repo.find_all()
-            station_map = {f"{s.name} ({s.postal_code})": s.station_id.value for s in all_stations}
+            query = st.text_input(
+                "Search by operator, postal code or address",
+                value=st.query_params.get("station", ""),
+                help="A station ID, e.g. from the QR code on the station, works as well."
+            ).strip()
             
-            selected_display = st.selectbox("Which station are you at?", options=list(station_map.keys()))
-            selected_id = station_map[selected_display]
-            current_station = station_repo.find_by_id(StationId(selected_id))
+            exact_match = None
+            if query:
+                try:
+                    exact_match = station_repo.find_by_id(StationId.of(query))
+                except ValueError:
+                    pass
+            matches = [exact_match] if exact_match else search_stations(query)
+            labels = {s.station_id.value: f"{s.name} ({s.postal_code})" for s in matches}
             
-            st.info(f"📍 **Address:** {current_station.address or 'Berlin'}")
-            if current_station.latitude:
-                st.map(pd.DataFrame({'lat': [current_station.latitude], 'lon': [current_station.longitude]}))
-
+            current_station = None
+            if matches:
+                selected_id = st.selectbox(
+                    "Which station are you at?",
+                    options=list(labels.keys()),
+                    format_func=labels.get
+                )
+                current_station = station_repo.find_by_id(StationId.of(selected_id))
+            elif loading:
+                st.warning("This station is not loaded yet. Reporting is enabled as soon as it is.")
+            else:
+                st.warning("No station matches your search.")
+            
+            if current_station:
+                st.info(f"📍 **Address:** {current_station.address or 'Berlin'}")
+                if current_station.latitude:
+                    st.map(pd.DataFrame({'lat': [current_station.latitude], 'lon': [current_station.longitude]}))
+                    if current_station.coordinates_approximate:
+                        st.caption("Approximate position: centre of the postal code area")
+    
     with col2:
         with st.form("malfunction_form"):
             st.subheader("Issue Details")
@@ -61,12 +174,16 @@ with tab1:
             description = st.text_area("What's wrong?", help="Minimum 10 characters required.")
             email = st.text_input("Your Email (Optional)")
             
-            submit = st.form_submit_button("Submit Report", use_container_width=True)
+            submit = st.form_submit_button(
+                "Submit Report", use_container_width=True, disabled=current_station is None
+            )
             
             if submit:
                 try:
                     # Run your TDD-tested logic!
-                    report_id = service.submit_malfunction_report(selected_id, m_type, description, email)
+                    report_id = service.submit_malfunction_report(
+                        current_station.station_id.value, m_type, description, email
+                    )
                     result = service.process_malfunction_report(report_id)
                     
                     if result.success:
@@ -83,18 +200,65 @@ with tab2:
     reports = service.get_all_reports()
     
     pending_reports = [r for r in reports if r.status != ReportStatus.RESOLVED]
+    urgent_reports = service.get_most_urgent_tickets(limit=20)
     
-    if not pending_reports:
+    if not urgent_reports:
         st.write("✅ No open tickets! All stations operational.")
     else:
-        for r in pending_reports:
+        st.caption(f"Showing the {len(urgent_reports)} most urgent open tickets")
+        for r in urgent_reports:
             with st.expander(f"TICKET: {str(r.ticket_id)[:8]} - Station: {r.station_id.value}"):
-                st.write(f"**Issue:** {r._malfunction_type.value}")
-                st.write(f"**Details:** {r._description.value}")
+                st.write(f"**Issue:** {r.malfunction_type.value}")
+                st.write(f"**Details:** {r.description.value}")
                 
                 if st.button("Mark as Resolved", key=f"res_{r.report_id}"):
                     service.resolve_malfunction(r.ticket_id, "Fixed by Operator")
                     st.rerun()
+    
+    with st.expander("Bulk Resolve"):
+        scope = st.radio("Resolve all open tickets of", ["Operator", "Postal code", "Stations"], horizontal=True)
+        target = st.text_input(
+            "Operator name, postal code or comma-separated station IDs", key="bulk_target"
+        )
+        if st.button("Resolve All", disabled=not target.strip()):
+            if scope == "Operator":
+                bulk = service.resolve_tickets_for_operator(target.strip())
+            elif scope == "Postal code":
+                bulk = service.resolve_tickets_for_postal_code(target.strip())
+            else:
+                bulk = service.resolve_tickets_for_stations(
+                    station_id.strip() for station_id in target.split(",") if station_id.strip()
+                )
+            st.success(
+                f"Resolved {bulk.count} tickets and restored {len(bulk.restored_stations)} stations."
+            )
+    
+    st.subheader("Search Reports")
+    search_col1, search_col2, search_col3 = st.columns([2, 1, 1])
+    with search_col1:
+        report_query = st.text_input("Keywords", placeholder="e.g. QR-Code, Kartenleser")
+    with search_col2:
+        status_filter = st.selectbox(
+            "Status", [None] + list(ReportStatus),
+            format_func=lambda s: "All" if s is None else s.value.replace('_', ' ').title()
+        )
+    with search_col3:
+        type_filter = st.selectbox(
+            "Issue Type", [None] + list(MalfunctionType),
+            format_func=lambda t: "All" if t is None else str(t)
+        )
+    if report_query:
+        matches = report_repo.search(report_query, status=status_filter, malfunction_type=type_filter, limit=50)
+        if not matches:
+            st.write("No reports match your search.")
+        else:
+            st.dataframe(pd.DataFrame([{
+                'Station': report.station_id.value,
+                'Issue': str(report.malfunction_type),
+                'Status': report.status.value,
+                'Description': report.description.value,
+                'Relevance': round(score, 2),
+            } for report, score in matches]), hide_index=True)
 
 # --- TAB 3: STATISTICS ---
 with tab3:
@@ -105,4 +269,97 @@ with tab3:
     c1, c2, c3 = st.columns(3)
     c1.metric("Total Stations", total_stations)
     c2.metric("Active Reports", len(pending_reports))
-    c3.metric("System Health", f"{(1 - len(pending_reports)/total_stations)*100:.1f}%")
\ No newline at end of file
+    c3.metric("System Health", f"{station_repo.health_percentage():.1f}%")
+    
+    st.subheader("Reports in the Last 24 Hours")
+    now = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    trend = service.count_reports_per_bucket(now - timedelta(hours=24), now, timedelta(hours=1))
+    st.bar_chart(pd.DataFrame(
+        {"Reports": [count for _, count in trend]},
+        index=[bucket_start.strftime("%H:%M") for bucket_start, _ in trend]
+    ))
+    
+    st.subheader("Coverage per District")
+    st.dataframe(pd.DataFrame([
+        {
+            "Bezirk": row.area,
+            "Stations": row.stations,
+            "Stations / 10k inhabitants": row.stations_per_10k,
+            "Defective": f"{row.defective_share * 100:.1f}%",
+        }
+        for row in coverage.per_district()
+    ]), use_container_width=True, hide_index=True)
+    
+    st.subheader("Coverage Gaps")
+    if loading:
+        st.info("Available once all stations are loaded.")
+    else:
+        grid = init_coverage_raster().grid()
+        gap_distance = st.slider("Distance to the nearest working charger (m)", 500, 3000, 1000, step=250)
+        gaps = grid.distances > gap_distance
+        st.metric("Area beyond that distance", f"{gaps.sum() * grid.cell_size ** 2 / 1e6:.1f} km²")
+        centers = grid.cell_centers(gaps)
+        st.map(pd.DataFrame({'lat': centers[:, 0], 'lon': centers[:, 1]}), size=grid.cell_size / 2)
+    
+    st.subheader("Boundaries")
+    overlay = st.selectbox("Overlay", list(init_boundaries().keys()))
+    zoom = 10
+    try:
+        boundaries = init_boundaries()[overlay].for_zoom(zoom)
+    except (OSError, ValueError):
+        st.info("Boundary data is not available.")
+    else:
+        st.pydeck_chart(pdk.Deck(
+            layers=[pdk.Layer(
+                "GeoJsonLayer", boundaries, stroked=True, filled=False,
+                get_line_color=[0, 90, 200], line_width_min_pixels=1, pickable=True
+            )],
+            initial_view_state=pdk.ViewState(latitude=52.52, longitude=13.40, zoom=zoom),
+            tooltip={"text": "{name}"}
+        ))
+    
+    st.subheader("Time to Repair per Operator")
+    operators = repair_times.operators()
+    if operators:
+        summaries = {operator: repair_times.summary(operator) for operator in operators}
+        st.dataframe(pd.DataFrame([
+            {
+                "Operator": operator,
+                "Resolved": summary.count,
+                "MTTR (h)": round(summary.mean / 3600, 1),
+                "p50 (h)": round(summary.p50 / 3600, 1),
+                "p90 (h)": round(summary.p90 / 3600, 1),
+            }
+            for operator, summary in summaries.items()
+        ]), use_container_width=True, hide_index=True)
+    else:
+        st.info("No resolved tickets yet.")
+    
+    st.subheader("Availability per Operator (Last 30 Days)")
+    window_end = datetime.now()
+    uptimes = status_history.uptime_by_operator(window_end - timedelta(days=30), window_end)
+    network = status_history.uptime(window_end - timedelta(days=30), window_end)
+    if network.availability is not None:
+        st.metric("Network Availability", f"{network.availability:.2%}")
+        st.dataframe(pd.DataFrame([
+            {
+                "Operator": operator,
+                "Availability": f"{uptime.availability:.2%}",
+                "Downtime (h)": round(uptime.downtime.total_seconds() / 3600, 1),
+            }
+            for operator, uptime in sorted(uptimes.items(), key=lambda item: item[1].availability)
+        ]), use_container_width=True, hide_index=True)
+    else:
+        st.info("No status history yet.")
+    
+    st.subheader("Export for BI Tools")
+    # Exports the live state, including open tickets that exist only in this process
+    formats = st.multiselect("Formats", available_formats(), default=["csv"])
+    incremental = st.checkbox("Only records changed since the last export")
+    if st.button("Export", disabled=loading or not formats):
+        exporter = BulkExporter(os.environ.get("CHARGEHUB_EXPORT_DIR", "exports"), formats)
+        for result in (
+            exporter.export_stations(station_repo.find_all(), incremental),
+            exporter.export_reports(report_repo.find_all(), incremental),
+        ):
+            st.success(f"Exported {result.rows} {result.kind}: {', '.join(path.name for path in result.files)}")
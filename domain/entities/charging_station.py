@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from domain.value_objects.station_id import StationId
 from domain.enums.station_status import StationStatus
+from domain.events.domain_events import DomainEvent, StationMarkedDefective, StationMarkedAvailable
 
 
 class ChargingStation:
@@ -10,6 +11,20 @@ class ChargingStation:
     Represents a physical EV charging station with operational status
     """
     
+    __slots__ = (
+        '_station_id',
+        '_name',
+        '_postal_code',
+        '_address',
+        '_latitude',
+        '_longitude',
+        '_coordinates_approximate',
+        '_status',
+        '_created_at',
+        '_updated_at',
+        '_pending_events',
+    )
+    
     def __init__(
         self,
         station_id: StationId,
@@ -17,7 +32,8 @@ class ChargingStation:
         postal_code: str,
         address: Optional[str] = None,
         latitude: Optional[float] = None,
-        longitude: Optional[float] = None
+        longitude: Optional[float] = None,
+        created_at: Optional[datetime] = None
     ):
         self._station_id = station_id
         self._name = name
@@ -25,9 +41,34 @@ class ChargingStation:
         self._address = address
         self._latitude = latitude
         self._longitude = longitude
+        self._coordinates_approximate = False
         self._status = StationStatus.AVAILABLE
-        self._created_at = datetime.now()
-        self._updated_at = datetime.now()
+        # Loaders pass one shared timestamp for a whole batch
+        self._created_at = created_at if created_at is not None else datetime.now()
+        self._updated_at = self._created_at
+        # Only allocated once a state change records an event
+        self._pending_events: Optional[List[DomainEvent]] = None
+    
+    @classmethod
+    def restore(
+        cls,
+        station_id: StationId,
+        name: str,
+        postal_code: str,
+        address: Optional[str],
+        latitude: Optional[float],
+        longitude: Optional[float],
+        status: StationStatus,
+        created_at: datetime,
+        updated_at: datetime,
+        coordinates_approximate: bool = False
+    ) -> "ChargingStation":
+        """Rebuild a station with its current status, e.g. from storage"""
+        station = cls(station_id, name, postal_code, address, latitude, longitude, created_at)
+        station._coordinates_approximate = coordinates_approximate
+        station._status = status
+        station._updated_at = updated_at
+        return station
     
     @property
     def station_id(self) -> StationId:
@@ -53,15 +94,50 @@ class ChargingStation:
     def longitude(self) -> Optional[float]:
         return self._longitude
     
+    @property
+    def coordinates_approximate(self) -> bool:
+        """Whether the coordinates are estimated from the postal code area"""
+        return self._coordinates_approximate
+    
     @property
     def status(self) -> StationStatus:
         return self._status
     
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
+    
     @property
     def is_operational(self) -> bool:
         """Check if station is operational (available or in use)"""
         return self._status in [StationStatus.AVAILABLE, StationStatus.IN_USE]
     
+    def update_details(
+        self,
+        name: str,
+        address: Optional[str],
+        latitude: Optional[float],
+        longitude: Optional[float],
+        coordinates_approximate: bool = False
+    ) -> None:
+        """Update register data of the station, keeping its status"""
+        self._name = name
+        self._address = address
+        self._latitude = latitude
+        self._longitude = longitude
+        self._coordinates_approximate = coordinates_approximate
+        self._updated_at = datetime.now()
+    
+    def approximate_location(self, latitude: float, longitude: float) -> None:
+        """Set coordinates estimated from the postal code area, e.g. its centroid"""
+        self._latitude = latitude
+        self._longitude = longitude
+        self._coordinates_approximate = True
+    
     def mark_as_defective(self) -> None:
         """Mark station as defective due to malfunction report"""
         if self._status == StationStatus.DEFECTIVE:
@@ -69,6 +145,7 @@ class ChargingStation:
         
         self._status = StationStatus.DEFECTIVE
         self._updated_at = datetime.now()
+        self._record_event(StationMarkedDefective(self._updated_at, self.station_id, self.postal_code))
     
     def mark_as_available(self) -> None:
         """Restore station to available status after repair"""
@@ -76,4 +153,16 @@ class ChargingStation:
             raise ValueError("Can only restore defective stations to available")
         
         self._status = StationStatus.AVAILABLE
-        self._updated_at = datetime.now()
\ No newline at end of file
+        self._updated_at = datetime.now()
+        self._record_event(StationMarkedAvailable(self._updated_at, self.station_id, self.postal_code))
+    
+    def pull_events(self) -> List[DomainEvent]:
+        """Get and clear the events recorded since the last call"""
+        events = self._pending_events or []
+        self._pending_events = None
+        return events
+    
+    def _record_event(self, event: DomainEvent) -> None:
+        if self._pending_events is None:
+            self._pending_events = []
+        self._pending_events.append(event)
\ No newline at end of file
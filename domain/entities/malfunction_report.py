@@ -1,10 +1,11 @@
 from uuid import UUID
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
 from domain.value_objects.station_id import StationId
 from domain.value_objects.report_description import ReportDescription
 from domain.enums.malfunction_type import MalfunctionType
 from domain.enums.report_status import ReportStatus
+from domain.events.domain_events import DomainEvent, TicketCreated, ReportResolved
 
 
 class MalfunctionReport:
@@ -13,13 +14,29 @@ class MalfunctionReport:
     Represents a user-submitted report about a station malfunction
     """
     
+    __slots__ = (
+        '_report_id',
+        '_station_id',
+        '_malfunction_type',
+        '_description',
+        '_reported_by',
+        '_status',
+        '_ticket_id',
+        '_created_at',
+        '_updated_at',
+        '_resolved_at',
+        '_validation_errors',
+        '_pending_events',
+    )
+    
     def __init__(
         self,
         report_id: UUID,
         station_id: StationId,
         malfunction_type: MalfunctionType,
         description: ReportDescription,
-        reported_by: Optional[str] = None
+        reported_by: Optional[str] = None,
+        created_at: Optional[datetime] = None
     ):
         self._report_id = report_id
         self._station_id = station_id
@@ -28,8 +45,35 @@ class MalfunctionReport:
         self._reported_by = reported_by
         self._status = ReportStatus.SUBMITTED
         self._ticket_id: Optional[UUID] = None
-        self._created_at = datetime.now()
-        self._validation_errors: list[str] = []
+        self._created_at = created_at if created_at is not None else datetime.now()
+        self._updated_at = self._created_at
+        self._resolved_at: Optional[datetime] = None
+        # Only allocated once a validation actually fails
+        self._validation_errors: Optional[list[str]] = None
+        # Only allocated once a state change records an event
+        self._pending_events: Optional[List[DomainEvent]] = None
+    
+    @classmethod
+    def restore(
+        cls,
+        report_id: UUID,
+        station_id: StationId,
+        malfunction_type: MalfunctionType,
+        description: ReportDescription,
+        reported_by: Optional[str],
+        status: ReportStatus,
+        ticket_id: Optional[UUID],
+        created_at: datetime,
+        updated_at: datetime,
+        resolved_at: Optional[datetime] = None
+    ) -> "MalfunctionReport":
+        """Rebuild a report with its lifecycle state, e.g. from storage"""
+        report = cls(report_id, station_id, malfunction_type, description, reported_by, created_at)
+        report._status = status
+        report._ticket_id = ticket_id
+        report._updated_at = updated_at
+        report._resolved_at = resolved_at
+        return report
     
     @property
     def report_id(self) -> UUID:
@@ -41,6 +85,21 @@ class MalfunctionReport:
         """Get station ID"""
         return self._station_id
     
+    @property
+    def malfunction_type(self) -> MalfunctionType:
+        """Get malfunction type"""
+        return self._malfunction_type
+    
+    @property
+    def description(self) -> ReportDescription:
+        """Get description"""
+        return self._description
+    
+    @property
+    def reported_by(self) -> Optional[str]:
+        """Get reporter email"""
+        return self._reported_by
+    
     @property
     def status(self) -> ReportStatus:
         """Get current status"""
@@ -51,6 +110,28 @@ class MalfunctionReport:
         """Get associated ticket ID"""
         return self._ticket_id
     
+    @property
+    def created_at(self) -> datetime:
+        """Get submission time"""
+        return self._created_at
+    
+    @property
+    def updated_at(self) -> datetime:
+        """Get time of the last status change"""
+        return self._updated_at
+    
+    @property
+    def resolved_at(self) -> Optional[datetime]:
+        """Get resolution time, None while unresolved"""
+        return self._resolved_at
+    
+    @property
+    def time_to_resolve(self) -> Optional[timedelta]:
+        """Get time from submission to resolution, None while unresolved"""
+        if self._resolved_at is None:
+            return None
+        return self._resolved_at - self._created_at
+    
     def validate(self, station_exists: bool, station_is_operational: bool) -> bool:
         """
         Validate the report against business rules
@@ -62,26 +143,30 @@ class MalfunctionReport:
         Returns:
             True if valid, False otherwise
         """
-        self._validation_errors.clear()
+        errors = []
         
         # Business Rule 1: Station must exist
         if not station_exists:
-            self._validation_errors.append("Charging station does not exist")
+            errors.append("Charging station does not exist")
         
         # Business Rule 2: Station should not already be defective
         if not station_is_operational:
-            self._validation_errors.append("Station already marked as defective")
+            errors.append("Station already marked as defective")
         
         # Update status based on validation
-        if self._validation_errors:
+        if errors:
+            self._validation_errors = errors
             self._status = ReportStatus.INVALID
             return False
         
+        self._validation_errors = None
         self._status = ReportStatus.VALIDATED
         return True
     
     def get_validation_errors(self) -> list[str]:
         """Get validation error messages"""
+        if self._validation_errors is None:
+            return []
         return self._validation_errors.copy()
     
     def create_ticket(self, ticket_id: UUID) -> None:
@@ -100,6 +185,7 @@ class MalfunctionReport:
         self._ticket_id = ticket_id
         self._status = ReportStatus.TICKET_CREATED
         self._updated_at = datetime.now()
+        self._record_event(TicketCreated(self._updated_at, self._report_id, ticket_id, self._station_id))
     
     def resolve(self) -> None:
         """
@@ -112,4 +198,19 @@ class MalfunctionReport:
             raise ValueError("Cannot resolve report without a ticket")
         
         self._status = ReportStatus.RESOLVED
-        self._updated_at = datetime.now()
\ No newline at end of file
+        self._updated_at = datetime.now()
+        self._resolved_at = self._updated_at
+        self._record_event(ReportResolved(
+            self._updated_at, self._report_id, self._ticket_id, self._station_id
+        ))
+    
+    def pull_events(self) -> List[DomainEvent]:
+        """Get and clear the events recorded since the last call"""
+        events = self._pending_events or []
+        self._pending_events = None
+        return events
+    
+    def _record_event(self, event: DomainEvent) -> None:
+        if self._pending_events is None:
+            self._pending_events = []
+        self._pending_events.append(event)
\ No newline at end of file
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+from domain.value_objects.station_id import StationId
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Base class of all state changes recorded by entities"""
+    occurred_at: datetime
+
+
+@dataclass(frozen=True)
+class StationMarkedDefective(DomainEvent):
+    """A station stopped being operational because of a malfunction"""
+    station_id: StationId
+    postal_code: str
+
+
+@dataclass(frozen=True)
+class StationMarkedAvailable(DomainEvent):
+    """A defective station was repaired"""
+    station_id: StationId
+    postal_code: str
+
+
+@dataclass(frozen=True)
+class TicketCreated(DomainEvent):
+    """A validated report got a repair ticket"""
+    report_id: UUID
+    ticket_id: UUID
+    station_id: StationId
+
+
+@dataclass(frozen=True)
+class ReportResolved(DomainEvent):
+    """The ticket of a report was resolved"""
+    report_id: UUID
+    ticket_id: UUID
+    station_id: StationId
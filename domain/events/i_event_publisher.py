@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from domain.events.domain_events import DomainEvent
+
+
+class IEventPublisher(ABC):
+    """Interface for publishing domain events to subscribers"""
+    
+    @abstractmethod
+    def publish_all(self, events: Iterable[DomainEvent]) -> None:
+        """Publish events in order"""
+        pass
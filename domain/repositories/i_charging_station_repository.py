@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Optional, List, Sequence
 from domain.entities.charging_station import ChargingStation
 from domain.value_objects.station_id import StationId
 
@@ -23,11 +23,29 @@ class IChargingStationRepository(ABC):
         pass
     
     @abstractmethod
-    def find_all(self) -> List[ChargingStation]:
+    def find_all(self) -> Sequence[ChargingStation]:
         """Get all charging stations"""
         pass
     
     @abstractmethod
     def exists(self, station_id: StationId) -> bool:
         """Check if a station exists"""
-        pass
\ No newline at end of file
+        pass
+    
+    def delete(self, station_id: StationId) -> None:
+        """
+        Remove a station; unknown IDs are ignored
+        
+        Not abstract, so repositories written before deletion existed keep
+        working; they raise NotImplementedError when asked to delete.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting stations")
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """Save or update several stations; implementations may batch the writes"""
+        for station in stations:
+            self.save(station)
+    
+    def find_by_operator(self, operator: str) -> List[ChargingStation]:
+        """Find all stations of an operator (the station name from the register)"""
+        return [station for station in self.find_all() if station.name == operator]
\ No newline at end of file
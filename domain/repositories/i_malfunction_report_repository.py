@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, List, Sequence, Tuple
 from uuid import UUID
 from domain.entities.malfunction_report import MalfunctionReport
 from domain.value_objects.station_id import StationId
@@ -24,6 +25,55 @@ class IMalfunctionReportRepository(ABC):
         pass
     
     @abstractmethod
-    def find_all(self) -> List[MalfunctionReport]:
+    def find_all(self) -> Sequence[MalfunctionReport]:
         """Get all reports"""
-        pass
\ No newline at end of file
+        pass
+    
+    def delete(self, report_id: UUID) -> None:
+        """
+        Remove a report; unknown IDs are ignored
+        
+        Not abstract, so repositories written before deletion existed keep
+        working; they raise NotImplementedError when asked to delete.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting reports")
+    
+    def save_many(self, reports: Iterable[MalfunctionReport]) -> None:
+        """Save or update several reports; implementations may batch the writes"""
+        for report in reports:
+            self.save(report)
+    
+    def find_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        return next((report for report in self.find_all() if report.ticket_id == ticket_id), None)
+    
+    def find_by_stations(self, station_ids: Iterable[StationId]) -> List[MalfunctionReport]:
+        """Find all reports for any of several stations"""
+        return [report for station_id in set(station_ids) for report in self.find_by_station(station_id)]
+    
+    def find_created_between(self, start: datetime, end: datetime) -> List[MalfunctionReport]:
+        """Find reports created in [start, end), oldest first; implementations may use a time index"""
+        return sorted(
+            (report for report in self.find_all() if start <= report.created_at < end),
+            key=lambda report: report.created_at
+        )
+    
+    def count_created_per_bucket(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta
+    ) -> List[Tuple[datetime, int]]:
+        """Count reports created per time bucket in [start, end)"""
+        if bucket <= timedelta(0):
+            raise ValueError("Bucket size must be positive")
+        
+        bucket_starts = []
+        bucket_start = start
+        while bucket_start < end:
+            bucket_starts.append(bucket_start)
+            bucket_start += bucket
+        counts = [0] * len(bucket_starts)
+        for report in self.find_created_between(start, end):
+            counts[(report.created_at - start) // bucket] += 1
+        return list(zip(bucket_starts, counts))
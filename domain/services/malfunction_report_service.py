@@ -1,12 +1,19 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID, uuid4
+from domain.entities.charging_station import ChargingStation
 from domain.entities.malfunction_report import MalfunctionReport
 from domain.value_objects.station_id import StationId
 from domain.value_objects.report_description import ReportDescription
 from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from domain.enums.station_status import StationStatus
 from domain.repositories.i_charging_station_repository import IChargingStationRepository
 from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
+from domain.services.ticket_priority_queue import TicketPriorityQueue
+from domain.services.repair_time_analytics import RepairTimeAnalytics
+from domain.events.i_event_publisher import IEventPublisher
 
 
 @dataclass
@@ -17,6 +24,18 @@ class ProcessingResult:
     errors: List[str]
 
 
+@dataclass
+class BulkResolutionResult:
+    """Changes made by resolving several tickets at once"""
+    resolved_tickets: List[UUID]
+    restored_stations: List[StationId]
+    
+    @property
+    def count(self) -> int:
+        """Number of resolved tickets"""
+        return len(self.resolved_tickets)
+
+
 class MalfunctionReportService:
     """
     Domain Service: Orchestrates malfunction report workflow
@@ -24,17 +43,25 @@ class MalfunctionReportService:
     Use cases:
     1. Submit malfunction report
     2. Process/validate report
-    3. Resolve malfunction
+    3. Resolve malfunction, one ticket or all tickets of stations,
+       an operator or a postal code area at once
+    4. List the most urgent open tickets
     """
     
     def __init__(
         self,
         report_repository: IMalfunctionReportRepository,
-        station_repository: IChargingStationRepository
+        station_repository: IChargingStationRepository,
+        ticket_queue: Optional[TicketPriorityQueue] = None,
+        repair_analytics: Optional[RepairTimeAnalytics] = None,
+        event_publisher: Optional[IEventPublisher] = None
     ):
         """Initialize service with required repositories"""
         self._report_repository = report_repository
         self._station_repository = station_repository
+        self._ticket_queue = ticket_queue
+        self._repair_analytics = repair_analytics
+        self._event_publisher = event_publisher
     
     def submit_malfunction_report(
         self,
@@ -56,7 +83,7 @@ class MalfunctionReportService:
             UUID of the created report
         """
         # Create value objects (validation happens here)
-        station_id_vo = StationId(station_id)
+        station_id_vo = StationId.of(station_id)
         description_vo = ReportDescription(description)
         
         # Create report entity
@@ -126,6 +153,10 @@ class MalfunctionReportService:
         self._report_repository.save(report)
         self._station_repository.save(station)
         
+        if self._ticket_queue is not None:
+            self._ticket_queue.push(report, station.postal_code)
+        self._publish_events(report, station)
+        
         return ProcessingResult(
             success=True,
             ticket_id=ticket_id,
@@ -145,14 +176,13 @@ class MalfunctionReportService:
             operator_notes: Notes from operator about resolution
         """
         # Find report by ticket ID
-        all_reports = self._report_repository.find_all()
-        report = next(
-            (r for r in all_reports if r.ticket_id == ticket_id),
-            None
-        )
+        report = self._report_repository.find_by_ticket(ticket_id)
         
         if not report:
             raise ValueError(f"No report found with ticket ID {ticket_id}")
+        if report.status != ReportStatus.TICKET_CREATED:
+            # Resolving again would move resolved_at and count the repair twice
+            raise ValueError(f"Ticket {ticket_id} is not open")
         
         # Load station
         station = self._station_repository.find_by_id(report.station_id)
@@ -168,12 +198,119 @@ class MalfunctionReportService:
         # Save changes
         self._report_repository.save(report)
         self._station_repository.save(station)
+        
+        if self._ticket_queue is not None:
+            self._ticket_queue.remove(ticket_id)
+        if self._repair_analytics is not None:
+            # The station name is the operator (Betreiber) from the register
+            self._repair_analytics.observe(report, station.name)
+        self._publish_events(report, station)
+    
+    def resolve_tickets_for_stations(self, station_ids: Iterable[str]) -> BulkResolutionResult:
+        """Resolve all open tickets of several stations, e.g. after repairing a site"""
+        stations = []
+        for station_id in set(station_ids):
+            station = self._station_repository.find_by_id(StationId.of(station_id))
+            if station is not None:
+                stations.append(station)
+        return self._resolve_open_tickets(stations)
+    
+    def resolve_tickets_for_operator(self, operator: str) -> BulkResolutionResult:
+        """Resolve all open tickets of an operator's stations, e.g. after an outage ended"""
+        return self._resolve_open_tickets(self._station_repository.find_by_operator(operator))
+    
+    def resolve_tickets_for_postal_code(self, postal_code: str) -> BulkResolutionResult:
+        """Resolve all open tickets in a postal code area"""
+        return self._resolve_open_tickets(self._station_repository.find_by_postal_code(postal_code))
+    
+    def get_report(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Get a single report"""
+        return self._report_repository.find_by_id(report_id)
     
     def get_reports_for_station(self, station_id: str) -> List[MalfunctionReport]:
         """Get all reports for a specific station"""
-        station_id_vo = StationId(station_id)
+        station_id_vo = StationId.of(station_id)
         return self._report_repository.find_by_station(station_id_vo)
     
-    def get_all_reports(self) -> List[MalfunctionReport]:
-        """Get all malfunction reports"""
-        return self._report_repository.find_all()
\ No newline at end of file
+    def get_all_reports(self) -> Sequence[MalfunctionReport]:
+        """Get a read-only snapshot of all malfunction reports"""
+        return self._report_repository.find_all()
+    
+    def get_reports_created_between(self, start: datetime, end: datetime) -> List[MalfunctionReport]:
+        """Get reports submitted in [start, end)"""
+        return self._report_repository.find_created_between(start, end)
+    
+    def count_reports_per_bucket(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta
+    ) -> List[Tuple[datetime, int]]:
+        """Get the number of reports submitted per time bucket in [start, end)"""
+        return self._report_repository.count_created_per_bucket(start, end, bucket)
+    
+    def get_most_urgent_tickets(self, limit: int = 10) -> List[MalfunctionReport]:
+        """
+        Use Case 4: Get the open tickets with the highest impact first
+        
+        Without a ticket queue, open tickets are returned oldest first.
+        """
+        if self._ticket_queue is None:
+            open_tickets = [
+                r for r in self._report_repository.find_all()
+                if r.status == ReportStatus.TICKET_CREATED
+            ]
+            open_tickets.sort(key=lambda r: r.created_at)
+            return open_tickets[:limit]
+        
+        reports = []
+        for ticket in self._ticket_queue.top(limit):
+            report = self._report_repository.find_by_id(ticket.report_id)
+            if report is not None:
+                reports.append(report)
+        return reports
+    
+    def _resolve_open_tickets(self, stations: List[ChargingStation]) -> BulkResolutionResult:
+        """
+        Resolve the open tickets of stations with one lookup and one batched write
+        
+        Each defective station with a resolved ticket is restored once, no
+        matter how many of its tickets were open.
+        """
+        by_id = {station.station_id.value: station for station in stations}
+        reports = [
+            report for report in self._report_repository.find_by_stations(
+                station.station_id for station in stations
+            )
+            if report.status == ReportStatus.TICKET_CREATED
+        ]
+        
+        restored: List[ChargingStation] = []
+        for report in reports:
+            report.resolve()
+            station = by_id[report.station_id.value]
+            if station.status == StationStatus.DEFECTIVE:
+                station.mark_as_available()
+                restored.append(station)
+        
+        self._report_repository.save_many(reports)
+        self._station_repository.save_many(restored)
+        
+        for report in reports:
+            if self._ticket_queue is not None:
+                self._ticket_queue.remove(report.ticket_id)
+            if self._repair_analytics is not None:
+                self._repair_analytics.observe(report, by_id[report.station_id.value].name)
+        self._publish_events(*reports, *restored)
+        
+        return BulkResolutionResult(
+            resolved_tickets=[report.ticket_id for report in reports],
+            restored_stations=[station.station_id for station in restored]
+        )
+    
+    def _publish_events(self, *entities) -> None:
+        """Publish the events recorded by saved entities"""
+        # Events are pulled even without a publisher so they do not pile up
+        events = [event for entity in entities for event in entity.pull_events()]
+        if self._event_publisher is not None:
+            self._event_publisher.publish_all(events)
@@ -0,0 +1,70 @@
+import math
+from typing import Dict, Optional
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative error guarantees
+    
+    Values are counted in logarithmic buckets (as in DDSketch), so every
+    quantile is within relative_accuracy of the exact value while memory
+    grows only with the spread of the data, not with the number of values.
+    Two sketches with the same accuracy can be merged by adding bucket
+    counts, which makes per-group sketches cheap to roll up.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+    
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of all added values"""
+        return self.total / self.count if self.count else None
+    
+    def add(self, value: float) -> None:
+        """Add a non-negative value"""
+        if value < 0:
+            raise ValueError("Sketch only accepts non-negative values")
+        if value == 0:
+            self._zero_count += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+    
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add all values of another sketch with the same accuracy"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total += other.total
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Get the approximate q-quantile (0 <= q <= 1), None if empty"""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
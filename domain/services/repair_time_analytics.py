@@ -0,0 +1,87 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.enums.malfunction_type import MalfunctionType
+from domain.services.quantile_sketch import QuantileSketch
+
+
+@dataclass(frozen=True)
+class RepairTimeSummary:
+    """Time-to-resolve statistics in seconds"""
+    count: int
+    mean: Optional[float]
+    p50: Optional[float]
+    p90: Optional[float]
+    p99: Optional[float]
+
+
+class RepairTimeAnalytics:
+    """
+    Incremental mean-time-to-repair and SLA percentiles
+    
+    Each resolved report updates quantile sketches for its operator and
+    malfunction type, for both on their own and for the whole network, so
+    p50/p90/p99 are read without rescanning reports.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self._relative_accuracy = relative_accuracy
+        # Keys: (operator, type), with None meaning "all"
+        self._sketches: Dict[Tuple[Optional[str], Optional[MalfunctionType]], QuantileSketch] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, report: MalfunctionReport, operator: str) -> None:
+        """Record the time to resolve of a resolved report"""
+        duration = report.time_to_resolve
+        if duration is None:
+            raise ValueError("Report has not been resolved")
+        self.record(operator, report.malfunction_type, duration.total_seconds())
+    
+    def record(self, operator: str, malfunction_type: MalfunctionType, seconds: float) -> None:
+        """Record one time to resolve in seconds"""
+        with self._lock:
+            for key in (
+                (operator, malfunction_type),
+                (operator, None),
+                (None, malfunction_type),
+                (None, None),
+            ):
+                sketch = self._sketches.get(key)
+                if sketch is None:
+                    sketch = self._sketches[key] = QuantileSketch(self._relative_accuracy)
+                sketch.add(seconds)
+    
+    def summary(
+        self,
+        operator: Optional[str] = None,
+        malfunction_type: Optional[MalfunctionType] = None
+    ) -> RepairTimeSummary:
+        """Get statistics for an operator and/or malfunction type, or overall"""
+        with self._lock:
+            sketch = self._sketches.get((operator, malfunction_type))
+            if sketch is None:
+                return RepairTimeSummary(count=0, mean=None, p50=None, p90=None, p99=None)
+            return RepairTimeSummary(
+                count=sketch.count,
+                mean=sketch.mean,
+                p50=sketch.quantile(0.5),
+                p90=sketch.quantile(0.9),
+                p99=sketch.quantile(0.99)
+            )
+    
+    def operators(self) -> List[str]:
+        """Get all operators with at least one resolved report"""
+        with self._lock:
+            return sorted({key[0] for key in self._sketches if key[0] is not None})
+    
+    def merge(self, other: "RepairTimeAnalytics") -> None:
+        """Add the observations of another engine, e.g. from another worker"""
+        with other._lock:
+            sketches = list(other._sketches.items())
+        with self._lock:
+            for key, sketch in sketches:
+                own = self._sketches.get(key)
+                if own is None:
+                    own = self._sketches[key] = QuantileSketch(self._relative_accuracy)
+                own.merge(sketch)
@@ -0,0 +1,154 @@
+import heapq
+import itertools
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+
+SECONDS_PER_HOUR = 3600.0
+
+
+@dataclass(frozen=True)
+class ImpactWeights:
+    """Weights of the factors that make up a ticket's impact score"""
+    population: float = 1.0
+    traffic: float = 1.0
+    age_per_hour: float = 0.05
+
+
+@dataclass(frozen=True)
+class PrioritizedTicket:
+    """Open ticket together with its current priority"""
+    ticket_id: UUID
+    report_id: UUID
+    postal_code: str
+    impact: float
+    score: float
+
+
+class ImpactScorer:
+    """
+    Scores how strongly a broken station affects drivers in its area
+    
+    A defect weighs more where many people live or drive and fewer
+    alternative stations are available in the same postal code.
+    """
+    
+    def __init__(
+        self,
+        stations_per_postal_code: Dict[str, int],
+        population: Dict[str, float],
+        traffic: Dict[str, float],
+        weights: ImpactWeights = ImpactWeights()
+    ):
+        self._stations_per_postal_code = stations_per_postal_code
+        self._population = population
+        self._traffic = traffic
+        self._max_population = max(population.values(), default=0.0)
+        self._max_traffic = max(traffic.values(), default=0.0)
+        self.weights = weights
+    
+    @classmethod
+    def from_stations(
+        cls,
+        stations: Iterable[ChargingStation],
+        population: Dict[str, float],
+        traffic: Dict[str, float],
+        weights: ImpactWeights = ImpactWeights()
+    ) -> "ImpactScorer":
+        """Build a scorer using the station density of the given stations"""
+        density = Counter(station.postal_code for station in stations)
+        return cls(dict(density), population, traffic, weights)
+    
+    def impact(self, postal_code: str) -> float:
+        """Age-independent impact of a defect in a postal code area"""
+        demand = 1.0
+        if self._max_population:
+            demand += self.weights.population * self._population.get(postal_code, 0.0) / self._max_population
+        if self._max_traffic:
+            demand += self.weights.traffic * self._traffic.get(postal_code, 0.0) / self._max_traffic
+        return demand / max(self._stations_per_postal_code.get(postal_code, 0), 1)
+    
+    def score(self, impact: float, created_at: datetime, now: datetime) -> float:
+        """Priority of a ticket at a given time: impact plus a linear age bonus"""
+        age_hours = (now - created_at).total_seconds() / SECONDS_PER_HOUR
+        return impact + self.weights.age_per_hour * age_hours
+
+
+class TicketPriorityQueue:
+    """
+    Heap of open tickets ordered by impact score
+    
+    The age bonus grows linearly and at the same rate for every ticket, so
+    ordering by impact - rate * created_at is the same as ordering by the
+    current score at any point in time. Aging therefore never requires
+    re-keying: push is O(log n), remove is O(1) with lazy deletion, and the
+    top N tickets are read in O(N log n) without sorting the backlog.
+    """
+    
+    def __init__(self, scorer: ImpactScorer):
+        self._scorer = scorer
+        self._heap: List[tuple] = []
+        # ticket_id -> (report_id, postal_code, impact, created_at)
+        self._entries: Dict[UUID, tuple] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, ticket_id: UUID) -> bool:
+        return ticket_id in self._entries
+    
+    def push(self, report: MalfunctionReport, postal_code: str) -> None:
+        """Add the open ticket of a report"""
+        if report.ticket_id is None:
+            raise ValueError("Cannot queue report without a ticket")
+        
+        impact = self._scorer.impact(postal_code)
+        created_hours = report.created_at.timestamp() / SECONDS_PER_HOUR
+        key = -(impact - self._scorer.weights.age_per_hour * created_hours)
+        
+        with self._lock:
+            self._entries[report.ticket_id] = (
+                report.report_id, postal_code, impact, report.created_at
+            )
+            heapq.heappush(self._heap, (key, next(self._sequence), report.ticket_id))
+    
+    def remove(self, ticket_id: UUID) -> None:
+        """Drop a ticket once it is resolved; unknown tickets are ignored"""
+        with self._lock:
+            if self._entries.pop(ticket_id, None) is None:
+                return
+            # Stale heap entries are skipped lazily; compact when they dominate
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._heap = [item for item in self._heap if item[2] in self._entries]
+                heapq.heapify(self._heap)
+    
+    def top(self, limit: int, now: Optional[datetime] = None) -> List[PrioritizedTicket]:
+        """Get the most urgent open tickets, highest score first"""
+        now = now or datetime.now()
+        with self._lock:
+            popped = []
+            while self._heap and len(popped) < limit:
+                item = heapq.heappop(self._heap)
+                if item[2] in self._entries:
+                    popped.append(item)
+            for item in popped:
+                heapq.heappush(self._heap, item)
+            
+            result = []
+            for _, _, ticket_id in popped:
+                report_id, postal_code, impact, created_at = self._entries[ticket_id]
+                result.append(PrioritizedTicket(
+                    ticket_id=ticket_id,
+                    report_id=report_id,
+                    postal_code=postal_code,
+                    impact=impact,
+                    score=self._scorer.score(impact, created_at, now)
+                ))
+            return result
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
+# Large enough to hold every station of the national register
+INTERN_CACHE_SIZE = 1 << 17
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StationId:
     """Value object representing a charging station identifier"""
     value: str
@@ -12,4 +16,20 @@ class StationId:
             raise ValueError("Station ID cannot be empty")
         
         if len(self.value) > 50:
-            raise ValueError("Station ID too long (max 50 characters)")
\ No newline at end of file
+            raise ValueError("Station ID too long (max 50 characters)")
+    
+    @classmethod
+    def of(cls, value: str) -> "StationId":
+        """
+        Get the canonical, already validated StationId for a value
+        
+        Repeated calls with the same value return the same instance, so
+        hot paths skip validation and allocation and can compare by identity.
+        """
+        return _intern(value)
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _intern(value: str) -> StationId:
+    # Invalid values raise and are therefore never cached
+    return StationId(value)
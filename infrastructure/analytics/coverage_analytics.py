@@ -0,0 +1,145 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository,
+    STATUS_CODES,
+    postal_code_from_int,
+)
+
+UNKNOWN_DISTRICT = "Unbekannt"
+
+
+@dataclass(frozen=True)
+class CoverageRow:
+    """Charging coverage of one postal code or district"""
+    area: str
+    stations: int
+    defective: int
+    population: float
+    stations_per_10k: Optional[float]
+    defective_share: float
+    rank: int
+
+
+class CoverageAnalytics:
+    """
+    Charging coverage per postal code (PLZ) and per district (Bezirk)
+    
+    Joins the station columns with population and district data using
+    vectorized NumPy operations. Results are cached and only recomputed
+    when a station is added or changes status.
+    """
+    
+    def __init__(
+        self,
+        repository: ColumnarChargingStationRepository,
+        population: Dict[str, float],
+        districts: Dict[str, str]
+    ):
+        self._repository = repository
+        self._population_codes, self._population = _sorted_lookup(
+            {int(code): value for code, value in population.items() if code.isdigit()}
+        )
+        self._district_names = sorted(set(districts.values()) | {UNKNOWN_DISTRICT})
+        district_index = {name: index for index, name in enumerate(self._district_names)}
+        self._district_codes, self._district_of_code = _sorted_lookup(
+            {int(code): district_index[name] for code, name in districts.items() if code.isdigit()}
+        )
+        self._unknown_district = district_index[UNKNOWN_DISTRICT]
+        self._lock = threading.Lock()
+        self._cached_version: Optional[int] = None
+        self._cache: Dict[str, List[CoverageRow]] = {}
+    
+    def per_postal_code(self) -> List[CoverageRow]:
+        """Coverage per postal code, best covered first"""
+        return self._results()['postal_code']
+    
+    def per_district(self) -> List[CoverageRow]:
+        """Coverage per district, best covered first"""
+        return self._results()['district']
+    
+    def _results(self) -> Dict[str, List[CoverageRow]]:
+        with self._lock:
+            version = self._repository.status_version
+            if self._cached_version != version:
+                self._cache = self._compute()
+                self._cached_version = version
+            return self._cache
+    
+    def _compute(self) -> Dict[str, List[CoverageRow]]:
+        columns = self._repository.columns()
+        station_codes = columns['postal_code']
+        defective = columns['status'] == STATUS_CODES[StationStatus.DEFECTIVE]
+        
+        # Every PLZ with stations or inhabitants takes part in the ranking
+        codes = np.union1d(np.unique(station_codes), self._population_codes)
+        station_slots = np.searchsorted(codes, station_codes)
+        stations = np.bincount(station_slots, minlength=len(codes))
+        defects = np.bincount(station_slots, weights=defective, minlength=len(codes))
+        population = _lookup(self._population_codes, self._population, codes, 0.0)
+        
+        districts = _lookup(
+            self._district_codes, self._district_of_code, codes, self._unknown_district
+        ).astype(np.intp)
+        district_count = len(self._district_names)
+        district_stations = np.bincount(districts, weights=stations, minlength=district_count)
+        district_defects = np.bincount(districts, weights=defects, minlength=district_count)
+        district_population = np.bincount(districts, weights=population, minlength=district_count)
+        used = district_stations + district_population > 0
+        
+        return {
+            'postal_code': _rows(
+                [postal_code_from_int(int(code)) for code in codes],
+                stations, defects, population
+            ),
+            'district': _rows(
+                [name for name, keep in zip(self._district_names, used) if keep],
+                district_stations[used], district_defects[used], district_population[used]
+            ),
+        }
+
+
+def _sorted_lookup(mapping: Dict[int, float]) -> Tuple[np.ndarray, np.ndarray]:
+    keys = np.array(sorted(mapping), dtype=np.int64)
+    values = np.array([mapping[key] for key in keys], dtype=np.float64)
+    return keys, values
+
+
+def _lookup(keys: np.ndarray, values: np.ndarray, queries: np.ndarray, default: float) -> np.ndarray:
+    """Vectorized dictionary lookup over sorted keys"""
+    result = np.full(len(queries), default, dtype=np.float64)
+    if len(keys) == 0:
+        return result
+    slots = np.clip(np.searchsorted(keys, queries), 0, len(keys) - 1)
+    found = keys[slots] == queries
+    result[found] = values[slots[found]]
+    return result
+
+
+def _rows(
+    areas: List[str],
+    stations: np.ndarray,
+    defects: np.ndarray,
+    population: np.ndarray
+) -> List[CoverageRow]:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_10k = np.where(population > 0, stations / population * 10_000, np.nan)
+        defective_share = np.where(stations > 0, defects / stations, 0.0)
+    
+    # Highest stations per capita first; areas without population data last
+    order = np.lexsort((-stations, np.where(np.isnan(per_10k), np.inf, -per_10k)))
+    return [
+        CoverageRow(
+            area=areas[index],
+            stations=int(stations[index]),
+            defective=int(defects[index]),
+            population=float(population[index]),
+            stations_per_10k=None if np.isnan(per_10k[index]) else float(per_10k[index]),
+            defective_share=float(defective_share[index]),
+            rank=rank
+        )
+        for rank, index in enumerate(order, start=1)
+    ]
@@ -0,0 +1,213 @@
+import math
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.events.domain_events import StationMarkedDefective, StationMarkedAvailable
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.data.shapefile import BoundingBox, read_bounding_box
+from infrastructure.data.regional_statistics_loader import DATASETS_DIR
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+
+DISTRICT_SHAPEFILE = DATASETS_DIR / "berlin_bezirke" / "bezirksgrenzen.shp"
+# Used when the district shapefile is missing or not in WGS84
+BERLIN_BOUNDS = BoundingBox(min_x=13.0884, min_y=52.3383, max_x=13.7612, max_y=52.6755)
+METERS_PER_DEGREE = 111_195.0
+# Upper bound of cell/station pairs compared at once
+CHUNK_PAIRS = 4_000_000
+
+
+def berlin_bounds(shapefile: Path = DISTRICT_SHAPEFILE) -> BoundingBox:
+    """Bounds of Berlin from the district shapefile, or built-in bounds"""
+    try:
+        bounds = read_bounding_box(shapefile)
+    except (OSError, ValueError):
+        return BERLIN_BOUNDS
+    return bounds if bounds.is_geographic else BERLIN_BOUNDS
+
+
+@dataclass(frozen=True)
+class CoverageGrid:
+    """
+    Distance in meters to the nearest operational charger per grid cell
+    
+    Row 0 is the southernmost row and column 0 the westernmost column;
+    cells without any operational charger in range hold infinity.
+    """
+    distances: np.ndarray
+    bounds: BoundingBox
+    cell_size: float
+    
+    def cell_centers(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Latitude/longitude of cell centers as an (n, 2) array"""
+        rows, columns = np.nonzero(np.ones_like(self.distances, dtype=bool) if mask is None else mask)
+        height = (self.bounds.max_y - self.bounds.min_y) / self.distances.shape[0]
+        width = (self.bounds.max_x - self.bounds.min_x) / self.distances.shape[1]
+        return np.column_stack((
+            self.bounds.min_y + (rows + 0.5) * height,
+            self.bounds.min_x + (columns + 0.5) * width,
+        ))
+
+
+class CoverageGapRaster:
+    """
+    Raster of the distance from every point in Berlin to the nearest working charger
+    
+    The bounds are split into square cells; for each cell the distance to
+    and index of the nearest operational station are kept. A station going
+    defective only recomputes the cells it was nearest to, and a station
+    becoming available only compares its own distance against every cell.
+    Distances use a local equirectangular projection, which is accurate to
+    well below a cell size across the city.
+    """
+    
+    def __init__(
+        self,
+        repository: IChargingStationRepository,
+        bounds: Optional[BoundingBox] = None,
+        cell_size: float = 250.0
+    ):
+        """
+        Args:
+            repository: Stations to cover; stations without coordinates are ignored
+            bounds: Area to rasterize, Berlin by default
+            cell_size: Cell edge length in meters
+        """
+        self._repository = repository
+        self._lock = threading.Lock()
+        self.cell_size = cell_size
+        
+        bounds = bounds or berlin_bounds()
+        self._meters_per_degree_lon = METERS_PER_DEGREE * math.cos(math.radians((bounds.min_y + bounds.max_y) / 2))
+        self._origin = (bounds.min_x, bounds.min_y)
+        self._columns = max(math.ceil((bounds.max_x - bounds.min_x) * self._meters_per_degree_lon / cell_size), 1)
+        self._rows = max(math.ceil((bounds.max_y - bounds.min_y) * METERS_PER_DEGREE / cell_size), 1)
+        # Bounds snapped outwards to whole cells
+        self.bounds = BoundingBox(
+            bounds.min_x,
+            bounds.min_y,
+            bounds.min_x + self._columns * cell_size / self._meters_per_degree_lon,
+            bounds.min_y + self._rows * cell_size / METERS_PER_DEGREE,
+        )
+        
+        rows, columns = np.indices((self._rows, self._columns))
+        self._cells = np.column_stack((
+            (columns.ravel() + 0.5) * cell_size,
+            (rows.ravel() + 0.5) * cell_size,
+        ))
+        self.rebuild()
+    
+    def rebuild(self) -> None:
+        """Re-read all stations from the repository and recompute every cell"""
+        station_ids: List[str] = []
+        points = []
+        operational = []
+        for station in self._repository.find_all():
+            point = self._project(station)
+            if point is not None:
+                station_ids.append(station.station_id.value)
+                points.append(point)
+                operational.append(station.is_operational)
+        
+        with self._lock:
+            self._station_ids = station_ids
+            self._station_index: Dict[str, int] = {value: index for index, value in enumerate(station_ids)}
+            self._points = np.array(points, dtype=np.float64).reshape(-1, 2)
+            self._operational = np.array(operational, dtype=bool)
+            self._distance = np.full(len(self._cells), np.inf)
+            self._nearest = np.full(len(self._cells), -1, dtype=np.int32)
+            self._recompute(np.arange(len(self._cells)))
+    
+    def subscribe(self, bus: InProcessEventBus) -> None:
+        """Keep the raster up to date from station status events"""
+        bus.subscribe(StationMarkedDefective, lambda event: self.station_defective(event.station_id))
+        bus.subscribe(StationMarkedAvailable, lambda event: self.station_available(event.station_id))
+    
+    def station_defective(self, station_id: StationId) -> None:
+        """Recompute the cells whose nearest charger went out of service"""
+        with self._lock:
+            index = self._station_index.get(station_id.value)
+            if index is None or not self._operational[index]:
+                return
+            self._operational[index] = False
+            self._recompute(np.flatnonzero(self._nearest == index))
+    
+    def station_available(self, station_id: StationId) -> None:
+        """Update the cells that are now closer to a working charger"""
+        with self._lock:
+            index = self._station_index.get(station_id.value)
+        if index is None:
+            # A station the raster has not seen yet
+            station = self._repository.find_by_id(station_id)
+            point = self._project(station) if station is not None else None
+            if point is None:
+                return
+            with self._lock:
+                index = self._add_station(station_id.value, point)
+        
+        with self._lock:
+            if self._operational[index]:
+                return
+            self._operational[index] = True
+            station_x, station_y = self._points[index]
+            distance = np.sqrt(
+                np.square(self._cells[:, 0] - station_x) + np.square(self._cells[:, 1] - station_y)
+            )
+            closer = distance < self._distance
+            self._distance[closer] = distance[closer]
+            self._nearest[closer] = index
+    
+    def distance_at(self, latitude: float, longitude: float) -> Optional[float]:
+        """Distance in meters from a point to the nearest working charger, None outside the raster"""
+        column = math.floor((longitude - self._origin[0]) * self._meters_per_degree_lon / self.cell_size)
+        row = math.floor((latitude - self._origin[1]) * METERS_PER_DEGREE / self.cell_size)
+        if not (0 <= row < self._rows and 0 <= column < self._columns):
+            return None
+        return float(self._distance[row * self._columns + column])
+    
+    def grid(self) -> CoverageGrid:
+        """Get a copy of the current raster for rendering"""
+        with self._lock:
+            distances = self._distance.reshape(self._rows, self._columns).copy()
+        distances.flags.writeable = False
+        return CoverageGrid(distances, self.bounds, self.cell_size)
+    
+    def _project(self, station: ChargingStation) -> Optional[tuple]:
+        if station.latitude is None or station.longitude is None:
+            return None
+        return (
+            (station.longitude - self._origin[0]) * self._meters_per_degree_lon,
+            (station.latitude - self._origin[1]) * METERS_PER_DEGREE,
+        )
+    
+    def _add_station(self, station_id: str, point: tuple) -> int:
+        index = self._station_index.get(station_id)
+        if index is None:
+            index = len(self._station_ids)
+            self._station_ids.append(station_id)
+            self._station_index[station_id] = index
+            self._points = np.vstack((self._points, point))
+            self._operational = np.append(self._operational, False)
+        return index
+    
+    def _recompute(self, cells: np.ndarray) -> None:
+        """Find the nearest operational station for the given cells"""
+        candidates = np.flatnonzero(self._operational)
+        if len(candidates) == 0:
+            self._distance[cells] = np.inf
+            self._nearest[cells] = -1
+            return
+        
+        station_x, station_y = self._points[candidates].T
+        chunk = max(CHUNK_PAIRS // len(candidates), 1)
+        for start in range(0, len(cells), chunk):
+            part = cells[start:start + chunk]
+            # Compare squared distances and take the root of the minimum only
+            squared = np.square(self._cells[part, 0, None] - station_x)
+            squared += np.square(self._cells[part, 1, None] - station_y)
+            nearest = squared.argmin(axis=1)
+            self._distance[part] = np.sqrt(squared[np.arange(len(part)), nearest])
+            self._nearest[part] = candidates[nearest]
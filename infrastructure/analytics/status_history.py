@@ -0,0 +1,237 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from domain.events.domain_events import StationMarkedDefective, StationMarkedAvailable
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+
+STATUSES = list(StationStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+OPERATIONAL_CODES = [STATUS_CODES[StationStatus.AVAILABLE], STATUS_CODES[StationStatus.IN_USE]]
+# Operator code of stations only known from events
+NO_OPERATOR = -1
+
+
+@dataclass(frozen=True)
+class UptimeSummary:
+    """Time a station, operator or the network was observed and operational in a window"""
+    observed: timedelta
+    uptime: timedelta
+    
+    @property
+    def downtime(self) -> timedelta:
+        return self.observed - self.uptime
+    
+    @property
+    def availability(self) -> Optional[float]:
+        """Share of observed time spent operational, None if nothing was observed"""
+        if not self.observed:
+            return None
+        return self.uptime / self.observed
+
+
+class StatusHistoryStore:
+    """
+    Run-length encoded status history of all stations
+    
+    Only transitions are stored: one row of station code, start timestamp
+    and int8 status code per run, in NumPy columns, so memory grows with
+    the number of status changes rather than with time. A run lasts until
+    the station's next transition (or the end of the window). Uptime over
+    any window clips all runs at once and sums them per station or
+    operator with bincount.
+    """
+    
+    def __init__(self, initial_capacity: int = 1024, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            initial_capacity: Number of transitions to allocate room for
+            clock: Current time as a UNIX timestamp; windows never extend past it
+        """
+        self._clock = clock
+        self._stations: Dict[str, int] = {}
+        self._station_ids: List[str] = []
+        self._operators: Dict[str, int] = {}
+        self._operator_names: List[str] = []
+        self._station_capacity = 1024
+        self._station_operator = np.zeros(self._station_capacity, dtype=np.int32)
+        self._last_status = np.zeros(self._station_capacity, dtype=np.int8)
+        self._size = 0
+        self._capacity = max(initial_capacity, 1)
+        self._station = np.zeros(self._capacity, dtype=np.int32)
+        self._time = np.zeros(self._capacity, dtype=np.float64)
+        self._status = np.zeros(self._capacity, dtype=np.int8)
+        self._runs: Optional[Tuple[np.ndarray, ...]] = None
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        """Number of stored transitions"""
+        return self._size
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the history and per-station columns"""
+        return sum(column.nbytes for column in (
+            self._station, self._time, self._status, self._station_operator, self._last_status
+        ))
+    
+    def track(self, stations: Iterable[ChargingStation]) -> None:
+        """Start the history of stations with their current status and operator"""
+        with self._lock:
+            for station in stations:
+                if station.station_id.value in self._stations:
+                    continue
+                code = self._station_code(station.station_id.value, station.name)
+                self._append(code, station.updated_at.timestamp(), STATUS_CODES[station.status])
+    
+    def record(self, station_id: StationId, status: StationStatus, at: datetime) -> None:
+        """Record a status change; repeating the current status is ignored"""
+        with self._lock:
+            code = self._stations.get(station_id.value)
+            if code is None:
+                code = self._station_code(station_id.value, None)
+            elif self._last_status[code] == STATUS_CODES[status]:
+                return
+            self._append(code, at.timestamp(), STATUS_CODES[status])
+    
+    def subscribe(self, bus: InProcessEventBus) -> None:
+        """Record transitions from station status events"""
+        bus.subscribe(
+            StationMarkedDefective,
+            lambda event: self.record(event.station_id, StationStatus.DEFECTIVE, event.occurred_at)
+        )
+        bus.subscribe(
+            StationMarkedAvailable,
+            lambda event: self.record(event.station_id, StationStatus.AVAILABLE, event.occurred_at)
+        )
+    
+    def history(self, station_id: StationId) -> List[Tuple[datetime, StationStatus]]:
+        """Status runs of a station as (start, status), oldest first"""
+        with self._lock:
+            code = self._stations.get(station_id.value)
+            if code is None:
+                return []
+            station, start, status, _ = self._sorted_runs()
+            low, high = np.searchsorted(station, [code, code + 1])
+            return [
+                (datetime.fromtimestamp(start[row]), STATUSES[status[row]])
+                for row in range(low, high)
+            ]
+    
+    def uptime(
+        self,
+        start: datetime,
+        end: datetime,
+        station_id: Optional[StationId] = None,
+        operator: Optional[str] = None
+    ) -> UptimeSummary:
+        """Uptime in [start, end) of one station, one operator or, by default, the network"""
+        with self._lock:
+            station, durations, operational = self._clipped(start, end)
+            mask = np.ones(len(station), dtype=np.bool_)
+            if station_id is not None:
+                mask &= station == self._stations.get(station_id.value, -1)
+            if operator is not None:
+                mask &= self._station_operator[station] == self._operators.get(operator, -2)
+            return _summary(durations[mask].sum(), durations[mask & operational].sum())
+    
+    def uptime_by_station(self, start: datetime, end: datetime) -> Dict[str, UptimeSummary]:
+        """Uptime in [start, end) of every station observed in the window"""
+        with self._lock:
+            station, durations, operational = self._clipped(start, end)
+            return self._grouped(station, durations, operational, len(self._station_ids), self._station_ids)
+    
+    def uptime_by_operator(self, start: datetime, end: datetime) -> Dict[str, UptimeSummary]:
+        """Uptime in [start, end) per operator, for stations with a known operator"""
+        with self._lock:
+            station, durations, operational = self._clipped(start, end)
+            operator = self._station_operator[station]
+            known = operator != NO_OPERATOR
+            return self._grouped(
+                operator[known], durations[known], operational[known],
+                len(self._operator_names), self._operator_names
+            )
+    
+    def _clipped(self, start: datetime, end: datetime) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Station, duration within the window and operational flag of every run"""
+        station, run_start, status, run_end = self._sorted_runs()
+        window_start = start.timestamp()
+        window_end = min(end.timestamp(), self._clock())
+        durations = np.clip(
+            np.minimum(run_end, window_end) - np.maximum(run_start, window_start), 0, None
+        )
+        return station, durations, np.isin(status, OPERATIONAL_CODES)
+    
+    def _sorted_runs(self) -> Tuple[np.ndarray, ...]:
+        # Sorted once per change, not once per query
+        if self._runs is None:
+            order = np.lexsort((self._time[:self._size], self._station[:self._size]))
+            station = self._station[order]
+            start = self._time[order]
+            end = np.full(len(order), np.inf)
+            same_station = station[1:] == station[:-1]
+            end[:-1][same_station] = start[1:][same_station]
+            self._runs = (station, start, self._status[order], end)
+        return self._runs
+    
+    @staticmethod
+    def _grouped(
+        groups: np.ndarray,
+        durations: np.ndarray,
+        operational: np.ndarray,
+        count: int,
+        names: List[str]
+    ) -> Dict[str, UptimeSummary]:
+        observed = np.bincount(groups, weights=durations, minlength=count)
+        uptime = np.bincount(groups, weights=np.where(operational, durations, 0.0), minlength=count)
+        return {
+            names[code]: _summary(observed[code], uptime[code])
+            for code in np.flatnonzero(observed)
+        }
+    
+    def _station_code(self, station_id: str, operator: Optional[str]) -> int:
+        code = len(self._station_ids)
+        self._stations[station_id] = code
+        self._station_ids.append(station_id)
+        operator_code = NO_OPERATOR
+        if operator is not None:
+            operator_code = self._operators.get(operator)
+            if operator_code is None:
+                operator_code = self._operators[operator] = len(self._operator_names)
+                self._operator_names.append(operator)
+        if code == self._station_capacity:
+            self._station_capacity *= 2
+            self._station_operator = _grown(self._station_operator, self._station_capacity)
+            self._last_status = _grown(self._last_status, self._station_capacity)
+        self._station_operator[code] = operator_code
+        return code
+    
+    def _append(self, station: int, timestamp: float, status: int) -> None:
+        if self._size == self._capacity:
+            self._grow()
+        self._station[self._size] = station
+        self._time[self._size] = timestamp
+        self._status[self._size] = status
+        self._last_status[station] = status
+        self._size += 1
+        self._runs = None
+    
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for column in ('_station', '_time', '_status'):
+            setattr(self, column, _grown(getattr(self, column), self._capacity))
+
+
+def _grown(column: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
+def _summary(observed: float, uptime: float) -> UptimeSummary:
+    return UptimeSummary(timedelta(seconds=float(observed)), timedelta(seconds=float(uptime)))
@@ -0,0 +1,304 @@
+import asyncio
+import json
+import traceback
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from uuid import UUID
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.enums.malfunction_type import MalfunctionType
+from domain.services.malfunction_report_service import MalfunctionReportService, ProcessingResult
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15.0
+
+
+class HttpError(Exception):
+    """Error that is reported to the client with an HTTP status"""
+    
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def report_to_json(report: MalfunctionReport) -> Dict[str, Any]:
+    """Serialize a report for API responses"""
+    return {
+        'report_id': str(report.report_id),
+        'station_id': report.station_id.value,
+        'malfunction_type': report.malfunction_type.value,
+        'description': report.description.value,
+        'status': report.status.value,
+        'ticket_id': str(report.ticket_id) if report.ticket_id else None,
+        'created_at': report.created_at.isoformat(),
+    }
+
+
+def result_to_json(result: ProcessingResult) -> Dict[str, Any]:
+    """Serialize a processing result for API responses"""
+    return {
+        'success': result.success,
+        'ticket_id': str(result.ticket_id) if result.ticket_id else None,
+        'errors': result.errors,
+    }
+
+
+class ReportHttpServer:
+    """
+    Lightweight asyncio HTTP/JSON entry point for MalfunctionReportService
+    
+    Endpoints:
+        POST /reports                      submit one report, or a JSON list
+                                           of reports as one batch; set
+                                           "process": true to also validate
+        POST /reports/{report_id}/process  validate a report, create ticket
+        POST /tickets/{ticket_id}/resolve  resolve a ticket
+        GET  /reports/{report_id}          get one report
+        GET  /reports?station_id=...       list reports of a station
+        GET  /health                       liveness check
+    
+    Connections are kept alive between requests. At most max_connections
+    connections are open at once, further ones get a 503, and at most
+    max_concurrency request bodies are buffered and handled at the same
+    time. Service calls run on the event loop, so the in-memory
+    repositories see one writer.
+    """
+    
+    def __init__(
+        self,
+        service: MalfunctionReportService,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_concurrency: int = 64,
+        max_batch_size: int = 500,
+        max_connections: int = 1024
+    ):
+        self._service = service
+        self._host = host
+        self._port = port
+        self._max_concurrency = max_concurrency
+        self._max_batch_size = max_batch_size
+        self._max_connections = max_connections
+        self._connections = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+    
+    @property
+    def port(self) -> int:
+        """Port the server listens on; useful when started with port 0"""
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+    
+    async def start(self) -> None:
+        """Start accepting connections"""
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, limit=MAX_HEADER_BYTES
+        )
+    
+    async def serve_forever(self) -> None:
+        """Start the server and block until it is cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def stop(self) -> None:
+        """Stop accepting connections and wait for the listener to close"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self._connections >= self._max_connections:
+            try:
+                await self._write(writer, HTTPStatus.SERVICE_UNAVAILABLE, {'error': 'Too many connections'}, False)
+            except ConnectionError:
+                pass
+            writer.close()
+            return
+        
+        self._connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, {'error': 'Headers too large'}, False)
+                    break
+                
+                # Bounds the request bodies buffered at once, not just the dispatch
+                async with self._semaphore:
+                    try:
+                        method, target, version, headers = _parse_head(head)
+                        keep_alive = _wants_keep_alive(version, headers)
+                        body = await asyncio.wait_for(_read_body(reader, headers), KEEP_ALIVE_TIMEOUT)
+                    except HttpError as error:
+                        # The rest of the request cannot be skipped reliably
+                        await self._write(writer, error.status, {'error': error.message}, False)
+                        break
+                    
+                    try:
+                        status, payload = self._dispatch(method, target, body)
+                    except HttpError as error:
+                        status, payload = error.status, {'error': error.message}
+                    except Exception:
+                        print(f"❌ Request {method} {target} failed:")
+                        traceback.print_exc()
+                        status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal server error'}
+                
+                await self._write(writer, status, payload, keep_alive)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+    
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Any,
+        keep_alive: bool
+    ) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+    
+    def _dispatch(self, method: str, target: str, body: Any) -> Tuple[HTTPStatus, Any]:
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+        
+        if method == 'GET' and parts == ['health']:
+            return HTTPStatus.OK, {'status': 'ok'}
+        
+        if parts[:1] == ['reports']:
+            if method == 'POST' and len(parts) == 1:
+                return self._submit(body)
+            if method == 'POST' and len(parts) == 3 and parts[2] == 'process':
+                result = self._call(self._service.process_malfunction_report, _parse_uuid(parts[1]))
+                return HTTPStatus.OK, result_to_json(result)
+            if method == 'GET' and len(parts) == 2:
+                report = self._service.get_report(_parse_uuid(parts[1]))
+                if report is None:
+                    raise HttpError(HTTPStatus.NOT_FOUND, f"Report {parts[1]} not found")
+                return HTTPStatus.OK, report_to_json(report)
+            if method == 'GET' and len(parts) == 1:
+                station_id = parse_qs(url.query).get('station_id', [None])[0]
+                if not station_id:
+                    raise HttpError(HTTPStatus.BAD_REQUEST, "station_id query parameter is required")
+                reports = self._call(self._service.get_reports_for_station, station_id)
+                return HTTPStatus.OK, [report_to_json(report) for report in reports]
+        
+        if method == 'POST' and len(parts) == 3 and parts[0] == 'tickets' and parts[2] == 'resolve':
+            notes = body.get('operator_notes') if isinstance(body, dict) else None
+            self._call(self._service.resolve_malfunction, _parse_uuid(parts[1]), notes)
+            return HTTPStatus.OK, {'resolved': True}
+        
+        raise HttpError(HTTPStatus.NOT_FOUND, f"No route for {method} {url.path}")
+    
+    def _submit(self, body: Any) -> Tuple[HTTPStatus, Any]:
+        if isinstance(body, list):
+            if len(body) > self._max_batch_size:
+                raise HttpError(
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    f"Batch too large (maximum {self._max_batch_size} reports)"
+                )
+            results = []
+            for item in body:
+                try:
+                    results.append(self._submit_one(item))
+                except HttpError as error:
+                    results.append({'error': error.message})
+            return HTTPStatus.MULTI_STATUS, results
+        return HTTPStatus.CREATED, self._submit_one(body)
+    
+    def _submit_one(self, item: Any) -> Dict[str, Any]:
+        if not isinstance(item, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Report must be a JSON object")
+        try:
+            malfunction_type = MalfunctionType(item.get('malfunction_type'))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown malfunction type: {item.get('malfunction_type')}")
+        for field, required in (('station_id', True), ('description', True), ('reported_by', False)):
+            value = item.get(field)
+            if not isinstance(value, str) and (required or value is not None):
+                raise HttpError(HTTPStatus.BAD_REQUEST, f"{field} must be a string")
+        
+        report_id = self._call(
+            self._service.submit_malfunction_report,
+            item['station_id'],
+            malfunction_type,
+            item['description'],
+            item.get('reported_by')
+        )
+        response: Dict[str, Any] = {'report_id': str(report_id)}
+        if item.get('process'):
+            response.update(result_to_json(self._call(self._service.process_malfunction_report, report_id)))
+        return response
+    
+    @staticmethod
+    def _call(function, *args):
+        """Run a service call, turning business rule violations into 400s"""
+        try:
+            return function(*args)
+        except ValueError as error:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(error))
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+    lines = head.decode('latin-1').split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+    return method.upper(), target, version, headers
+
+
+def _wants_keep_alive(version: str, headers: Dict[str, str]) -> bool:
+    connection = headers.get('connection', '').lower()
+    if version == 'HTTP/1.0':
+        return connection == 'keep-alive'
+    return connection != 'close'
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> Any:
+    try:
+        length = int(headers.get('content-length', '0'))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length < 0:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    if length == 0:
+        return None
+    try:
+        return json.loads(await reader.readexactly(length))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Request body is not valid JSON")
+
+
+def _parse_uuid(value: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid ID: {value}")
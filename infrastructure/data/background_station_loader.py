@@ -0,0 +1,102 @@
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from domain.entities.charging_station import ChargingStation
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+
+
+@dataclass(frozen=True)
+class LoadProgress:
+    """Snapshot of a background load"""
+    loaded: int
+    expected: Optional[int]
+    done: bool
+    error: Optional[BaseException] = None
+    
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of expected stations loaded, None if the total is unknown"""
+        if self.done:
+            return 1.0
+        if not self.expected:
+            return None
+        return min(self.loaded / self.expected, 1.0)
+
+
+class BackgroundStationLoader:
+    """
+    Fills a station repository from the register in a background thread
+    
+    Stations are saved in batches while the CSV is still being parsed, so
+    callers can serve lookups and searches on the stations loaded so far
+    instead of waiting for the whole register. Missing coordinates are
+    filled from the postal code centroids batch by batch, before a batch
+    is saved, so loaded stations already carry their approximate position.
+    """
+    
+    def __init__(
+        self,
+        loader: LadesaeulenregisterLoader,
+        repository: IChargingStationRepository,
+        batch_size: int = 1000,
+        on_batch: Optional[Callable[[List[ChargingStation]], None]] = None,
+        expected_total: Optional[int] = None
+    ):
+        self._loader = loader
+        self._repository = repository
+        self._batch_size = batch_size
+        self._on_batch = on_batch
+        self._expected_total = expected_total
+        self._loaded = 0
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="station-warmup", daemon=True
+        )
+    
+    def start(self) -> "BackgroundStationLoader":
+        """Start loading; returns immediately"""
+        self._thread.start()
+        return self
+    
+    @property
+    def done(self) -> bool:
+        """Whether loading has finished, successfully or not"""
+        return self._done.is_set()
+    
+    def progress(self) -> LoadProgress:
+        """Get the current progress"""
+        return LoadProgress(
+            loaded=self._loaded,
+            expected=self._expected_total,
+            done=self.done,
+            error=self._error
+        )
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until loading has finished; returns False on timeout"""
+        return self._done.wait(timeout)
+    
+    def _run(self) -> None:
+        batch: List[ChargingStation] = []
+        try:
+            for station in self._loader.iter_berlin_stations():
+                batch.append(station)
+                if len(batch) >= self._batch_size:
+                    self._save(batch)
+                    batch = []
+            self._save(batch)
+            print(f"✅ Loaded {self._loaded} Berlin stations in the background")
+        except Exception as error:
+            self._error = error
+            print(f"❌ Background station loading failed: {error}")
+        finally:
+            self._done.set()
+    
+    def _save(self, batch: List[ChargingStation]) -> None:
+        self._loader.enrich_coordinates(batch)
+        self._repository.save_many(batch)
+        self._loaded += len(batch)
+        if self._on_batch is not None:
+            self._on_batch(batch)
@@ -0,0 +1,276 @@
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from infrastructure.data.records import station_to_record, report_to_record
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pyarrow is optional
+    pa = None
+
+STATION_COLUMNS = (
+    ('station_id', 'string'),
+    ('name', 'string'),
+    ('postal_code', 'string'),
+    ('address', 'string'),
+    ('latitude', 'float'),
+    ('longitude', 'float'),
+    ('coordinates_approximate', 'bool'),
+    ('status', 'string'),
+    ('created_at', 'timestamp'),
+    ('updated_at', 'timestamp'),
+)
+REPORT_COLUMNS = (
+    ('report_id', 'string'),
+    ('station_id', 'string'),
+    ('malfunction_type', 'string'),
+    ('description', 'string'),
+    ('reported_by', 'string'),
+    ('status', 'string'),
+    ('ticket_id', 'string'),
+    ('created_at', 'timestamp'),
+    ('updated_at', 'timestamp'),
+    ('resolved_at', 'timestamp'),
+    ('time_to_resolve_seconds', 'float'),
+)
+
+
+def _report_row(report: MalfunctionReport) -> Dict[str, Any]:
+    row = report_to_record(report)
+    duration = report.time_to_resolve
+    row['time_to_resolve_seconds'] = duration.total_seconds() if duration is not None else None
+    return row
+
+
+class ExportWriter(ABC):
+    """Streams chunks of rows into one export file"""
+    
+    extension: str = ""
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        self.path = path
+        self.columns = columns
+    
+    @abstractmethod
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """Append a chunk of rows"""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the file"""
+        pass
+
+
+class CsvExportWriter(ExportWriter):
+    """CSV with a header row; timestamps as ISO 8601, missing values empty"""
+    
+    extension = "csv"
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        super().__init__(path, columns)
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=[name for name, _ in columns])
+        self._writer.writeheader()
+    
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowExportWriter(ExportWriter):
+    """Base of the pyarrow writers: one record batch per chunk with a fixed schema"""
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        if pa is None:
+            raise ImportError(f"{type(self).__name__} requires pyarrow")
+        super().__init__(path, columns)
+        types = {
+            'string': pa.string(), 'float': pa.float64(), 'bool': pa.bool_(), 'timestamp': pa.timestamp('us'),
+        }
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    
+    def _batch(self, rows: List[Dict[str, Any]]) -> "pa.RecordBatch":
+        arrays = []
+        for name, kind in self.columns:
+            values = [row[name] for row in rows]
+            if kind == 'timestamp':
+                values = [datetime.fromisoformat(value) if value else None for value in values]
+            arrays.append(values)
+        return pa.RecordBatch.from_arrays(
+            [pa.array(values, type=column.type) for values, column in zip(arrays, self.schema)],
+            schema=self.schema
+        )
+
+
+class ParquetExportWriter(_ArrowExportWriter):
+    """Parquet file with one row group per chunk"""
+    
+    extension = "parquet"
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        super().__init__(path, columns)
+        self._writer = pa.parquet.ParquetWriter(str(path), self.schema)
+    
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.write_batch(self._batch(rows))
+    
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ArrowExportWriter(_ArrowExportWriter):
+    """Arrow IPC (Feather v2) file with one record batch per chunk"""
+    
+    extension = "arrow"
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        super().__init__(path, columns)
+        self._sink = pa.OSFile(str(path), 'wb')
+        self._writer = pa.ipc.new_file(self._sink, self.schema)
+    
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.write_batch(self._batch(rows))
+    
+    def close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+
+EXPORT_WRITERS = {
+    writer.extension: writer
+    for writer in (CsvExportWriter, ParquetExportWriter, ArrowExportWriter)
+}
+
+
+def available_formats() -> List[str]:
+    """Export formats whose dependencies are installed"""
+    return ["csv"] + (["parquet", "arrow"] if pa is not None else [])
+
+
+@dataclass
+class ExportResult:
+    """Outcome of exporting one kind of entity"""
+    kind: str
+    rows: int = 0
+    files: List[Path] = field(default_factory=list)
+    watermark: Optional[datetime] = None
+
+
+class BulkExporter:
+    """
+    Streams stations and reports into CSV and, with pyarrow, Parquet/Arrow files
+    
+    Entities are converted and written chunk_size at a time, so memory use
+    does not depend on the number of exported records. In incremental mode
+    only entities updated after the previous export's watermark (the latest
+    updated_at exported so far, kept in a small JSON state file) are written.
+    """
+    
+    def __init__(
+        self,
+        output_dir: Path,
+        formats: Sequence[str] = ("csv",),
+        chunk_size: int = 10_000,
+        state_file: Optional[Path] = None
+    ):
+        unavailable = set(formats) - set(available_formats())
+        if unavailable:
+            raise ValueError(
+                f"Export formats not available: {', '.join(sorted(unavailable))} "
+                f"(available: {', '.join(available_formats())})"
+            )
+        self.output_dir = Path(output_dir)
+        self.formats = tuple(formats)
+        self.chunk_size = chunk_size
+        self.state_file = Path(state_file) if state_file else self.output_dir / "export-state.json"
+    
+    def export_stations(self, stations: Iterable[ChargingStation], incremental: bool = False) -> ExportResult:
+        """Export stations with their current status"""
+        return self._export("stations", stations, station_to_record, STATION_COLUMNS, incremental)
+    
+    def export_reports(self, reports: Iterable[MalfunctionReport], incremental: bool = False) -> ExportResult:
+        """Export reports with timestamps, ticket and resolution data"""
+        return self._export("reports", reports, _report_row, REPORT_COLUMNS, incremental)
+    
+    def watermark(self, kind: str) -> Optional[datetime]:
+        """Latest updated_at exported so far for a kind ("stations" or "reports")"""
+        value = self._read_state().get(kind)
+        return datetime.fromisoformat(value) if value else None
+    
+    def _export(
+        self,
+        kind: str,
+        entities: Iterable,
+        to_row: Callable[[Any], Dict[str, Any]],
+        columns: Sequence[Tuple[str, str]],
+        incremental: bool
+    ) -> ExportResult:
+        since = self.watermark(kind) if incremental else None
+        if since is not None:
+            entities = (entity for entity in entities if entity.updated_at > since)
+        
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        suffix = "changes" if incremental else "full"
+        stem = f"{kind}-{suffix}-{datetime.now():%Y%m%dT%H%M%S%f}"
+        result = ExportResult(kind, watermark=since)
+        writers = [
+            EXPORT_WRITERS[name](self.output_dir / f"{stem}.{name}.tmp", columns)
+            for name in self.formats
+        ]
+        try:
+            for chunk in _chunks(entities, self.chunk_size):
+                rows = [to_row(entity) for entity in chunk]
+                for writer in writers:
+                    writer.write(rows)
+                result.rows += len(rows)
+                latest = max(entity.updated_at for entity in chunk)
+                if result.watermark is None or latest > result.watermark:
+                    result.watermark = latest
+        except BaseException:
+            for writer in writers:
+                writer.close()
+                writer.path.unlink(missing_ok=True)
+            raise
+        for writer in writers:
+            writer.close()
+        
+        # Files only appear complete, and the watermark only moves after they do
+        for writer in writers:
+            path = writer.path.with_suffix('')
+            os.replace(writer.path, path)
+            result.files.append(path)
+        if result.watermark is not None:
+            state = self._read_state()
+            state[kind] = result.watermark.isoformat()
+            temporary = self.state_file.with_name(self.state_file.name + ".tmp")
+            temporary.write_text(json.dumps(state, indent=2), encoding='utf-8')
+            os.replace(temporary, self.state_file)
+        return result
+    
+    def _read_state(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.state_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -1,16 +1,80 @@
-import csv
-from typing import List
+import hashlib
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence
 from pathlib import Path
 from domain.entities.charging_station import ChargingStation
 from domain.value_objects.station_id import StationId
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.data.register_parsers import RegisterParser, CsvReaderParser
+from infrastructure.data.postal_code_centroids import PostalCodeCentroids
+
+# Register station IDs embed the postal code, e.g. BERLIN-10178-1A2B3C4D5E
+STATION_ID_POSTAL_CODE = re.compile(r"-(\d{5})-")
+
+
+def normalized_location(postal_code: str, street: str, house_number: str) -> str:
+    """Location key that ignores case and spacing, e.g. "Hauptstr. 1" and "hauptstr.  1" match"""
+    return " ".join(f"{postal_code}|{street}|{house_number}".casefold().split())
+
+
+def stable_station_id(postal_code: str, street: str, house_number: str) -> str:
+    """
+    Derive a station ID from the station's location
+    
+    The same location always gets the same ID, independent of the row
+    order of the register, so reports stay attached across releases.
+    """
+    location = normalized_location(postal_code, street, house_number)
+    digest = hashlib.sha1(location.encode('utf-8')).hexdigest()[:10].upper()
+    return f"BERLIN-{postal_code}-{digest}"
+
+
+def postal_code_of_station_id(station_id: str) -> Optional[str]:
+    """Postal code embedded in a register station ID, None for other IDs"""
+    match = STATION_ID_POSTAL_CODE.search(station_id)
+    return match.group(1) if match else None
+
+
+def parse_coordinate(value: str) -> Optional[float]:
+    """Parse a register coordinate with a decimal comma, None if missing or invalid"""
+    if not value:
+        return None
+    try:
+        return float(value.replace(',', '.'))
+    except ValueError:
+        return None
+
+
+@dataclass
+class RefreshResult:
+    """Changes applied to a repository by a register refresh"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    retained: List[str] = field(default_factory=list)
+    unchanged: int = 0
 
 
 class LadesaeulenregisterLoader:
     """Loader for German Ladesaeulenregister CSV format"""
     
-    def __init__(self):
-        """Initialize loader and find the CSV file"""
-        self.csv_path = Path("infrastructure/datasets/Ladesaeulenregister.csv")
+    def __init__(
+        self,
+        csv_path: Optional[Path] = None,
+        parser: Optional[RegisterParser] = None,
+        centroids: Optional[PostalCodeCentroids] = None
+    ):
+        """
+        Initialize loader and find the CSV file
+        
+        Stations without coordinates get the centroid of their postal code
+        area; by default the bundled centroids are loaded on first use.
+        """
+        self.csv_path = Path(csv_path or "infrastructure/datasets/Ladesaeulenregister.csv")
+        self.parser = parser or CsvReaderParser()
+        self._centroids = centroids
         
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV not found at: {self.csv_path}")
@@ -19,90 +83,107 @@ class LadesaeulenregisterLoader:
     
     def load_berlin_stations(self) -> List[ChargingStation]:
         """Load all Berlin charging stations"""
-        stations = []
+        stations = list(self.iter_berlin_stations())
+        approximated = self.enrich_coordinates(stations)
+        print(f"✅ Loaded {len(stations)} Berlin stations ({approximated} with approximate coordinates)")
+        return stations
+    
+    def enrich_coordinates(self, stations: Sequence[ChargingStation]) -> int:
+        """Fill missing coordinates from the postal code centroids in one pass; returns the count"""
+        if self._centroids is None:
+            self._centroids = PostalCodeCentroids.load_default()
+        return self._centroids.enrich(stations)
+    
+    def iter_berlin_stations(self) -> Iterator[ChargingStation]:
+        """Stream Berlin charging stations in register order while parsing"""
         seen_locations = set()
-        station_counter = 1
+        loaded_at = datetime.now()
         
-        with open(self.csv_path, 'r', encoding='utf-8') as file:
-            # Detect delimiter
-            sample = file.read(2048)
-            file.seek(0)
-            delimiter = ';' if sample.count(';') > sample.count(',') else ','
-            
-            reader = csv.DictReader(file, delimiter=delimiter)
+        for row in self.parser.parse(self.csv_path):
+            try:
+                postal_code = row.postal_code
+                if not postal_code:
+                    continue
+                
+                # Build address
+                street = row.street
+                house_num = row.house_number
+                address = f"{street} {house_num}".strip() if street else None
+                
+                # Unique location check, on the same key the ID is derived from
+                location_key = normalized_location(postal_code, street, house_num)
+                if location_key in seen_locations:
+                    continue
+                seen_locations.add(location_key)
+                
+                # Create name
+                name = row.operator if row.operator else f"Station {postal_code}"
+                if len(name) > 100:
+                    name = name[:97] + "..."
+                
+                # Create station
+                station_id = stable_station_id(postal_code, street, house_num)
+                
+                station = ChargingStation(
+                    station_id=StationId.of(station_id),
+                    name=name,
+                    postal_code=postal_code,
+                    address=address,
+                    latitude=parse_coordinate(row.latitude),
+                    longitude=parse_coordinate(row.longitude),
+                    created_at=loaded_at
+                )
             
-            print(f"📋 CSV Columns found: {len(reader.fieldnames)} columns")
+            except Exception:
+                continue
             
-            for row in reader:
-                try:
-                    # Filter for Berlin
-                    ort = row.get('Ort', '').strip()
-                    bundesland = row.get('Bundesland', '').strip()
-                    
-                    if 'Berlin' not in ort and 'Berlin' not in bundesland:
-                        continue
-                    
-                    # Get postal code
-                    postal_code = row.get('Postleitzahl', '').strip()
-                    if not postal_code:
-                        continue
-                    
-                    # Build address
-                    street = row.get('Straße', row.get('Strasse', '')).strip()
-                    house_num = row.get('Hausnummer', '').strip()
-                    address = f"{street} {house_num}".strip() if street else None
-                    
-                    # Unique location check
-                    location_key = f"{postal_code}-{street}-{house_num}"
-                    if location_key in seen_locations:
-                        continue
-                    seen_locations.add(location_key)
-                    
-                    # Create name
-                    operator = row.get('Betreiber', '').strip()
-                    name = operator if operator else f"Station {postal_code}"
-                    if len(name) > 100:
-                        name = name[:97] + "..."
-                    
-                    # Get coordinates
-                    lat = row.get('Breitengrad', '')
-                    lon = row.get('Längengrad', '')
-                    
-                    latitude = None
-                    longitude = None
-                    
-                    if lat:
-                        try:
-                            latitude = float(lat.replace(',', '.'))
-                        except:
-                            pass
-                    
-                    if lon:
-                        try:
-                            longitude = float(lon.replace(',', '.'))
-                        except:
-                            pass
-                    
-                    # Create station
-                    station_id = f"BERLIN-{postal_code}-{station_counter:04d}"
-                    station_counter += 1
-                    
-                    station = ChargingStation(
-                        station_id=StationId(station_id),
-                        name=name,
-                        postal_code=postal_code,
-                        address=address,
-                        latitude=latitude,
-                        longitude=longitude
-                    )
-                    
-                    stations.append(station)
-                    
-                except Exception:
-                    continue
+            yield station
+    
+    def refresh(self, repository: IChargingStationRepository) -> RefreshResult:
+        """
+        Apply a new register release to an already loaded repository
         
-        print(f"✅ Loaded {len(stations)} Berlin stations")
-        return stations
+        Only additions, removals and changed register data are written.
+        Existing stations keep their status, and stations that are not
+        operational (open tickets) are retained even if they were dropped
+        from the register.
+        """
+        result = RefreshResult()
+        current = {station.station_id.value: station for station in repository.find_all()}
+        
+        for station in self.load_berlin_stations():
+            existing = current.pop(station.station_id.value, None)
+            if existing is None:
+                repository.save(station)
+                result.added.append(station.station_id.value)
+            elif (
+                existing.name != station.name
+                or existing.address != station.address
+                or existing.latitude != station.latitude
+                or existing.longitude != station.longitude
+                or existing.coordinates_approximate != station.coordinates_approximate
+            ):
+                existing.update_details(
+                    station.name, station.address, station.latitude, station.longitude,
+                    station.coordinates_approximate
+                )
+                repository.save(existing)
+                result.changed.append(station.station_id.value)
+            else:
+                result.unchanged += 1
+        
+        for station_id, station in current.items():
+            if station.is_operational:
+                repository.delete(station.station_id)
+                result.removed.append(station_id)
+            else:
+                result.retained.append(station_id)
+        
+        print(
+            f"🔄 Refreshed register: {len(result.added)} added, "
+            f"{len(result.removed)} removed, {len(result.changed)} changed"
+        )
+        return result
     
     def get_summary(self) -> dict:
         """Get summary statistics"""
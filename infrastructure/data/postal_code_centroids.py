@@ -0,0 +1,201 @@
+import csv
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from infrastructure.data.regional_statistics_loader import DATASETS_DIR
+from infrastructure.data.shapefile import read_shapefile, read_utm_zone
+from infrastructure.geometry.boundary_geometry import POSTAL_CODE_SHAPEFILE
+from infrastructure.geometry.projection import utm_to_wgs84
+
+POSTAL_CODE_CENTROIDS_CSV = DATASETS_DIR / "geodata_berlin_plz.csv"
+
+# Every five-digit postal code has a slot in the lookup arrays
+POSTAL_CODE_SLOTS = 100_000
+POSTAL_CODE_COLUMNS = ('PLZ', 'plz', 'postal_code')
+LATITUDE_COLUMNS = ('lat', 'latitude', 'Breitengrad')
+LONGITUDE_COLUMNS = ('lon', 'lng', 'longitude', 'Längengrad')
+WKT_RING = re.compile(r"\(([^()]+)\)")
+
+
+class PostalCodeCentroids:
+    """
+    Centroids of postal code areas as a precomputed lookup table
+    
+    Latitude and longitude are held in two dense arrays indexed by the
+    postal code as an integer (NaN for unknown areas), so the centroids of
+    a whole register are looked up with a single indexing operation.
+    """
+    
+    def __init__(self, centroids: Mapping[str, Tuple[float, float]]):
+        """
+        Args:
+            centroids: Latitude/longitude per five-digit postal code
+        """
+        self._latitude = np.full(POSTAL_CODE_SLOTS, np.nan)
+        self._longitude = np.full(POSTAL_CODE_SLOTS, np.nan)
+        for postal_code, (latitude, longitude) in centroids.items():
+            self._latitude[int(postal_code)] = latitude
+            self._longitude[int(postal_code)] = longitude
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self._latitude)))
+    
+    @classmethod
+    def from_csv(cls, path: Path = POSTAL_CODE_CENTROIDS_CSV) -> "PostalCodeCentroids":
+        """
+        Read centroids from a CSV with a PLZ column
+        
+        Positions come from latitude/longitude columns (decimal point or
+        comma) or, failing that, from a "geometry" column of WKT polygons.
+        Rows without a five-digit postal code or a readable position are
+        skipped.
+        """
+        csv.field_size_limit(sys.maxsize)
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            header = file.readline()
+            delimiter = ';' if header.count(';') > header.count(',') else ','
+            file.seek(0)
+            rows = list(csv.DictReader(file, delimiter=delimiter))
+        if not rows:
+            return cls({})
+        
+        columns = rows[0].keys()
+        postal_code = _first_present(POSTAL_CODE_COLUMNS, columns)
+        latitude = _first_present(LATITUDE_COLUMNS, columns)
+        longitude = _first_present(LONGITUDE_COLUMNS, columns)
+        if postal_code is None or ((latitude is None or longitude is None) and 'geometry' not in columns):
+            raise ValueError(f"No postal code and position columns in {path}")
+        
+        centroids = {}
+        for row in rows:
+            code = (row[postal_code] or '').strip()
+            if _postal_code_slot(code) < 0:
+                continue
+            if latitude is not None and longitude is not None:
+                position = _parse_coordinate(row[latitude]), _parse_coordinate(row[longitude])
+                if None not in position:
+                    centroids[code] = position
+            else:
+                try:
+                    centroid = polygon_centroid(_wkt_rings(row['geometry'] or ''))
+                except ValueError:
+                    continue
+                if centroid is not None:
+                    centroids[code] = (centroid[1], centroid[0])
+        return cls(centroids)
+    
+    @classmethod
+    def from_shapefile(cls, path: Path = POSTAL_CODE_SHAPEFILE, postal_code_field: str = "plz") -> "PostalCodeCentroids":
+        """Compute the centroids of the postal code polygons of a shapefile"""
+        rings: Dict[str, List[np.ndarray]] = {}
+        for record in read_shapefile(path):
+            rings.setdefault(record.attributes.get(postal_code_field, ""), []).extend(record.rings)
+        
+        zone = read_utm_zone(path)
+        centroids = {}
+        for postal_code, polygon in rings.items():
+            centroid = polygon_centroid(polygon)
+            if centroid is None or not postal_code:
+                continue
+            if zone is not None:
+                longitude, latitude = utm_to_wgs84(np.array([centroid[0]]), np.array([centroid[1]]), zone)
+                centroid = (float(longitude[0]), float(latitude[0]))
+            centroids[postal_code] = (centroid[1], centroid[0])
+        return cls(centroids)
+    
+    @classmethod
+    def load_default(cls) -> "PostalCodeCentroids":
+        """Centroids from the bundled CSV, else the PLZ shapefile; empty if neither is usable"""
+        for load in (cls.from_csv, cls.from_shapefile):
+            try:
+                centroids = load()
+            except (OSError, ValueError):
+                continue
+            if len(centroids):
+                return centroids
+        return cls({})
+    
+    def get(self, postal_code: str) -> Optional[Tuple[float, float]]:
+        """Latitude/longitude of a postal code area, None if unknown"""
+        latitude, longitude = self.lookup(np.array([_postal_code_slot(postal_code)]))
+        return None if np.isnan(latitude[0]) else (float(latitude[0]), float(longitude[0]))
+    
+    def lookup(self, postal_codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Latitudes and longitudes for an array of integer postal codes, NaN where unknown"""
+        postal_codes = np.asarray(postal_codes, dtype=np.int64)
+        valid = (postal_codes >= 0) & (postal_codes < POSTAL_CODE_SLOTS)
+        slots = np.where(valid, postal_codes, 0)
+        latitude = np.where(valid, self._latitude[slots], np.nan)
+        longitude = np.where(valid, self._longitude[slots], np.nan)
+        return latitude, longitude
+    
+    def enrich(self, stations: Sequence[ChargingStation]) -> int:
+        """
+        Give stations without coordinates the centroid of their postal code area
+        
+        Missing positions and centroids are found in one vectorized pass;
+        only the stations that get a position are touched afterwards.
+        Returns the number of stations filled.
+        """
+        count = len(stations)
+        missing = np.fromiter(
+            (station.latitude is None or station.longitude is None for station in stations),
+            dtype=np.bool_, count=count
+        )
+        postal_codes = np.fromiter(
+            (_postal_code_slot(station.postal_code) for station in stations),
+            dtype=np.int64, count=count
+        )
+        latitude, longitude = self.lookup(postal_codes)
+        rows = np.flatnonzero(missing & ~np.isnan(latitude))
+        for row in rows:
+            stations[row].approximate_location(float(latitude[row]), float(longitude[row]))
+        return len(rows)
+
+
+def polygon_centroid(rings: Sequence[np.ndarray]) -> Optional[Tuple[float, float]]:
+    """
+    Area-weighted x/y centroid of closed rings, None for a degenerate polygon
+    
+    Holes must run opposite to their outer ring, as in shapefiles and WKT,
+    so that their area is subtracted.
+    """
+    area = x_moment = y_moment = 0.0
+    for ring in rings:
+        x, y = ring[:, 0], ring[:, 1]
+        cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+        area += cross.sum() / 2
+        x_moment += ((x[:-1] + x[1:]) * cross).sum() / 6
+        y_moment += ((y[:-1] + y[1:]) * cross).sum() / 6
+    if area == 0:
+        return None
+    return float(x_moment / area), float(y_moment / area)
+
+
+def _wkt_rings(wkt: str) -> List[np.ndarray]:
+    """Rings of a WKT (multi)polygon as (n, 2) x/y arrays"""
+    return [
+        np.array(ring.replace(',', ' ').split(), dtype=np.float64).reshape(-1, 2)
+        for ring in WKT_RING.findall(wkt)
+    ]
+
+
+def _parse_coordinate(value: Optional[str]) -> Optional[float]:
+    """Parse a coordinate written with a decimal point or comma, None if unreadable"""
+    try:
+        coordinate = float((value or '').strip().replace(',', '.'))
+    except ValueError:
+        return None
+    return None if np.isnan(coordinate) else coordinate
+
+
+def _postal_code_slot(postal_code: str) -> int:
+    """Index of a postal code in the lookup arrays, -1 if it is not five digits"""
+    return int(postal_code) if len(postal_code) == 5 and postal_code.isdigit() else -1
+
+
+def _first_present(candidates: Sequence[str], columns) -> Optional[str]:
+    return next((column for column in candidates if column in columns), None)
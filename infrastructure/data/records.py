@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from domain.enums.station_status import StationStatus
+
+
+def report_to_record(report: MalfunctionReport) -> Dict[str, Any]:
+    """Convert a report into a JSON-serializable record"""
+    return {
+        'report_id': str(report.report_id),
+        'station_id': report.station_id.value,
+        'malfunction_type': report.malfunction_type.value,
+        'description': report.description.value,
+        'reported_by': report.reported_by,
+        'status': report.status.value,
+        'ticket_id': str(report.ticket_id) if report.ticket_id else None,
+        'created_at': report.created_at.isoformat(),
+        'updated_at': report.updated_at.isoformat(),
+        'resolved_at': report.resolved_at.isoformat() if report.resolved_at else None,
+    }
+
+
+def record_to_report(record: Dict[str, Any]) -> MalfunctionReport:
+    """Rebuild a report from a record made by report_to_record"""
+    return MalfunctionReport.restore(
+        report_id=UUID(record['report_id']),
+        station_id=StationId.of(record['station_id']),
+        malfunction_type=MalfunctionType(record['malfunction_type']),
+        description=ReportDescription(record['description']),
+        reported_by=record['reported_by'],
+        status=ReportStatus(record['status']),
+        ticket_id=UUID(record['ticket_id']) if record['ticket_id'] else None,
+        created_at=datetime.fromisoformat(record['created_at']),
+        updated_at=datetime.fromisoformat(record['updated_at']),
+        resolved_at=datetime.fromisoformat(record['resolved_at']) if record.get('resolved_at') else None
+    )
+
+
+def station_to_record(station: ChargingStation) -> Dict[str, Any]:
+    """Convert a station into a JSON-serializable record"""
+    return {
+        'station_id': station.station_id.value,
+        'name': station.name,
+        'postal_code': station.postal_code,
+        'address': station.address,
+        'latitude': station.latitude,
+        'longitude': station.longitude,
+        'coordinates_approximate': station.coordinates_approximate,
+        'status': station.status.value,
+        'created_at': station.created_at.isoformat(),
+        'updated_at': station.updated_at.isoformat(),
+    }
+
+
+def record_to_station(record: Dict[str, Any]) -> ChargingStation:
+    """Rebuild a station from a record made by station_to_record"""
+    return ChargingStation.restore(
+        station_id=StationId.of(record['station_id']),
+        name=record['name'],
+        postal_code=record['postal_code'],
+        address=record['address'],
+        latitude=record['latitude'],
+        longitude=record['longitude'],
+        status=StationStatus(record['status']),
+        created_at=datetime.fromisoformat(record['created_at']),
+        updated_at=datetime.fromisoformat(record['updated_at']),
+        coordinates_approximate=record.get('coordinates_approximate', False)
+    )
@@ -0,0 +1,115 @@
+import csv
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+DATASETS_DIR = Path("src/shared/infrastructure/datasets")
+
+POSTAL_CODE_COLUMNS = ('plz', 'postleitzahl')
+POPULATION_COLUMNS = ('einwohner', 'bevoelkerung', 'bevölkerung', 'population')
+TRAFFIC_COLUMNS = ('dtv', 'verkehrsaufkommen', 'kfz', 'anzahl', 'count')
+DISTRICT_COLUMNS = ('bezirk', 'district')
+
+# A dot followed by groups of exactly three digits separates thousands (12.345)
+THOUSANDS_DOTS = re.compile(r"^[+-]?\d{1,3}(\.\d{3})+$")
+# A qualifier may follow a column name, e.g. "Einwohner (2023)", but 'plz' never matches "PLZ_Name"
+HEADER_QUALIFIER = re.compile(r"[\s(\[]")
+
+
+def parse_number(value: str) -> Optional[float]:
+    """Parse numbers written either as 1234.5 or German style as 1.234,5 or 12.345"""
+    value = value.strip()
+    if not value:
+        return None
+    if ',' in value or THOUSANDS_DOTS.match(value):
+        value = value.replace('.', '').replace(',', '.')
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RegionalStatisticsLoader:
+    """Loader for per-postal-code population, traffic and district datasets"""
+    
+    def __init__(self, datasets_dir: Optional[Path] = None):
+        """Initialize loader with the bundled datasets directory"""
+        self.datasets_dir = Path(datasets_dir) if datasets_dir else DATASETS_DIR
+    
+    def load_population(self) -> Dict[str, float]:
+        """Load inhabitants per postal code from plz_einwohner.csv"""
+        return self._sum_per_postal_code(
+            self.datasets_dir / "plz_einwohner.csv", POPULATION_COLUMNS
+        )
+    
+    def load_traffic(self) -> Dict[str, float]:
+        """Load traffic volume per postal code from Verkehrsaufkommen.csv"""
+        return self._sum_per_postal_code(
+            self.datasets_dir / "Verkehrsaufkommen.csv", TRAFFIC_COLUMNS
+        )
+    
+    def load_districts(self) -> Dict[str, str]:
+        """Load the Bezirk of each postal code from geodata_berlin_dis.csv"""
+        path = self.datasets_dir / "geodata_berlin_dis.csv"
+        districts: Dict[str, str] = {}
+        for postal_code, district in _read_columns(path, POSTAL_CODE_COLUMNS, DISTRICT_COLUMNS):
+            if district:
+                districts.setdefault(postal_code, district)
+        return districts
+    
+    def _sum_per_postal_code(self, path: Path, value_columns: Iterable[str]) -> Dict[str, float]:
+        """Sum a numeric column per postal code"""
+        totals: Dict[str, float] = {}
+        for postal_code, raw_value in _read_columns(path, POSTAL_CODE_COLUMNS, value_columns):
+            value = parse_number(raw_value)
+            if value is not None:
+                totals[postal_code] = totals.get(postal_code, 0.0) + value
+        
+        return totals
+
+
+def _read_columns(
+    path: Path,
+    key_columns: Iterable[str],
+    value_columns: Iterable[str]
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (postal code, value) pairs from a CSV with auto-detected columns
+    
+    The datasets are optional: a missing or empty file, or one without a
+    recognisable key/value column, yields nothing.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        sample = file.read(2048)
+        file.seek(0)
+        delimiter = ';' if sample.count(';') > sample.count(',') else ','
+        
+        reader = csv.reader(file, delimiter=delimiter)
+        header = [column.strip().lower() for column in next(reader, [])]
+        key_index = _find_column(header, key_columns)
+        value_index = _find_column(header, value_columns)
+        if key_index is None or value_index is None:
+            return
+        
+        for row in reader:
+            if len(row) <= max(key_index, value_index):
+                continue
+            key = row[key_index].strip()
+            if key:
+                yield key, row[value_index].strip()
+
+
+def _find_column(header: list, candidates: Iterable[str]) -> Optional[int]:
+    """Index of the first column named like a candidate; exact names win over qualified ones"""
+    candidates = list(candidates)
+    for candidate in candidates:
+        if candidate in header:
+            return header.index(candidate)
+    for candidate in candidates:
+        for index, column in enumerate(header):
+            if column.startswith(candidate) and HEADER_QUALIFIER.match(column[len(candidate)]):
+                return index
+    return None
@@ -0,0 +1,243 @@
+import csv
+import warnings
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional
+    pd = None
+
+
+class RegisterRow(NamedTuple):
+    """The register fields the loader needs, stripped of whitespace"""
+    postal_code: str
+    street: str
+    house_number: str
+    operator: str
+    latitude: str
+    longitude: str
+
+
+# Register column for each RegisterRow field; alternatives are tried in order
+FIELD_COLUMNS = {
+    'postal_code': ('Postleitzahl',),
+    'street': ('Straße', 'Strasse'),
+    'house_number': ('Hausnummer',),
+    'operator': ('Betreiber',),
+    'latitude': ('Breitengrad',),
+    'longitude': ('Längengrad',),
+}
+FILTER_COLUMNS = ('Ort', 'Bundesland')
+OVERFLOW_COLUMN = '\0overflow'
+
+
+def detect_delimiter(path: Path) -> str:
+    """Guess whether the register is separated by semicolons or commas"""
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        sample = file.read(2048)
+    return ';' if sample.count(';') > sample.count(',') else ','
+
+
+def is_berlin(ort: str, bundesland: str) -> bool:
+    """Check whether a register row belongs to Berlin"""
+    return 'Berlin' in ort or 'Berlin' in bundesland
+
+
+def report_ragged_rows(count: int) -> None:
+    """Tell the user how many rows had the wrong number of fields"""
+    if count:
+        print(f"⚠️ Padded or truncated {count} rows with the wrong number of fields")
+
+
+def resolve_columns(header: List[str]) -> Dict[str, Optional[str]]:
+    """Map every RegisterRow field and filter column to a header column, if present"""
+    present = set(header)
+    columns = {
+        field: next((column for column in candidates if column in present), None)
+        for field, candidates in FIELD_COLUMNS.items()
+    }
+    for column in FILTER_COLUMNS:
+        columns[column] = column if column in present else None
+    return columns
+
+
+class RegisterParser(ABC):
+    """
+    Backend that reads the Berlin rows of a Ladesaeulenregister CSV
+    
+    All backends yield the same RegisterRows in file order; building
+    stations from them is left to the loader. Like csv.DictReader, every
+    backend pads rows with fewer fields than the header with empty fields
+    and ignores extra fields; such ragged rows are counted and reported.
+    """
+    
+    name: str = ""
+    
+    @abstractmethod
+    def parse(self, path: Path) -> Iterator[RegisterRow]:
+        """Yield the Berlin rows of the register"""
+        pass
+
+
+class CsvReaderParser(RegisterParser):
+    """
+    Default backend using csv.reader
+    
+    Column positions are resolved once from the header, so each row is a
+    plain list indexed directly instead of a dict.
+    """
+    
+    name = "csv"
+    
+    def parse(self, path: Path) -> Iterator[RegisterRow]:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            reader = csv.reader(file, delimiter=detect_delimiter(path))
+            header = next(reader, None)
+            if header is None:
+                return
+            print(f"📋 CSV Columns found: {len(header)} columns")
+            
+            # Like DictReader, the last of several equally named columns wins
+            header_positions = {column: index for index, column in enumerate(header)}
+            positions = {
+                field: header_positions[column]
+                for field, column in resolve_columns(header).items()
+                if column
+            }
+            # Missing columns read the empty cell appended to every row
+            ort, bundesland = (positions.get(column, -1) for column in FILTER_COLUMNS)
+            indexes = [positions.get(field, -1) for field in RegisterRow._fields]
+            
+            ragged = 0
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    ragged += 1
+                    row = row[:len(header)] + [''] * (len(header) - len(row))
+                row.append('')
+                if not is_berlin(row[ort].strip(), row[bundesland].strip()):
+                    continue
+                yield RegisterRow._make([row[index].strip() for index in indexes])
+            report_ragged_rows(ragged)
+
+
+class PandasRegisterParser(RegisterParser):
+    """
+    Columnar backend using pandas, optionally with the pyarrow CSV engine
+    
+    Stripping and the Berlin filter run vectorized over whole columns.
+    The default python engine is used because it pads short rows with
+    NaN instead of empty fields, so ragged rows can be told apart from
+    rows with empty cells. Requires pandas.
+    """
+    
+    name = "pandas"
+    
+    def __init__(self, engine: str = "python"):
+        if pd is None:
+            raise ImportError("PandasRegisterParser requires pandas")
+        self.engine = engine
+    
+    def parse(self, path: Path) -> Iterator[RegisterRow]:
+        delimiter = detect_delimiter(path)
+        header = pd.read_csv(path, sep=delimiter, nrows=0, encoding='utf-8-sig').columns.tolist()
+        print(f"📋 CSV Columns found: {len(header)} columns")
+        columns = resolve_columns(header)
+        
+        frame, too_long = self._read_frame(path, delimiter, header)
+        too_short = frame.isna().any(axis=1)
+        report_ragged_rows(too_long + int(too_short.sum()))
+        frame = frame.fillna('')
+        
+        def column(name: Optional[str]):
+            if name is None:
+                return pd.Series('', index=frame.index)
+            return frame[name].str.strip()
+        
+        berlin = (
+            column(columns['Ort']).str.contains('Berlin', regex=False)
+            | column(columns['Bundesland']).str.contains('Berlin', regex=False)
+        )
+        fields = [column(columns[field])[berlin].tolist() for field in RegisterRow._fields]
+        for values in zip(*fields):
+            yield RegisterRow._make(values)
+    
+    def _read_frame(self, path: Path, delimiter: str, header: List[str]) -> Tuple["pd.DataFrame", int]:
+        """
+        Read all columns as strings, truncating rows with extra fields
+        
+        Returns:
+            The frame, with NaN in the missing fields of short rows, and
+            the number of truncated rows
+        """
+        # One spare column catches the extra fields of long rows, so they
+        # can be counted; the engine drops whatever does not fit even there
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', pd.errors.ParserWarning)
+            frame = pd.read_csv(
+                path,
+                sep=delimiter,
+                encoding='utf-8-sig',
+                dtype=str,
+                keep_default_na=False,
+                names=header + [OVERFLOW_COLUMN],
+                header=None,
+                skiprows=1,
+                index_col=False,
+                engine=self.engine
+            )
+        too_long = int(frame.pop(OVERFLOW_COLUMN).notna().sum())
+        return frame, too_long
+
+
+class PyArrowRegisterParser(PandasRegisterParser):
+    """
+    Columnar backend using the multithreaded pyarrow CSV engine through pandas
+    
+    pyarrow can only skip ragged rows, so a register that has any is read
+    again with the python engine, which repairs them.
+    """
+    
+    name = "pyarrow"
+    
+    def __init__(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("PyArrowRegisterParser requires pyarrow") from None
+        super().__init__(engine="pyarrow")
+    
+    def _read_frame(self, path: Path, delimiter: str, header: List[str]) -> Tuple["pd.DataFrame", int]:
+        invalid_rows = []
+        
+        def skip(row) -> str:
+            invalid_rows.append(row)
+            return 'skip'
+        
+        frame = pd.read_csv(
+            path,
+            sep=delimiter,
+            encoding='utf-8-sig',
+            dtype=str,
+            keep_default_na=False,
+            on_bad_lines=skip,
+            engine=self.engine
+        )
+        if not invalid_rows:
+            return frame, 0
+        return PandasRegisterParser()._read_frame(path, delimiter, header)
+
+
+def available_parsers() -> Dict[str, Type[RegisterParser]]:
+    """Get the parser backends whose dependencies are installed, by name"""
+    parsers: Dict[str, Type[RegisterParser]] = {CsvReaderParser.name: CsvReaderParser}
+    for parser_class in (PandasRegisterParser, PyArrowRegisterParser):
+        try:
+            parser_class()
+        except ImportError:
+            continue
+        parsers[parser_class.name] = parser_class
+    return parsers
@@ -0,0 +1,112 @@
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+from domain.entities.charging_station import ChargingStation
+from infrastructure.data.records import station_to_record, record_to_station
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Two leading digits split Germany into its ~95 postal regions
+DEFAULT_PREFIX_LENGTH = 2
+
+
+@dataclass
+class PartitionManifest:
+    """Index of a partitioned register: station count per postal code prefix"""
+    prefix_length: int = DEFAULT_PREFIX_LENGTH
+    partitions: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def total_stations(self) -> int:
+        return sum(self.partitions.values())
+    
+    def partition_key(self, postal_code: str) -> str:
+        """Get the partition a postal code belongs to"""
+        return postal_code[:self.prefix_length]
+    
+    @classmethod
+    def load(cls, directory: Path) -> "PartitionManifest":
+        """Read the manifest of a partitioned register"""
+        with open(Path(directory) / MANIFEST_NAME, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported partition manifest version: {data.get('version')}")
+        return cls(prefix_length=data['prefix_length'], partitions=data['partitions'])
+    
+    def save(self, directory: Path) -> None:
+        """Write the manifest atomically"""
+        data = {
+            'version': MANIFEST_VERSION,
+            'prefix_length': self.prefix_length,
+            'partitions': dict(sorted(self.partitions.items())),
+        }
+        _write_atomic(Path(directory) / MANIFEST_NAME, json.dumps(data, indent=2).encode('utf-8'))
+
+
+def partition_path(directory: Path, key: str) -> Path:
+    """Get the file of one partition"""
+    return Path(directory) / f"stations-{key}.jsonl.gz"
+
+
+def read_partition(directory: Path, key: str) -> List[ChargingStation]:
+    """Load all stations of one partition"""
+    with gzip.open(partition_path(directory, key), 'rt', encoding='utf-8') as file:
+        return [record_to_station(json.loads(line)) for line in file]
+
+
+def iter_partitioned_register(directory: Path) -> Iterator[ChargingStation]:
+    """Stream the stations of a partitioned register, one partition in memory at a time"""
+    for key in sorted(PartitionManifest.load(directory).partitions):
+        yield from read_partition(directory, key)
+
+
+def write_partition(directory: Path, key: str, stations: Iterable[ChargingStation]) -> int:
+    """Replace one partition file, returning the number of stations written"""
+    lines = [json.dumps(station_to_record(station)) + "\n" for station in stations]
+    # mtime=0 keeps the file identical for identical content
+    _write_atomic(
+        partition_path(directory, key),
+        gzip.compress("".join(lines).encode('utf-8'), mtime=0)
+    )
+    return len(lines)
+
+
+def write_partitioned_register(
+    stations: Iterable[ChargingStation],
+    directory: Path,
+    prefix_length: int = DEFAULT_PREFIX_LENGTH
+) -> PartitionManifest:
+    """
+    Ingest stations into per-postal-code-prefix partition files
+    
+    Any existing partitioned register in the directory is replaced; the
+    manifest is written last so readers never see a half-written register.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = PartitionManifest(prefix_length=prefix_length)
+    
+    groups: Dict[str, List[ChargingStation]] = {}
+    for station in stations:
+        groups.setdefault(manifest.partition_key(station.postal_code), []).append(station)
+    
+    for key, group in groups.items():
+        manifest.partitions[key] = write_partition(directory, key, group)
+    
+    # Drop partitions of an earlier ingestion that no longer have stations
+    for path in directory.glob("stations-*.jsonl.gz"):
+        if path.name[len("stations-"):-len(".jsonl.gz")] not in groups:
+            path.unlink()
+    
+    manifest.save(directory)
+    return manifest
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, 'wb') as file:
+        file.write(content)
+    os.replace(temporary, path)
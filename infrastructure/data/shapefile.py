@@ -0,0 +1,129 @@
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+
+SHAPEFILE_CODE = 9994
+HEADER_LENGTH = 100
+
+
+class BoundingBox(NamedTuple):
+    """Axis-aligned bounds, x being longitude/easting and y latitude/northing"""
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+    
+    @property
+    def is_geographic(self) -> bool:
+        """Whether the bounds look like WGS84 longitude/latitude"""
+        return -180 <= self.min_x <= self.max_x <= 180 and -90 <= self.min_y <= self.max_y <= 90
+
+
+def read_bounding_box(path: Path) -> BoundingBox:
+    """
+    Read the bounding box from the header of an ESRI shapefile
+    
+    Raises:
+        ValueError: If the file is not a shapefile
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER_LENGTH)
+    if len(header) < HEADER_LENGTH or struct.unpack('>i', header[:4])[0] != SHAPEFILE_CODE:
+        raise ValueError(f"Not a shapefile: {path}")
+    return BoundingBox(*struct.unpack('<4d', header[36:68]))
+
+
+POLYGON_TYPES = {5, 15, 25}  # Polygon, PolygonZ, PolygonM
+
+
+class ShapeRecord(NamedTuple):
+    """One shapefile feature: its rings as (n, 2) x/y arrays and its attributes"""
+    rings: List[np.ndarray]
+    attributes: Dict[str, str]
+
+
+def read_shapefile(path: Path) -> List[ShapeRecord]:
+    """
+    Read the polygon features of a shapefile with their .dbf attributes
+    
+    Only the 2D coordinates of polygon shapes are read; null shapes are
+    skipped. Attributes are empty if there is no .dbf file.
+    
+    Raises:
+        ValueError: If the file is not a shapefile or contains other shape types
+    """
+    path = Path(path)
+    read_bounding_box(path)
+    data = path.read_bytes()
+    attributes = read_attributes(path.with_suffix('.dbf'))
+    
+    records = []
+    offset = HEADER_LENGTH
+    index = 0
+    while offset + 8 <= len(data):
+        content_length = struct.unpack('>i', data[offset + 4:offset + 8])[0] * 2
+        content = data[offset + 8:offset + 8 + content_length]
+        offset += 8 + content_length
+        shape_type = struct.unpack('<i', content[:4])[0]
+        if shape_type != 0:
+            if shape_type not in POLYGON_TYPES:
+                raise ValueError(f"Unsupported shape type {shape_type} in {path}")
+            records.append(ShapeRecord(
+                _read_rings(content),
+                attributes[index] if index < len(attributes) else {}
+            ))
+        index += 1
+    return records
+
+
+def read_attributes(path: Path) -> List[Dict[str, str]]:
+    """Read the records of a dBASE (.dbf) attribute table as strings"""
+    path = Path(path)
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    if len(data) < 32:
+        return []
+    
+    cpg = path.with_suffix('.cpg')
+    encoding = cpg.read_text().strip() if cpg.exists() and cpg.stat().st_size else 'utf-8'
+    count, header_length, record_length = struct.unpack('<IHH', data[4:12])
+    fields = []
+    for descriptor in range(32, header_length - 1, 32):
+        if data[descriptor] == 0x0D:
+            break
+        name = data[descriptor:descriptor + 11].split(b'\0', 1)[0].decode('ascii')
+        fields.append((name, data[descriptor + 16]))
+    
+    records = []
+    for number in range(count):
+        start = header_length + number * record_length
+        # The first byte of a record is its deletion flag
+        position = start + 1
+        record = {}
+        for name, length in fields:
+            record[name] = data[position:position + length].decode(encoding, errors='replace').strip()
+            position += length
+        records.append(record)
+    return records
+
+
+def read_utm_zone(path: Path) -> Optional[int]:
+    """UTM zone of a northern-hemisphere UTM shapefile from its .prj, None otherwise"""
+    try:
+        projection = Path(path).with_suffix('.prj').read_text(errors='replace')
+    except FileNotFoundError:
+        return None
+    match = re.search(r"UTM[ _]zone[ _](\d+)N", projection, re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+
+def _read_rings(content: bytes) -> List[np.ndarray]:
+    part_count, point_count = struct.unpack('<ii', content[36:44])
+    parts = list(struct.unpack(f'<{part_count}i', content[44:44 + 4 * part_count])) + [point_count]
+    start = 44 + 4 * part_count
+    points = np.frombuffer(content, dtype='<f8', count=2 * point_count, offset=start).reshape(-1, 2)
+    return [points[parts[i]:parts[i + 1]].astype(np.float64) for i in range(part_count)]
@@ -0,0 +1,134 @@
+import queue
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, Type
+from domain.events.domain_events import DomainEvent
+from domain.events.i_event_publisher import IEventPublisher
+
+Handler = Callable[[DomainEvent], None]
+BatchHandler = Callable[[List[DomainEvent]], None]
+
+
+class _BatchedSubscription:
+    """Worker thread delivering events to one handler in batches"""
+    
+    def __init__(self, event_type: Type[DomainEvent], handler: BatchHandler, max_batch: int, max_delay: float):
+        self.event_type = event_type
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue: "queue.Queue[Optional[DomainEvent]]" = queue.Queue()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, name="event-subscriber", daemon=True)
+        self._thread.start()
+    
+    def put(self, event: DomainEvent) -> None:
+        with self._idle:
+            self._pending += 1
+        self._queue.put(event)
+    
+    def flush(self, timeout: Optional[float]) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+    
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            event = self._queue.get()
+            if event is None:
+                break
+            batch = [event]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._max_batch:
+                try:
+                    event = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if event is None:
+                    closing = True
+                    break
+                batch.append(event)
+            _call(self._handler, batch)
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+
+
+class InProcessEventBus(IEventPublisher):
+    """
+    Publishes domain events to subscribers in the same process
+    
+    Synchronous subscribers run in the publishing thread, in subscription
+    order. Batched subscribers get lists of events on their own worker
+    thread, at most max_batch at a time and no later than max_delay seconds
+    after the first event of a batch, so expensive derived views can be
+    updated once per batch without slowing down the publisher. Handlers
+    subscribed to a base class receive all its subclasses; handler errors
+    are reported and never reach the publisher.
+    """
+    
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[Handler]] = {}
+        self._batched: List[_BatchedSubscription] = []
+        self._lock = threading.Lock()
+    
+    def subscribe(self, event_type: Type[DomainEvent], handler: Handler) -> None:
+        """Call handler synchronously for every published event of a type"""
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+    
+    def subscribe_batched(
+        self,
+        event_type: Type[DomainEvent],
+        handler: BatchHandler,
+        max_batch: int = 100,
+        max_delay: float = 0.5
+    ) -> None:
+        """Call handler on a background thread with batches of events of a type"""
+        subscription = _BatchedSubscription(event_type, handler, max_batch, max_delay)
+        with self._lock:
+            self._batched.append(subscription)
+    
+    def publish(self, event: DomainEvent) -> None:
+        """Publish one event"""
+        self.publish_all((event,))
+    
+    def publish_all(self, events: Iterable[DomainEvent]) -> None:
+        """Publish events in order"""
+        for event in events:
+            for event_type in type(event).__mro__:
+                for handler in self._handlers.get(event_type, ()):
+                    _call(handler, event)
+            for subscription in self._batched:
+                if isinstance(event, subscription.event_type):
+                    subscription.put(event)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until batched subscribers have handled all published events"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in list(self._batched):
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not subscription.flush(remaining):
+                return False
+        return True
+    
+    def close(self) -> None:
+        """Deliver outstanding batches and stop the worker threads"""
+        with self._lock:
+            subscriptions, self._batched = self._batched, []
+        for subscription in subscriptions:
+            subscription.close()
+
+
+def _call(handler: Callable, argument) -> None:
+    try:
+        handler(argument)
+    except Exception:
+        print(f"❌ Event handler {handler!r} failed:")
+        traceback.print_exc()
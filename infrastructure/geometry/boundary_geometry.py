@@ -0,0 +1,179 @@
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from infrastructure.data.regional_statistics_loader import DATASETS_DIR
+from infrastructure.data.shapefile import read_shapefile, read_utm_zone
+from infrastructure.geometry.projection import METERS_PER_DEGREE, local_meters, utm_to_wgs84
+from infrastructure.geometry.simplification import simplify_polygons
+
+DISTRICT_SHAPEFILE = DATASETS_DIR / "berlin_bezirke" / "bezirksgrenzen.shp"
+POSTAL_CODE_SHAPEFILE = DATASETS_DIR / "berlin_postleitzahlen" / "berlin_postleitzahlen.shp"
+CACHE_DIR = Path(".cache/geometry")
+CACHE_VERSION = 1
+
+# Maximum deviation per level of detail in meters; 0 keeps full resolution
+DEFAULT_TOLERANCES = (0.0, 5.0, 25.0, 100.0, 400.0)
+# Web Mercator resolution at zoom 0 on the equator
+METERS_PER_PIXEL_AT_ZOOM_0 = 156_543.03
+BERLIN_LATITUDE = 52.52
+COORDINATE_DECIMALS = 6
+
+
+class BoundaryGeometry:
+    """
+    Boundary polygons of a shapefile at several levels of detail, as GeoJSON
+    
+    The shapefile is read once; every level is simplified with shared
+    borders kept identical between neighbouring polygons, so overlays show
+    no gaps or overlaps. Results are cached on disk, keyed by the shapefile
+    and the tolerances, and later instances only read the cache.
+    """
+    
+    def __init__(
+        self,
+        shapefile: Path,
+        name_field: Optional[str] = None,
+        tolerances: Sequence[float] = DEFAULT_TOLERANCES,
+        cache_dir: Optional[Path] = CACHE_DIR
+    ):
+        """
+        Args:
+            shapefile: Polygon shapefile in WGS84 or UTM (detected from the .prj)
+            name_field: Attribute copied into each feature's "name" property
+            tolerances: Tolerance in meters per level, finest first
+            cache_dir: Directory of the disk cache, None to disable it
+        """
+        self.shapefile = Path(shapefile)
+        self.name_field = name_field
+        self.tolerances = tuple(sorted(tolerances))
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._levels: Optional[List[Dict[str, Any]]] = None
+    
+    def geojson(self, level: int) -> Dict[str, Any]:
+        """GeoJSON FeatureCollection of one level, 0 being full resolution"""
+        return self._load()[level]
+    
+    def for_zoom(self, zoom: float, latitude: float = BERLIN_LATITUDE) -> Dict[str, Any]:
+        """GeoJSON with the least detail that is still exact to a pixel at a web map zoom"""
+        return self.geojson(self.level_for_zoom(zoom, latitude))
+    
+    def level_for_zoom(self, zoom: float, latitude: float = BERLIN_LATITUDE) -> int:
+        """Coarsest level whose tolerance is at most one pixel at a web map zoom"""
+        meters_per_pixel = METERS_PER_PIXEL_AT_ZOOM_0 * math.cos(math.radians(latitude)) / 2 ** zoom
+        level = 0
+        for index, tolerance in enumerate(self.tolerances):
+            if tolerance <= meters_per_pixel:
+                level = index
+        return level
+    
+    def point_count(self, level: int) -> int:
+        """Number of coordinates in one level"""
+        return sum(
+            len(ring)
+            for feature in self.geojson(level)['features']
+            for polygon in _polygons(feature['geometry'])
+            for ring in polygon
+        )
+    
+    def _load(self) -> List[Dict[str, Any]]:
+        if self._levels is not None:
+            return self._levels
+        
+        cache = self._cache_path()
+        if cache is not None and cache.exists():
+            with open(cache, 'r', encoding='utf-8') as file:
+                self._levels = json.load(file)
+            return self._levels
+        
+        self._levels = self._build()
+        if cache is not None:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            temporary = cache.with_name(cache.name + ".tmp")
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(self._levels, file, separators=(',', ':'))
+            os.replace(temporary, cache)
+        return self._levels
+    
+    def _cache_path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        stat = self.shapefile.stat()
+        key = json.dumps([
+            CACHE_VERSION, str(self.shapefile.resolve()), stat.st_mtime_ns, stat.st_size,
+            self.name_field, self.tolerances,
+        ])
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{self.shapefile.stem}-{digest}.json"
+    
+    def _build(self) -> List[Dict[str, Any]]:
+        records = read_shapefile(self.shapefile)
+        to_metric, to_wgs84 = _projection(self.shapefile, records)
+        polygons = [[to_metric(ring) for ring in record.rings] for record in records]
+        names = [
+            record.attributes.get(self.name_field, "") if self.name_field else ""
+            for record in records
+        ]
+        
+        levels = []
+        for tolerance in self.tolerances:
+            simplified = simplify_polygons(polygons, tolerance)
+            levels.append({
+                'type': 'FeatureCollection',
+                'features': [
+                    _feature([to_wgs84(ring) for ring in rings], name)
+                    for rings, name in zip(simplified, names)
+                ],
+            })
+        return levels
+
+
+def _projection(shapefile: Path, records) -> Tuple[Callable, Callable]:
+    """Converters between the shapefile coordinates, meters and WGS84"""
+    zone = read_utm_zone(shapefile)
+    if zone is not None:
+        # UTM coordinates are in meters already
+        def utm(ring: np.ndarray) -> np.ndarray:
+            return np.column_stack(utm_to_wgs84(ring[:, 0], ring[:, 1], zone))
+        return lambda ring: np.round(ring, 2), utm
+    
+    latitudes = [ring[:, 1] for record in records for ring in record.rings]
+    reference = float(np.mean(np.concatenate(latitudes))) if latitudes else BERLIN_LATITUDE
+    scale = np.array([METERS_PER_DEGREE * math.cos(math.radians(reference)), METERS_PER_DEGREE])
+    return (
+        lambda ring: np.round(local_meters(ring[:, 0], ring[:, 1], reference), 2),
+        lambda ring: ring / scale,
+    )
+
+
+def _feature(rings: List[np.ndarray], name: str) -> Dict[str, Any]:
+    """GeoJSON feature, grouping holes with the outer ring before them"""
+    polygons: List[List[list]] = []
+    for ring in rings:
+        # Shapefile outer rings run clockwise and holes counterclockwise,
+        # GeoJSON wants the opposite
+        coordinates = np.round(ring[::-1], COORDINATE_DECIMALS).tolist()
+        if _signed_area(ring) <= 0 or not polygons:
+            polygons.append([coordinates])
+        else:
+            polygons[-1].append(coordinates)
+    
+    if len(polygons) == 1:
+        geometry = {'type': 'Polygon', 'coordinates': polygons[0]}
+    else:
+        geometry = {'type': 'MultiPolygon', 'coordinates': polygons}
+    return {'type': 'Feature', 'properties': {'name': name}, 'geometry': geometry}
+
+
+def _polygons(geometry: Dict[str, Any]) -> list:
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    return geometry['coordinates']
+
+
+def _signed_area(ring: np.ndarray) -> float:
+    x, y = ring[:, 0], ring[:, 1]
+    return float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])) / 2
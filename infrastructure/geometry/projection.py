@@ -0,0 +1,61 @@
+import math
+from typing import Tuple
+import numpy as np
+
+# GRS80 ellipsoid used by ETRS89; WGS84 differs by less than a millimetre here
+SEMI_MAJOR_AXIS = 6_378_137.0
+FLATTENING = 1 / 298.257222101
+SCALE_FACTOR = 0.9996
+FALSE_EASTING = 500_000.0
+METERS_PER_DEGREE = 111_195.0
+
+
+def utm_to_wgs84(easting: np.ndarray, northing: np.ndarray, zone: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert northern-hemisphere UTM coordinates to longitude/latitude in degrees
+    
+    Uses the inverse transverse Mercator series (Snyder), accurate to well
+    below a metre within a UTM zone.
+    """
+    e2 = FLATTENING * (2 - FLATTENING)
+    ep2 = e2 / (1 - e2)
+    e1 = (1 - math.sqrt(1 - e2)) / (1 + math.sqrt(1 - e2))
+    
+    x = np.asarray(easting, dtype=np.float64) - FALSE_EASTING
+    mu = np.asarray(northing, dtype=np.float64) / SCALE_FACTOR / (
+        SEMI_MAJOR_AXIS * (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256)
+    )
+    phi = (
+        mu
+        + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
+        + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
+        + (151 * e1 ** 3 / 96) * np.sin(6 * mu)
+        + (1097 * e1 ** 4 / 512) * np.sin(8 * mu)
+    )
+    
+    sin_phi, cos_phi, tan_phi = np.sin(phi), np.cos(phi), np.tan(phi)
+    c = ep2 * cos_phi ** 2
+    t = tan_phi ** 2
+    n = SEMI_MAJOR_AXIS / np.sqrt(1 - e2 * sin_phi ** 2)
+    r = SEMI_MAJOR_AXIS * (1 - e2) / (1 - e2 * sin_phi ** 2) ** 1.5
+    d = x / (n * SCALE_FACTOR)
+    
+    latitude = phi - (n * tan_phi / r) * (
+        d ** 2 / 2
+        - (5 + 3 * t + 10 * c - 4 * c ** 2 - 9 * ep2) * d ** 4 / 24
+        + (61 + 90 * t + 298 * c + 45 * t ** 2 - 252 * ep2 - 3 * c ** 2) * d ** 6 / 720
+    )
+    longitude = math.radians(zone * 6 - 183) + (
+        d
+        - (1 + 2 * t + c) * d ** 3 / 6
+        + (5 - 2 * c + 28 * t - 3 * c ** 2 + 8 * ep2 + 24 * t ** 2) * d ** 5 / 120
+    ) / cos_phi
+    return np.degrees(longitude), np.degrees(latitude)
+
+
+def local_meters(longitude: np.ndarray, latitude: np.ndarray, reference_latitude: float) -> np.ndarray:
+    """Project longitude/latitude to an (n, 2) array of meters (equirectangular)"""
+    return np.column_stack((
+        np.asarray(longitude) * METERS_PER_DEGREE * math.cos(math.radians(reference_latitude)),
+        np.asarray(latitude) * METERS_PER_DEGREE,
+    ))
@@ -0,0 +1,132 @@
+from typing import Dict, FrozenSet, List, Tuple
+import numpy as np
+
+Point = Tuple[float, float]
+
+
+def douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a polyline, keeping its first and last point
+    
+    Returns:
+        Boolean mask of the points to keep
+    """
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        inner = points[start + 1:end]
+        origin = points[start]
+        chord = points[end] - origin
+        length = chord @ chord
+        if length == 0:
+            # Closed arc: measure the distance to its start point
+            distances = np.hypot(*(inner - origin).T)
+        else:
+            along = np.clip((inner - origin) @ chord / length, 0, 1)
+            distances = np.hypot(*(inner - origin - along[:, None] * chord).T)
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return keep
+
+
+def simplify_polygons(
+    polygons: List[List[np.ndarray]],
+    tolerance: float
+) -> List[List[np.ndarray]]:
+    """
+    Simplify polygons with Douglas-Peucker without opening gaps between neighbours
+    
+    Rings are cut into arcs wherever the set of rings sharing a vertex
+    changes, so a border between two polygons becomes one arc. Each arc is
+    simplified once, in a canonical direction, and reused by every ring it
+    belongs to; shared borders therefore stay identical. Rings that collapse
+    are dropped, unless that would leave a polygon without any ring.
+    
+    Args:
+        polygons: Rings per polygon as closed (n, 2) arrays in metric coordinates
+        tolerance: Maximum deviation in the units of the coordinates
+    """
+    if tolerance <= 0:
+        return [[ring.copy() for ring in rings] for rings in polygons]
+    
+    # Vertices as hashable points, without the closing duplicate
+    rings: Dict[Tuple[int, int], List[Point]] = {}
+    owners: Dict[Point, set] = {}
+    for polygon_index, polygon in enumerate(polygons):
+        for ring_index, ring in enumerate(polygon):
+            points = [tuple(point) for point in ring.tolist()]
+            if len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            rings[polygon_index, ring_index] = points
+            for point in points:
+                owners.setdefault(point, set()).add((polygon_index, ring_index))
+    
+    frozen_owners: Dict[Point, FrozenSet] = {point: frozenset(ids) for point, ids in owners.items()}
+    arcs: Dict[Tuple[Point, ...], Tuple[Point, ...]] = {}
+    result: List[List[np.ndarray]] = []
+    for polygon_index, polygon in enumerate(polygons):
+        simplified_rings = []
+        for ring_index in range(len(polygon)):
+            points = rings[polygon_index, ring_index]
+            ring = _simplify_ring(points, frozen_owners, arcs, tolerance)
+            if len(set(ring)) >= 3:
+                simplified_rings.append(np.array(ring + [ring[0]], dtype=np.float64))
+        result.append(simplified_rings or [ring.copy() for ring in polygon])
+    return result
+
+
+def _simplify_ring(
+    points: List[Point],
+    owners: Dict[Point, FrozenSet],
+    arcs: Dict[Tuple[Point, ...], Tuple[Point, ...]],
+    tolerance: float
+) -> List[Point]:
+    count = len(points)
+    if count < 3:
+        return points
+    
+    breaks = [
+        index for index in range(count)
+        if owners[points[index]] != owners[points[index - 1]]
+        or owners[points[index]] != owners[points[(index + 1) % count]]
+    ]
+    if not breaks:
+        # A ring without junctions is one closed arc from its smallest vertex
+        start = points.index(min(points))
+        rotated = points[start:] + points[:start]
+        arc = tuple(rotated + [rotated[0]])
+        return list(_simplify_arc(arc, arcs, tolerance)[:-1])
+    
+    ring: List[Point] = []
+    for position, start in enumerate(breaks):
+        end = breaks[(position + 1) % len(breaks)]
+        if end > start:
+            arc = tuple(points[start:end + 1])
+        else:
+            arc = tuple(points[start:] + points[:end + 1])
+        ring.extend(_simplify_arc(arc, arcs, tolerance)[:-1])
+    return ring
+
+
+def _simplify_arc(
+    arc: Tuple[Point, ...],
+    arcs: Dict[Tuple[Point, ...], Tuple[Point, ...]],
+    tolerance: float
+) -> Tuple[Point, ...]:
+    """Simplify an arc in its canonical direction so both neighbours agree"""
+    reverse = arc[::-1]
+    canonical = min(arc, reverse)
+    simplified = arcs.get(canonical)
+    if simplified is None:
+        points = np.array(canonical, dtype=np.float64)
+        simplified = tuple(canonical[index] for index in np.flatnonzero(douglas_peucker(points, tolerance)))
+        arcs[canonical] = simplified
+    return simplified if canonical is arc else simplified[::-1]
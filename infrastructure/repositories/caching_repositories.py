@@ -0,0 +1,252 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Generic, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters for sizing a cache"""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LruTtlCache(Generic[T]):
+    """
+    Bounded cache evicting least recently used entries and entries older than ttl
+    
+    A write version guards read-through fills: a value read from the backend
+    is only cached if no invalidation happened while it was being read.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached entries
+            ttl: Seconds an entry stays valid, None for no expiry
+            clock: Time source in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("Cache needs room for at least one entry")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[T, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter changed by every invalidation"""
+        return self._version
+    
+    def get(self, key: Hashable) -> Optional[T]:
+        """Get a cached value, None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at >= self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
+    
+    def put(self, key: Hashable, value: T, if_version: Optional[int] = None) -> None:
+        """Cache a value, unless the cache was invalidated since if_version"""
+        with self._lock:
+            if if_version is not None and if_version != self._version:
+                return
+            expires_at = self._clock() + self.ttl if self.ttl is not None else float('inf')
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry"""
+        with self._lock:
+            self._version += 1
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+    
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters and the current size"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries)
+            )
+
+
+class CachingChargingStationRepository(IChargingStationRepository):
+    """
+    Read-through cache in front of another station repository
+    
+    find_by_id and exists are served from an LRU/TTL cache; writes go to
+    the wrapped repository and invalidate the cached entry. Collection
+    queries and repository-specific methods are passed through.
+    """
+    
+    def __init__(self, inner: IChargingStationRepository, cache: Optional[LruTtlCache] = None):
+        self._inner = inner
+        self.cache: LruTtlCache[ChargingStation] = cache or LruTtlCache()
+    
+    def save(self, station: ChargingStation) -> None:
+        """Save or update a charging station"""
+        self._inner.save(station)
+        self.cache.invalidate(station.station_id.value)
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """Save or update several stations"""
+        stations = list(stations)
+        self._inner.save_many(stations)
+        for station in stations:
+            self.cache.invalidate(station.station_id.value)
+    
+    def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
+        """Find a station by its ID"""
+        station = self.cache.get(station_id.value)
+        if station is None:
+            version = self.cache.version
+            station = self._inner.find_by_id(station_id)
+            if station is not None:
+                self.cache.put(station_id.value, station, if_version=version)
+        return station
+    
+    def find_by_postal_code(self, postal_code: str) -> List[ChargingStation]:
+        """Find all stations in a postal code area"""
+        return self._inner.find_by_postal_code(postal_code)
+    
+    def find_by_operator(self, operator: str) -> List[ChargingStation]:
+        """Find all stations of an operator"""
+        return self._inner.find_by_operator(operator)
+    
+    def find_all(self) -> Sequence[ChargingStation]:
+        """Get all charging stations"""
+        return self._inner.find_all()
+    
+    def exists(self, station_id: StationId) -> bool:
+        """Check if a station exists"""
+        return self.find_by_id(station_id) is not None
+    
+    def delete(self, station_id: StationId) -> None:
+        """Remove a station; unknown IDs are ignored"""
+        self._inner.delete(station_id)
+        self.cache.invalidate(station_id.value)
+    
+    def __getattr__(self, name: str) -> Any:
+        # e.g. health_percentage() or status_version of the wrapped repository
+        return getattr(self._inner, name)
+
+
+class CachingMalfunctionReportRepository(IMalfunctionReportRepository):
+    """
+    Read-through cache in front of another report repository
+    
+    find_by_id is served from an LRU/TTL cache; writes go to the wrapped
+    repository and invalidate the cached entry. All other queries are
+    passed through.
+    """
+    
+    def __init__(self, inner: IMalfunctionReportRepository, cache: Optional[LruTtlCache] = None):
+        self._inner = inner
+        self.cache: LruTtlCache[MalfunctionReport] = cache or LruTtlCache()
+    
+    def save(self, report: MalfunctionReport) -> None:
+        """Save or update a malfunction report"""
+        self._inner.save(report)
+        self.cache.invalidate(report.report_id)
+    
+    def save_many(self, reports: Iterable[MalfunctionReport]) -> None:
+        """Save or update several reports"""
+        reports = list(reports)
+        self._inner.save_many(reports)
+        for report in reports:
+            self.cache.invalidate(report.report_id)
+    
+    def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Find a report by its ID"""
+        report = self.cache.get(report_id)
+        if report is None:
+            version = self.cache.version
+            report = self._inner.find_by_id(report_id)
+            if report is not None:
+                self.cache.put(report_id, report, if_version=version)
+        return report
+    
+    def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        """Find all reports for a specific station"""
+        return self._inner.find_by_station(station_id)
+    
+    def find_by_stations(self, station_ids: Iterable[StationId]) -> List[MalfunctionReport]:
+        """Find all reports for any of several stations"""
+        return self._inner.find_by_stations(station_ids)
+    
+    def find_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        return self._inner.find_by_ticket(ticket_id)
+    
+    def find_all(self) -> Sequence[MalfunctionReport]:
+        """Get all reports"""
+        return self._inner.find_all()
+    
+    def delete(self, report_id: UUID) -> None:
+        """Remove a report; unknown IDs are ignored"""
+        self._inner.delete(report_id)
+        self.cache.invalidate(report_id)
+    
+    def find_created_between(self, start: datetime, end: datetime) -> List[MalfunctionReport]:
+        """Find reports created in [start, end), oldest first"""
+        return self._inner.find_created_between(start, end)
+    
+    def count_created_per_bucket(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta
+    ) -> List[Tuple[datetime, int]]:
+        """Count reports created per time bucket in [start, end)"""
+        return self._inner.count_created_per_bucket(start, end, bucket)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
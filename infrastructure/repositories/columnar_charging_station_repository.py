@@ -0,0 +1,412 @@
+import threading
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Iterator, Sequence
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.repositories.snapshot import SnapshotCache
+from infrastructure.data.postal_code_centroids import PostalCodeCentroids
+
+# Status is stored as a small-int code: its position in StationStatus
+STATUSES = list(StationStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+OPERATIONAL_CODES = [
+    STATUS_CODES[StationStatus.AVAILABLE],
+    STATUS_CODES[StationStatus.IN_USE],
+]
+
+# Marks a missing entry in the string table columns
+NO_STRING = -1
+
+
+def is_encodable_postal_code(postal_code: str) -> bool:
+    """Check whether a postal code has the five digits the integer column needs"""
+    return len(postal_code) == 5 and postal_code.isdigit()
+
+
+def postal_code_to_int(postal_code: str) -> int:
+    """Encode a German postal code as an integer"""
+    if not is_encodable_postal_code(postal_code):
+        raise ValueError(f"Postal code must be 5 digits: {postal_code}")
+    return int(postal_code)
+
+
+def postal_code_from_int(code: int) -> str:
+    """Decode an integer postal code, restoring leading zeros"""
+    return f"{code:05d}"
+
+
+class ChargingStationView(ChargingStation):
+    """
+    Lightweight ChargingStation backed by one row of a columnar repository
+    
+    Reads and state transitions go straight to the repository columns, so
+    the domain rules of ChargingStation apply unchanged. Writes take the
+    repository lock, so they cannot land in a column that a concurrent
+    save is replacing with a grown copy.
+    """
+    
+    __slots__ = ('_columns', '_row')
+    
+    def __init__(self, columns: "ColumnarChargingStationRepository", row: int):
+        self._columns = columns
+        self._row = row
+        self._pending_events = None
+    
+    @property
+    def _station_id(self) -> StationId:
+        return self._columns._ids[self._row]
+    
+    @property
+    def _name(self) -> str:
+        return self._columns._strings[self._columns._name[self._row]]
+    
+    @_name.setter
+    def _name(self, name: str) -> None:
+        with self._columns._lock:
+            self._columns._name[self._row] = self._columns._intern(name)
+    
+    @property
+    def _postal_code(self) -> str:
+        return postal_code_from_int(int(self._columns._postal_code[self._row]))
+    
+    @property
+    def _address(self) -> Optional[str]:
+        code = self._columns._address[self._row]
+        return None if code == NO_STRING else self._columns._strings[code]
+    
+    @_address.setter
+    def _address(self, address: Optional[str]) -> None:
+        with self._columns._lock:
+            self._columns._address[self._row] = self._columns._intern(address)
+    
+    @property
+    def _latitude(self) -> Optional[float]:
+        value = self._columns._latitude[self._row]
+        return None if np.isnan(value) else float(value)
+    
+    @_latitude.setter
+    def _latitude(self, latitude: Optional[float]) -> None:
+        with self._columns._lock:
+            self._columns._latitude[self._row] = np.nan if latitude is None else latitude
+    
+    @property
+    def _longitude(self) -> Optional[float]:
+        value = self._columns._longitude[self._row]
+        return None if np.isnan(value) else float(value)
+    
+    @_longitude.setter
+    def _longitude(self, longitude: Optional[float]) -> None:
+        with self._columns._lock:
+            self._columns._longitude[self._row] = np.nan if longitude is None else longitude
+    
+    @property
+    def _coordinates_approximate(self) -> bool:
+        return bool(self._columns._approximate[self._row])
+    
+    @_coordinates_approximate.setter
+    def _coordinates_approximate(self, approximate: bool) -> None:
+        with self._columns._lock:
+            self._columns._approximate[self._row] = approximate
+    
+    @property
+    def _status(self) -> StationStatus:
+        return STATUSES[self._columns._status[self._row]]
+    
+    @_status.setter
+    def _status(self, status: StationStatus) -> None:
+        with self._columns._lock:
+            self._columns._status[self._row] = STATUS_CODES[status]
+            self._columns._status_version += 1
+    
+    @property
+    def _created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._columns._created_at[self._row])
+    
+    @property
+    def _updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self._columns._updated_at[self._row])
+    
+    @_updated_at.setter
+    def _updated_at(self, updated_at: datetime) -> None:
+        with self._columns._lock:
+            self._columns._updated_at[self._row] = updated_at.timestamp()
+
+
+class ColumnarChargingStationRepository(IChargingStationRepository):
+    """
+    Array-backed implementation of charging station repository
+    
+    Stations are stored as NumPy columns instead of one object each:
+    coordinates as floats (NaN when unknown), status as int8 codes, postal
+    codes as integers and names/addresses as indexes into an interned
+    string table. Lookups return ChargingStationView rows, and whole-network
+    queries run vectorized over the columns. Deleted rows are only flagged
+    as dead so that row numbers held by views stay valid. Writes hold the
+    lock; reads do not, and see a new row once the size is bumped after
+    all of its values are written.
+    """
+    
+    _COLUMNS = {
+        '_latitude': (np.float64, np.nan),
+        '_longitude': (np.float64, np.nan),
+        '_approximate': (np.bool_, False),
+        '_status': (np.int8, 0),
+        '_postal_code': (np.int32, 0),
+        '_name': (np.int32, NO_STRING),
+        '_address': (np.int32, NO_STRING),
+        '_created_at': (np.float64, 0.0),
+        '_updated_at': (np.float64, 0.0),
+        '_alive': (np.bool_, False),
+    }
+    # Row view handed out by lookups; subclasses may refine it
+    _view_class = ChargingStationView
+    
+    def __init__(self, initial_capacity: int = 1024):
+        """Initialize empty storage"""
+        self._ids: List[StationId] = []
+        self._rows: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        self._size = 0
+        self._deleted = 0
+        self._status_version = 0
+        self._capacity = max(initial_capacity, 1)
+        for column, (dtype, fill) in self._COLUMNS.items():
+            setattr(self, column, np.full(self._capacity, fill, dtype=dtype))
+        self._lock = threading.RLock()
+        self._snapshots = SnapshotCache(self._all_views, self._lock)
+    
+    def save(self, station: ChargingStation) -> None:
+        """Save or update a charging station"""
+        if isinstance(station, ChargingStationView) and station._columns is self:
+            # Views write through to the columns already
+            return
+        
+        with self._lock:
+            self._write(station)
+    
+    def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
+        """Find a station by its ID"""
+        row = self._rows.get(station_id.value)
+        return None if row is None else self._view_class(self, row)
+    
+    def find_by_postal_code(self, postal_code: str) -> List[ChargingStation]:
+        """Find all stations in a postal code area; none for codes that are not five digits"""
+        if not is_encodable_postal_code(postal_code):
+            return []
+        size = self._size
+        mask = self._postal_code[:size] == postal_code_to_int(postal_code)
+        return self._views(np.flatnonzero(mask & self._alive[:size]))
+    
+    def find_by_operator(self, operator: str) -> List[ChargingStation]:
+        """Find all stations of an operator with one comparison over the name codes"""
+        code = self._string_code(operator)
+        if code is None:
+            return []
+        size = self._size
+        mask = self._name[:size] == code
+        return self._views(np.flatnonzero(mask & self._alive[:size]))
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """
+        Save or update several stations under one lock
+        
+        Stations whose postal code is not five digits cannot be stored; they
+        are skipped and counted instead of aborting the rest of the batch.
+        """
+        skipped = 0
+        with self._lock:
+            for station in stations:
+                if isinstance(station, ChargingStationView) and station._columns is self:
+                    continue
+                if not is_encodable_postal_code(station.postal_code):
+                    skipped += 1
+                    continue
+                self._write(station)
+        if skipped:
+            print(f"⚠️ Skipped {skipped} stations with malformed postal codes")
+    
+    def find_all(self) -> Sequence[ChargingStation]:
+        """Get a read-only snapshot of all charging stations"""
+        return self._snapshots.get()
+    
+    def exists(self, station_id: StationId) -> bool:
+        """Check if a station exists"""
+        return station_id.value in self._rows
+    
+    def delete(self, station_id: StationId) -> None:
+        """Remove a station; unknown IDs are ignored"""
+        with self._lock:
+            row = self._rows.pop(station_id.value, None)
+            if row is None:
+                return
+            self._alive[row] = False
+            self._deleted += 1
+            self._status_version += 1
+            self._snapshots.invalidate()
+    
+    def count(self) -> int:
+        """Number of stored stations"""
+        return self._size - self._deleted
+    
+    @property
+    def status_version(self) -> int:
+        """Counter that changes whenever a station is added, removed or changes status"""
+        return self._status_version
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get read-only views of the columns for all stored stations
+        
+        Keys are 'postal_code' (int), 'status' (int8 code, see STATUSES),
+        'latitude' and 'longitude' (NaN when unknown) and 'approximate'
+        (coordinates estimated from the postal code area).
+        """
+        size = self._size
+        views = {
+            'postal_code': self._live(self._postal_code, size),
+            'status': self._live(self._status, size),
+            'latitude': self._live(self._latitude, size),
+            'longitude': self._live(self._longitude, size),
+            'approximate': self._live(self._approximate, size),
+        }
+        for view in views.values():
+            view.flags.writeable = False
+        return views
+    
+    def find_by_status_in_postal_codes(
+        self,
+        status: StationStatus,
+        postal_codes: Iterable[str]
+    ) -> List[ChargingStation]:
+        """Find all stations with a status in any of the given postal codes"""
+        codes = np.fromiter(
+            (postal_code_to_int(code) for code in postal_codes if is_encodable_postal_code(code)),
+            dtype=np.int32
+        )
+        size = self._size
+        mask = (self._status[:size] == STATUS_CODES[status]) & np.isin(
+            self._postal_code[:size], codes
+        )
+        return self._views(np.flatnonzero(mask & self._alive[:size]))
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        """Count stations per status"""
+        counts = np.bincount(self._live(self._status, self._size), minlength=len(STATUSES))
+        return {status: int(counts[code]) for code, status in enumerate(STATUSES)}
+    
+    def health_percentage(self) -> float:
+        """Share of operational stations in percent"""
+        status = self._live(self._status, self._size)
+        if len(status) == 0:
+            return 100.0
+        operational = np.isin(status, OPERATIONAL_CODES)
+        return float(operational.mean() * 100)
+    
+    def coordinates(self, operational_only: bool = False) -> np.ndarray:
+        """
+        Get station coordinates as an (n, 2) array of latitude/longitude
+        
+        Stations without coordinates are left out.
+        """
+        size = self._size
+        latitude = self._live(self._latitude, size)
+        longitude = self._live(self._longitude, size)
+        mask = ~np.isnan(latitude) & ~np.isnan(longitude)
+        if operational_only:
+            mask &= np.isin(self._live(self._status, size), OPERATIONAL_CODES)
+        return np.column_stack((latitude[mask], longitude[mask]))
+    
+    def fill_missing_coordinates(self, centroids: PostalCodeCentroids) -> int:
+        """
+        Give stations without coordinates the centroid of their postal code area
+        
+        Runs as one vectorized pass over the columns; the filled stations
+        are flagged as approximate. Returns the number of stations filled.
+        """
+        with self._lock:
+            size = self._size
+            missing = np.isnan(self._latitude[:size]) | np.isnan(self._longitude[:size])
+            rows = np.flatnonzero(missing & self._alive[:size])
+            latitude, longitude = centroids.lookup(self._postal_code[rows])
+            known = ~np.isnan(latitude)
+            rows = rows[known]
+            self._latitude[rows] = latitude[known]
+            self._longitude[rows] = longitude[known]
+            self._approximate[rows] = True
+            if len(rows):
+                self._status_version += 1
+            return len(rows)
+    
+    def _write(self, station: ChargingStation) -> None:
+        # Encoded first, so a malformed postal code leaves the row untouched
+        postal_code = postal_code_to_int(station.postal_code)
+        row = self._rows.get(station.station_id.value)
+        added = row is None
+        if added:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._size
+        
+        self._latitude[row] = np.nan if station.latitude is None else station.latitude
+        self._longitude[row] = np.nan if station.longitude is None else station.longitude
+        self._approximate[row] = station.coordinates_approximate
+        self._status[row] = STATUS_CODES[station.status]
+        self._postal_code[row] = postal_code
+        self._name[row] = self._intern(station.name)
+        self._address[row] = self._intern(station.address)
+        self._created_at[row] = station.created_at.timestamp()
+        self._updated_at[row] = station.updated_at.timestamp()
+        self._alive[row] = True
+        if added:
+            self._ids.append(station.station_id)
+            self._rows[station.station_id.value] = row
+            # Lock-free readers see the row only once all its values are written
+            self._size = row + 1
+            self._snapshots.invalidate()
+        self._status_version += 1
+    
+    def _views(self, rows: np.ndarray) -> List[ChargingStation]:
+        return [self._view_class(self, int(row)) for row in rows]
+    
+    def _all_views(self) -> Iterator[ChargingStation]:
+        size = self._size
+        if self._deleted == 0:
+            return (self._view_class(self, row) for row in range(size))
+        return iter(self._views(np.flatnonzero(self._alive[:size])))
+    
+    def _live(self, column: np.ndarray, size: int) -> np.ndarray:
+        """
+        Values of a column for the first size rows that have not been deleted
+        
+        Readers take the size once per query, so all columns they slice
+        cover the same rows while a writer appends.
+        """
+        if self._deleted == 0:
+            return column[:size]
+        return column[:size][self._alive[:size]]
+    
+    def _string_code(self, value: str) -> Optional[int]:
+        return self._string_codes.get(value)
+    
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._string_codes[value] = code
+        return code
+    
+    def _grow(self) -> None:
+        # Callers hold the lock, which view setters take too
+        capacity = self._capacity * 2
+        for column, (dtype, fill) in self._COLUMNS.items():
+            grown = np.full(capacity, fill, dtype=dtype)
+            grown[:self._capacity] = getattr(self, column)
+            setattr(self, column, grown)
+        self._capacity = capacity
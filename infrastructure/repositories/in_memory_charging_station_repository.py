@@ -1,7 +1,9 @@
-from typing import Optional, List, Dict
+import threading
+from typing import Optional, List, Dict, Iterable, Sequence
 from domain.entities.charging_station import ChargingStation
 from domain.value_objects.station_id import StationId
 from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.repositories.snapshot import SnapshotCache
 
 
 class InMemoryChargingStationRepository(IChargingStationRepository):
@@ -10,11 +12,29 @@ class InMemoryChargingStationRepository(IChargingStationRepository):
     def __init__(self):
         """Initialize empty storage"""
         self._stations: Dict[str, ChargingStation] = {}
+        self._lock = threading.RLock()
+        self._snapshots = SnapshotCache(self._stations.values, self._lock)
     
     def save(self, station: ChargingStation) -> None:
         """Save or update a charging station"""
         key = station.station_id.value
-        self._stations[key] = station
+        with self._lock:
+            # Re-saving the stored instance leaves the snapshot valid
+            if self._stations.get(key) is not station:
+                self._stations[key] = station
+                self._snapshots.invalidate()
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """Save or update several stations under one lock"""
+        with self._lock:
+            changed = False
+            for station in stations:
+                key = station.station_id.value
+                if self._stations.get(key) is not station:
+                    self._stations[key] = station
+                    changed = True
+            if changed:
+                self._snapshots.invalidate()
     
     def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
         """Find a station by its ID"""
@@ -23,14 +43,24 @@ class InMemoryChargingStationRepository(IChargingStationRepository):
     def find_by_postal_code(self, postal_code: str) -> List[ChargingStation]:
         """Find all stations in a postal code area"""
         return [
-            station for station in self._stations.values()
+            station for station in self._snapshots.get()
             if station.postal_code == postal_code
         ]
     
-    def find_all(self) -> List[ChargingStation]:
-        """Get all charging stations"""
-        return list(self._stations.values())
+    def find_all(self) -> Sequence[ChargingStation]:
+        """Get a read-only snapshot of all charging stations"""
+        return self._snapshots.get()
     
     def exists(self, station_id: StationId) -> bool:
         """Check if a station exists"""
-        return station_id.value in self._stations
\ No newline at end of file
+        return station_id.value in self._stations
+    
+    def delete(self, station_id: StationId) -> None:
+        """Remove a station; unknown IDs are ignored"""
+        with self._lock:
+            if self._stations.pop(station_id.value, None) is not None:
+                self._snapshots.invalidate()
+    
+    def count(self) -> int:
+        """Number of stored stations"""
+        return len(self._stations)
@@ -1,8 +1,12 @@
-from typing import Optional, List, Dict
+import bisect
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Iterable, Sequence, Tuple
 from uuid import UUID
 from domain.entities.malfunction_report import MalfunctionReport
 from domain.value_objects.station_id import StationId
 from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
+from infrastructure.repositories.snapshot import SnapshotCache
 
 
 class InMemoryMalfunctionReportRepository(IMalfunctionReportRepository):
@@ -11,10 +15,29 @@ class InMemoryMalfunctionReportRepository(IMalfunctionReportRepository):
     def __init__(self):
         """Initialize empty storage"""
         self._reports: Dict[UUID, MalfunctionReport] = {}
+        self._lock = threading.RLock()
+        self._snapshots = SnapshotCache(self._reports.values, self._lock)
+        # Time index: creation timestamps in ascending order, IDs alongside
+        self._created_times: List[float] = []
+        self._created_ids: List[UUID] = []
+        # Report IDs per station and the report of each ticket
+        self._station_reports: Dict[str, List[UUID]] = {}
+        self._tickets: Dict[UUID, UUID] = {}
     
     def save(self, report: MalfunctionReport) -> None:
         """Save or update a malfunction report"""
-        self._reports[report.report_id] = report
+        with self._lock:
+            if self._store(report):
+                self._snapshots.invalidate()
+    
+    def save_many(self, reports: Iterable[MalfunctionReport]) -> None:
+        """Save or update several reports under one lock"""
+        with self._lock:
+            changed = False
+            for report in reports:
+                changed |= self._store(report)
+            if changed:
+                self._snapshots.invalidate()
     
     def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
         """Find a report by its ID"""
@@ -22,11 +45,100 @@ class InMemoryMalfunctionReportRepository(IMalfunctionReportRepository):
     
     def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
         """Find all reports for a specific station"""
-        return [
-            report for report in self._reports.values()
-            if report.station_id == station_id
-        ]
-    
-    def find_all(self) -> List[MalfunctionReport]:
-        """Get all reports"""
-        return list(self._reports.values())
\ No newline at end of file
+        with self._lock:
+            return [self._reports[report_id] for report_id in self._station_reports.get(station_id.value, ())]
+    
+    def find_by_stations(self, station_ids: Iterable[StationId]) -> List[MalfunctionReport]:
+        """Find all reports for any of several stations"""
+        with self._lock:
+            return [
+                self._reports[report_id]
+                for key in {station_id.value for station_id in station_ids}
+                for report_id in self._station_reports.get(key, ())
+            ]
+    
+    def find_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        report_id = self._tickets.get(ticket_id)
+        return None if report_id is None else self._reports.get(report_id)
+    
+    def find_all(self) -> Sequence[MalfunctionReport]:
+        """Get a read-only snapshot of all reports"""
+        return self._snapshots.get()
+    
+    def delete(self, report_id: UUID) -> None:
+        """Remove a report; unknown IDs are ignored"""
+        with self._lock:
+            report = self._reports.pop(report_id, None)
+            if report is not None:
+                self._unindex(report)
+                self._snapshots.invalidate()
+    
+    def find_created_between(self, start: datetime, end: datetime) -> List[MalfunctionReport]:
+        """Find reports created in [start, end), oldest first"""
+        with self._lock:
+            low = bisect.bisect_left(self._created_times, start.timestamp())
+            high = bisect.bisect_left(self._created_times, end.timestamp())
+            return [self._reports[report_id] for report_id in self._created_ids[low:high]]
+    
+    def count_created_per_bucket(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta
+    ) -> List[Tuple[datetime, int]]:
+        """Count reports created per bucket in [start, end) with two bisects per bucket"""
+        if bucket <= timedelta(0):
+            raise ValueError("Bucket size must be positive")
+        
+        with self._lock:
+            counts = []
+            bucket_start = start
+            low = bisect.bisect_left(self._created_times, start.timestamp())
+            while bucket_start < end:
+                bucket_end = min(bucket_start + bucket, end)
+                high = bisect.bisect_left(self._created_times, bucket_end.timestamp(), lo=low)
+                counts.append((bucket_start, high - low))
+                bucket_start, low = bucket_end, high
+            return counts
+    
+    def _store(self, report: MalfunctionReport) -> bool:
+        """Store and index a report; returns whether the stored instance changed"""
+        existing = self._reports.get(report.report_id)
+        changed = existing is not report
+        if changed:
+            if existing is not None:
+                self._unindex(existing)
+            self._reports[report.report_id] = report
+            self._index(report)
+        if report.ticket_id is not None:
+            # Tickets are created on a report that is already stored
+            self._tickets[report.ticket_id] = report.report_id
+        # Re-saving the stored instance leaves the snapshot valid
+        return changed
+    
+    def _index(self, report: MalfunctionReport) -> None:
+        self._station_reports.setdefault(report.station_id.value, []).append(report.report_id)
+        created = report.created_at.timestamp()
+        if not self._created_times or created >= self._created_times[-1]:
+            # Reports normally arrive in creation order
+            self._created_times.append(created)
+            self._created_ids.append(report.report_id)
+        else:
+            position = bisect.bisect_right(self._created_times, created)
+            self._created_times.insert(position, created)
+            self._created_ids.insert(position, report.report_id)
+    
+    def _unindex(self, report: MalfunctionReport) -> None:
+        station_reports = self._station_reports[report.station_id.value]
+        station_reports.remove(report.report_id)
+        if not station_reports:
+            del self._station_reports[report.station_id.value]
+        if report.ticket_id is not None:
+            self._tickets.pop(report.ticket_id, None)
+        created = report.created_at.timestamp()
+        position = bisect.bisect_left(self._created_times, created)
+        while self._created_ids[position] != report.report_id:
+            position += 1
+        del self._created_times[position]
+        del self._created_ids[position]
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.enums.report_status import ReportStatus
+from domain.enums.malfunction_type import MalfunctionType
+from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
+from infrastructure.search.report_search_index import ReportSearchIndex
+
+
+class IndexingMalfunctionReportRepository(IMalfunctionReportRepository):
+    """
+    Report repository that keeps a full-text index of descriptions
+    
+    Writes go to the wrapped repository and update the ReportSearchIndex
+    in the same call, so search results always reflect saved reports.
+    Reports already stored in the wrapped repository are indexed once on
+    construction. All other queries are passed through.
+    """
+    
+    def __init__(self, inner: IMalfunctionReportRepository, index: Optional[ReportSearchIndex] = None):
+        self._inner = inner
+        self.index = index or ReportSearchIndex()
+        for report in inner.find_all():
+            self.index.add(report)
+    
+    def save(self, report: MalfunctionReport) -> None:
+        """Save or update a malfunction report"""
+        self._inner.save(report)
+        self.index.add(report)
+    
+    def save_many(self, reports: Iterable[MalfunctionReport]) -> None:
+        """Save or update several reports"""
+        reports = list(reports)
+        self._inner.save_many(reports)
+        for report in reports:
+            self.index.add(report)
+    
+    def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Find a report by its ID"""
+        return self._inner.find_by_id(report_id)
+    
+    def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        """Find all reports for a specific station"""
+        return self._inner.find_by_station(station_id)
+    
+    def find_by_stations(self, station_ids: Iterable[StationId]) -> List[MalfunctionReport]:
+        """Find all reports for any of several stations"""
+        return self._inner.find_by_stations(station_ids)
+    
+    def find_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        return self._inner.find_by_ticket(ticket_id)
+    
+    def find_all(self) -> Sequence[MalfunctionReport]:
+        """Get all reports"""
+        return self._inner.find_all()
+    
+    def delete(self, report_id: UUID) -> None:
+        """Remove a report; unknown IDs are ignored"""
+        self._inner.delete(report_id)
+        self.index.remove(report_id)
+    
+    def find_created_between(self, start: datetime, end: datetime) -> List[MalfunctionReport]:
+        """Find reports created in [start, end), oldest first"""
+        return self._inner.find_created_between(start, end)
+    
+    def count_created_per_bucket(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta
+    ) -> List[Tuple[datetime, int]]:
+        """Count reports created per time bucket in [start, end)"""
+        return self._inner.count_created_per_bucket(start, end, bucket)
+    
+    def search(
+        self,
+        query: str,
+        station_id: Optional[StationId] = None,
+        status: Optional[ReportStatus] = None,
+        malfunction_type: Optional[MalfunctionType] = None,
+        limit: int = 20
+    ) -> List[Tuple[MalfunctionReport, float]]:
+        """Reports whose description matches the query with their relevance, best first"""
+        results = []
+        for hit in self.index.search(query, station_id, status, malfunction_type, limit):
+            report = self._inner.find_by_id(hit.report_id)
+            if report is not None:
+                results.append((report, hit.score))
+        return results
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
@@ -0,0 +1,161 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.data.ladesaeulenregister_loader import postal_code_of_station_id
+from infrastructure.data.register_partitions import (
+    PartitionManifest, read_partition, write_partition
+)
+
+
+class _Partition:
+    """Stations of one loaded partition"""
+    
+    __slots__ = ('stations', 'dirty')
+    
+    def __init__(self, stations: Iterable[ChargingStation]):
+        self.stations: Dict[str, ChargingStation] = {
+            station.station_id.value: station for station in stations
+        }
+        self.dirty = False
+
+
+class PartitionedChargingStationRepository(IChargingStationRepository):
+    """
+    Charging station repository over a postal-code partitioned register
+    
+    Partitions written by write_partitioned_register are loaded on first
+    access and kept in LRU order. When more than max_loaded_stations are
+    in memory, the least recently used partitions are evicted, writing
+    changed ones back to disk first. Lookups by ID or postal code load
+    only the one partition they need; find_all loads every partition.
+    """
+    
+    def __init__(self, directory: Path, max_loaded_stations: int = 200_000):
+        """Open a partitioned register"""
+        self.directory = Path(directory)
+        self.max_loaded_stations = max_loaded_stations
+        self._manifest = PartitionManifest.load(self.directory)
+        self._loaded: "OrderedDict[str, _Partition]" = OrderedDict()
+        self._loaded_stations = 0
+        self._lock = threading.RLock()
+    
+    def save(self, station: ChargingStation) -> None:
+        """Save or update a charging station"""
+        key = self._manifest.partition_key(station.postal_code)
+        with self._lock:
+            partition = self._partition(key, create=True)
+            if station.station_id.value not in partition.stations:
+                self._loaded_stations += 1
+            partition.stations[station.station_id.value] = station
+            partition.dirty = True
+            self._evict(keep=key)
+    
+    def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
+        """Find a station by its ID"""
+        with self._lock:
+            for key in self._candidate_partitions(station_id):
+                station = self._partition(key).stations.get(station_id.value)
+                self._evict(keep=key)
+                if station is not None:
+                    return station
+            return None
+    
+    def find_by_postal_code(self, postal_code: str) -> List[ChargingStation]:
+        """Find all stations in a postal code area"""
+        key = self._manifest.partition_key(postal_code)
+        with self._lock:
+            if key not in self._manifest.partitions:
+                return []
+            stations = [
+                station for station in self._partition(key).stations.values()
+                if station.postal_code == postal_code
+            ]
+            self._evict(keep=key)
+            return stations
+    
+    def find_all(self) -> Sequence[ChargingStation]:
+        """Get all charging stations, loading every partition"""
+        with self._lock:
+            stations: List[ChargingStation] = []
+            for key in sorted(self._manifest.partitions):
+                stations.extend(self._partition(key).stations.values())
+                self._evict(keep=key)
+            return stations
+    
+    def exists(self, station_id: StationId) -> bool:
+        """Check if a station exists"""
+        return self.find_by_id(station_id) is not None
+    
+    def delete(self, station_id: StationId) -> None:
+        """Remove a station; unknown IDs are ignored"""
+        with self._lock:
+            for key in self._candidate_partitions(station_id):
+                partition = self._partition(key)
+                if partition.stations.pop(station_id.value, None) is not None:
+                    partition.dirty = True
+                    self._loaded_stations -= 1
+                    return
+    
+    @property
+    def loaded_partitions(self) -> List[str]:
+        """Keys of the partitions currently in memory, least recently used first"""
+        return list(self._loaded)
+    
+    def flush(self) -> None:
+        """Write all changed partitions and the manifest to disk"""
+        with self._lock:
+            for key, partition in self._loaded.items():
+                self._write_back(key, partition)
+            self._manifest.save(self.directory)
+    
+    def _candidate_partitions(self, station_id: StationId) -> List[str]:
+        postal_code = postal_code_of_station_id(station_id.value)
+        if postal_code is not None:
+            key = self._manifest.partition_key(postal_code)
+            return [key] if key in self._manifest.partitions else []
+        # IDs without a postal code need a search, loaded partitions first
+        return list(self._loaded) + [
+            key for key in sorted(self._manifest.partitions) if key not in self._loaded
+        ]
+    
+    def _partition(self, key: str, create: bool = False) -> _Partition:
+        partition = self._loaded.get(key)
+        if partition is not None:
+            self._loaded.move_to_end(key)
+            return partition
+        
+        if key in self._manifest.partitions:
+            partition = _Partition(read_partition(self.directory, key))
+        elif create:
+            partition = _Partition(())
+            self._manifest.partitions[key] = 0
+        else:
+            raise KeyError(key)
+        
+        self._loaded[key] = partition
+        self._loaded_stations += len(partition.stations)
+        return partition
+    
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used partitions until within the budget"""
+        while self._loaded_stations > self.max_loaded_stations and len(self._loaded) > 1:
+            key = next(iter(self._loaded))
+            if key == keep:
+                # The partition in use is always the most recently used one
+                break
+            partition = self._loaded.pop(key)
+            self._write_back(key, partition)
+            self._loaded_stations -= len(partition.stations)
+    
+    def _write_back(self, key: str, partition: _Partition) -> None:
+        if not partition.dirty:
+            return
+        self._manifest.partitions[key] = write_partition(
+            self.directory, key, partition.stations.values()
+        )
+        self._manifest.save(self.directory)
+        partition.dirty = False
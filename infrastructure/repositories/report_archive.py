@@ -0,0 +1,110 @@
+import gzip
+import json
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.enums.report_status import ReportStatus
+from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
+from infrastructure.data.records import report_to_record, record_to_report
+
+ARCHIVABLE_STATUSES = (ReportStatus.RESOLVED, ReportStatus.CLOSED)
+SEGMENT_PATTERN = re.compile(r"^reports-(\d{6})\.jsonl\.gz$")
+
+
+class ReportArchive:
+    """
+    Append-only archive of finished reports on disk
+    
+    Every archiving run writes one new gzip-compressed JSON-lines segment;
+    existing segments are never modified. Reading streams the segments
+    one record at a time, so memory use does not grow with history.
+    """
+    
+    def __init__(self, directory: Path):
+        """Initialize archive, creating the directory if needed"""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def segments(self) -> List[Path]:
+        """Get all segment files, oldest first"""
+        return sorted(
+            path for path in self.directory.iterdir()
+            if SEGMENT_PATTERN.match(path.name)
+        )
+    
+    def append(self, reports: Iterable[MalfunctionReport]) -> Optional[Path]:
+        """
+        Write reports into a new segment
+        
+        Returns:
+            Path of the new segment, or None if there was nothing to write
+        """
+        reports = list(reports)
+        if not reports:
+            return None
+        
+        # Write under a unique temporary name so readers never see a partial
+        # segment and concurrent archiving runs never share a file
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".reports-", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as file:
+                for report in reports:
+                    file.write(json.dumps(report_to_record(report)) + "\n")
+            
+            # Linking fails if the name exists, so each run claims its own number
+            segments = self.segments()
+            number = int(SEGMENT_PATTERN.match(segments[-1].name).group(1)) + 1 if segments else 1
+            while True:
+                path = self.directory / f"reports-{number:06d}.jsonl.gz"
+                try:
+                    os.link(temporary, path)
+                    return path
+                except FileExistsError:
+                    number += 1
+        finally:
+            os.unlink(temporary)
+    
+    def iter_reports(self, station_id: Optional[StationId] = None) -> Iterator[MalfunctionReport]:
+        """Stream archived reports, optionally only those of one station"""
+        for path in self.segments():
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                for line in file:
+                    record = json.loads(line)
+                    if station_id is None or record['station_id'] == station_id.value:
+                        yield record_to_report(record)
+
+
+class ReportRetentionPolicy:
+    """Moves finished reports older than a threshold out of the hot store"""
+    
+    def __init__(self, archive: ReportArchive, max_age: timedelta):
+        self.archive = archive
+        self.max_age = max_age
+    
+    def apply(self, repository: IMalfunctionReportRepository, now: Optional[datetime] = None) -> int:
+        """
+        Archive RESOLVED/CLOSED reports last changed before now - max_age
+        
+        Reports are written to the archive before they are removed from the
+        repository, so a crash in between can duplicate but never lose them.
+        
+        Returns:
+            Number of archived reports
+        """
+        cutoff = (now or datetime.now()) - self.max_age
+        expired = [
+            report for report in repository.find_all()
+            if report.status in ARCHIVABLE_STATUSES and report.updated_at < cutoff
+        ]
+        if not expired:
+            return 0
+        
+        self.archive.append(expired)
+        for report in expired:
+            repository.delete(report.report_id)
+        return len(expired)
@@ -0,0 +1,208 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, TypeVar
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from infrastructure.data.ladesaeulenregister_loader import postal_code_of_station_id
+
+T = TypeVar('T')
+
+
+class ShardRouter:
+    """
+    Maps postal codes to shard names by their longest matching prefix
+    
+    Prefixes can follow Bundesland borders (e.g. "10"-"13", "140" and "141"
+    to "berlin", the rest of "14" to "brandenburg") or the postal regions
+    given by the leading digit.
+    """
+    
+    def __init__(self, shard_of_prefix: Mapping[str, str], default_shard: Optional[str] = None):
+        """
+        Args:
+            shard_of_prefix: Shard name per postal code prefix
+            default_shard: Shard for postal codes matching no prefix; they are rejected if None
+        """
+        self._shard_of_prefix = dict(shard_of_prefix)
+        self._prefix_lengths = sorted({len(prefix) for prefix in shard_of_prefix}, reverse=True)
+        self.default_shard = default_shard
+    
+    @classmethod
+    def by_postal_region(cls, prefix_length: int = 1) -> "ShardRouter":
+        """One shard per postal region, named by the leading digits"""
+        prefixes = [f"{number:0{prefix_length}d}" for number in range(10 ** prefix_length)]
+        return cls({prefix: prefix for prefix in prefixes})
+    
+    @property
+    def shards(self) -> List[str]:
+        """All shard names the router can return"""
+        names = set(self._shard_of_prefix.values())
+        if self.default_shard is not None:
+            names.add(self.default_shard)
+        return sorted(names)
+    
+    def find_shard(self, postal_code: str) -> Optional[str]:
+        """Get the shard of a postal code, None if no prefix matches and there is no default shard"""
+        for length in self._prefix_lengths:
+            shard = self._shard_of_prefix.get(postal_code[:length])
+            if shard is not None:
+                return shard
+        return self.default_shard
+    
+    def shard_for(self, postal_code: str) -> str:
+        """
+        Get the shard of a postal code
+        
+        Raises:
+            ValueError: If no prefix matches and there is no default shard
+        """
+        shard = self.find_shard(postal_code)
+        if shard is None:
+            raise ValueError(f"No shard for postal code {postal_code}")
+        return shard
+
+
+class ShardedChargingStationRepository(IChargingStationRepository):
+    """
+    Charging station repository split into region shards
+    
+    Each shard is a complete repository of its own (in-memory, columnar,
+    partitioned or a client of another process). Writes and lookups by ID
+    or postal code go to the one shard the router picks; find_all, counts
+    and lookups of IDs without a postal code fan out to all shards in
+    parallel.
+    """
+    
+    def __init__(self, shards: Mapping[str, IChargingStationRepository], router: ShardRouter):
+        missing = set(router.shards) - set(shards)
+        if missing:
+            raise ValueError(f"No repository for shards: {', '.join(sorted(missing))}")
+        self._shards = dict(shards)
+        self._router = router
+        self._executor = ThreadPoolExecutor(max_workers=len(self._shards), thread_name_prefix="shard")
+    
+    def save(self, station: ChargingStation) -> None:
+        """Save or update a charging station in its region's shard"""
+        self._shards[self._shard_of_station(station)].save(station)
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """Save or update several stations with one batch per shard"""
+        batches: Dict[str, List[ChargingStation]] = {}
+        for station in stations:
+            batches.setdefault(self._shard_of_station(station), []).append(station)
+        for shard, batch in batches.items():
+            self._shards[shard].save_many(batch)
+    
+    def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
+        """Find a station by its ID"""
+        return next(
+            (station for station in self._fan_out(
+                lambda repository: repository.find_by_id(station_id), self._shards_of_id(station_id)
+            ) if station is not None),
+            None
+        )
+    
+    def find_by_postal_code(self, postal_code: str) -> List[ChargingStation]:
+        """Find all stations in a postal code area"""
+        return self._shards[self._router.shard_for(postal_code)].find_by_postal_code(postal_code)
+    
+    def find_by_operator(self, operator: str) -> List[ChargingStation]:
+        """Find all stations of an operator in every shard"""
+        stations: List[ChargingStation] = []
+        for part in self._fan_out(lambda repository: repository.find_by_operator(operator)):
+            stations.extend(part)
+        return stations
+    
+    def find_all(self) -> Sequence[ChargingStation]:
+        """Get all charging stations, shard by shard"""
+        stations: List[ChargingStation] = []
+        for part in self._fan_out(lambda repository: repository.find_all()):
+            stations.extend(part)
+        return stations
+    
+    def exists(self, station_id: StationId) -> bool:
+        """Check if a station exists"""
+        return any(self._fan_out(
+            lambda repository: repository.exists(station_id), self._shards_of_id(station_id)
+        ))
+    
+    def delete(self, station_id: StationId) -> None:
+        """Remove a station; unknown IDs are ignored"""
+        self._fan_out(lambda repository: repository.delete(station_id), self._shards_of_id(station_id))
+    
+    def count(self) -> int:
+        """Number of stations across all shards"""
+        return sum(self._fan_out(_count))
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        """Count stations per status across all shards"""
+        total: Counter = Counter({status: 0 for status in StationStatus})
+        for counts in self._fan_out(_count_by_status):
+            total.update(counts)
+        return dict(total)
+    
+    def shard(self, name: str) -> IChargingStationRepository:
+        """Get the repository of one shard"""
+        return self._shards[name]
+    
+    def close(self) -> None:
+        """Stop the fan-out threads"""
+        self._executor.shutdown()
+    
+    def _shard_of_station(self, station: ChargingStation) -> str:
+        """
+        Get the shard a station is stored in, by its postal code
+        
+        Raises:
+            ValueError: If the postal code in a register ID routes to another
+                shard, so that lookups by ID would miss the station
+        """
+        shard = self._router.shard_for(station.postal_code)
+        id_postal_code = postal_code_of_station_id(station.station_id.value)
+        if id_postal_code is not None and self._router.find_shard(id_postal_code) != shard:
+            raise ValueError(
+                f"Station {station.station_id.value} has postal code {station.postal_code}, "
+                f"which belongs to another shard than the one in its ID"
+            )
+        return shard
+    
+    def _shards_of_id(self, station_id: StationId) -> List[str]:
+        """
+        Shards that can hold a station: the one its register ID routes to,
+        none if that postal code has no shard, all if the ID carries none
+        """
+        postal_code = postal_code_of_station_id(station_id.value)
+        if postal_code is None:
+            return sorted(self._shards)
+        shard = self._router.find_shard(postal_code)
+        return [] if shard is None else [shard]
+    
+    def _fan_out(
+        self,
+        call: Callable[[IChargingStationRepository], T],
+        names: Optional[List[str]] = None
+    ) -> List[T]:
+        """Run a call on every (or every named) shard in parallel, results in shard name order"""
+        names = sorted(self._shards) if names is None else names
+        if len(names) == 1:
+            # Nothing to parallelize; skip the thread hand-off
+            return [call(self._shards[names[0]])]
+        futures = [self._executor.submit(call, self._shards[name]) for name in names]
+        return [future.result() for future in futures]
+
+
+def _count(repository: IChargingStationRepository) -> int:
+    count = getattr(repository, 'count', None)
+    if count is not None:
+        return count()
+    return len(repository.find_all())
+
+
+def _count_by_status(repository: IChargingStationRepository) -> Dict[StationStatus, int]:
+    # Columnar shards count vectorized
+    count_by_status = getattr(repository, 'count_by_status', None)
+    if count_by_status is not None:
+        return count_by_status()
+    return Counter(station.status for station in repository.find_all())
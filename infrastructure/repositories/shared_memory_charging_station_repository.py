@@ -0,0 +1,475 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence as SequenceABC
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository,
+    ChargingStationView,
+    STATUS_CODES,
+    NO_STRING,
+    is_encodable_postal_code,
+    postal_code_to_int,
+)
+from infrastructure.repositories.snapshot import SnapshotCache
+
+try:
+    import fcntl
+except ImportError:  # no flock outside POSIX
+    fcntl = None
+
+# Segment preamble: state flag, header length, shared status version, creator PID
+_PREAMBLE = np.dtype([
+    ('state', '<u8'),
+    ('header_length', '<u8'),
+    ('status_version', '<i8'),
+    ('creator_pid', '<i8'),
+])
+_BUILDING = 0
+_READY = 1
+_ALIGNMENT = 8
+
+# Python < 3.13 cannot opt out of resource tracking when opening a segment
+_UNREGISTERED_FROM_TRACKER = os.name == 'posix' and sys.version_info < (3, 13)
+
+# Columns that every worker may write to
+_WRITABLE_COLUMNS = ('status', 'updated_at', 'status_owner')
+
+
+def _id_hash(value: str) -> int:
+    """Process-independent 64-bit hash of a station ID"""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _encode_strings(values: List[str]) -> Dict[str, np.ndarray]:
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return {'offsets': offsets, 'blob': np.frombuffer(b''.join(encoded) or b'\0', dtype=np.uint8)}
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """
+    Open a shared memory segment that outlives the process that made it
+    
+    By default Python's resource tracker unlinks segments when the creating
+    (or, before 3.13, any attaching) process exits, which would pull the
+    dataset away from the remaining workers.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    
+    segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+    if _UNREGISTERED_FROM_TRACKER:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    return segment
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process with this PID still exists"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _SegmentLock:
+    """
+    Exclusive lock shared by every process using a named segment
+    
+    Holds flock on a lock file named after the segment, so it also
+    serializes workers in other processes; it is reentrant within a
+    process. Without fcntl only threads of this process are serialized.
+    """
+    
+    def __init__(self, name: str):
+        self.path = os.path.join(tempfile.gettempdir(), f"{name.lstrip('/')}.lock")
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+    
+    def __enter__(self) -> "_SegmentLock":
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            self._file = open(self.path, 'a')
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        self._depth += 1
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._file is not None:
+            # Closing the file releases the flock
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+class _SharedStrings(SequenceABC):
+    """Read-only string table decoded on access from a shared UTF-8 blob"""
+    
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray, factory: Callable = str):
+        self._offsets = offsets
+        self._blob = blob
+        self._factory = factory
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    def __getitem__(self, index: int):
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._factory(self._blob[start:end].tobytes().decode('utf-8'))
+
+
+class SharedStationDataset:
+    """
+    Parsed station table placed in one multiprocessing.shared_memory segment
+    
+    The first worker to start parses the register and publishes the table;
+    every other worker maps the same segment. Only the status and
+    updated_at columns are writable, so status flips from any worker are
+    visible to all of them without copying the dataset; the lock
+    serializes those flips across processes. Each defective status also
+    records the PID of the worker holding its ticket.
+    """
+    
+    def __init__(self, segment: shared_memory.SharedMemory):
+        self._segment = segment
+        self.lock = _SegmentLock(segment.name)
+        self._preamble = np.ndarray((1,), dtype=_PREAMBLE, buffer=segment.buf)
+        header_length = int(self._preamble['header_length'][0])
+        start = _PREAMBLE.itemsize
+        header = json.loads(bytes(segment.buf[start:start + header_length]).decode('utf-8'))
+        self.count: int = header['count']
+        
+        self.arrays: Dict[str, np.ndarray] = {}
+        for column, (offset, dtype, length) in header['columns'].items():
+            array = np.ndarray((length,), dtype=np.dtype(dtype), buffer=segment.buf, offset=offset)
+            if column not in _WRITABLE_COLUMNS:
+                array.flags.writeable = False
+            self.arrays[column] = array
+    
+    @property
+    def name(self) -> str:
+        return self._segment.name
+    
+    @property
+    def status_version(self) -> np.ndarray:
+        """Shared counter bumped whenever any worker changes a status"""
+        return self._preamble['status_version']
+    
+    @classmethod
+    def create(cls, name: str, stations: Iterable[ChargingStation]) -> "SharedStationDataset":
+        """Parse stations into a new segment; fails if the name is taken"""
+        stations = list(stations)
+        storable = [station for station in stations if is_encodable_postal_code(station.postal_code)]
+        if len(storable) < len(stations):
+            print(f"⚠️ Skipped {len(stations) - len(storable)} stations with malformed postal codes")
+            stations = storable
+        strings: List[str] = []
+        string_codes: Dict[str, int] = {}
+        
+        def intern(value: Optional[str]) -> int:
+            if value is None:
+                return NO_STRING
+            if value not in string_codes:
+                string_codes[value] = len(strings)
+                strings.append(value)
+            return string_codes[value]
+        
+        ids = [station.station_id.value for station in stations]
+        hashes = np.array([_id_hash(value) for value in ids], dtype=np.uint64)
+        order = np.argsort(hashes, kind='stable')
+        id_strings = _encode_strings(ids)
+        columns = {
+            'latitude': np.array([np.nan if s.latitude is None else s.latitude for s in stations], dtype=np.float64),
+            'longitude': np.array([np.nan if s.longitude is None else s.longitude for s in stations], dtype=np.float64),
+            'approximate': np.array([s.coordinates_approximate for s in stations], dtype=np.bool_),
+            'created_at': np.array([s.created_at.timestamp() for s in stations], dtype=np.float64),
+            'updated_at': np.array([s.updated_at.timestamp() for s in stations], dtype=np.float64),
+            'postal_code': np.array([postal_code_to_int(s.postal_code) for s in stations], dtype=np.int32),
+            'name': np.array([intern(s.name) for s in stations], dtype=np.int32),
+            'address': np.array([intern(s.address) for s in stations], dtype=np.int32),
+            'status': np.array([STATUS_CODES[s.status] for s in stations], dtype=np.int8),
+            'status_owner': np.zeros(len(stations), dtype=np.int64),
+            'id_hash': hashes[order],
+            'id_row': order.astype(np.int32),
+            'id_offsets': id_strings['offsets'],
+            'id_blob': id_strings['blob'],
+        }
+        table_strings = _encode_strings(strings)
+        columns['string_offsets'] = table_strings['offsets']
+        columns['string_blob'] = table_strings['blob']
+        
+        # Header holds absolute offsets; reserve room for its own digits
+        layout: Dict[str, list] = {}
+        header_length = 0
+        while True:
+            offset = _align(_PREAMBLE.itemsize + header_length)
+            for column, values in columns.items():
+                layout[column] = [offset, values.dtype.str, len(values)]
+                offset = _align(offset + values.nbytes)
+            header = json.dumps({'count': len(stations), 'columns': layout}).encode('utf-8')
+            if len(header) <= header_length:
+                break
+            header_length = len(header) + 64
+        
+        segment = _open_segment(name, create=True, size=offset)
+        preamble = np.ndarray((1,), dtype=_PREAMBLE, buffer=segment.buf)
+        preamble['state'] = _BUILDING
+        preamble['header_length'] = len(header)
+        preamble['status_version'] = 0
+        preamble['creator_pid'] = os.getpid()
+        segment.buf[_PREAMBLE.itemsize:_PREAMBLE.itemsize + len(header)] = header
+        for column, values in columns.items():
+            start = layout[column][0]
+            segment.buf[start:start + values.nbytes] = values.tobytes()
+        preamble['state'] = _READY
+        del preamble
+        return cls(segment)
+    
+    @classmethod
+    def attach(cls, name: str, timeout: float = 30.0) -> "SharedStationDataset":
+        """
+        Map an existing segment, waiting until its creator has filled it
+        
+        A segment whose creator died before finishing is unlinked, and
+        FileNotFoundError raised as if it had never existed. Stations left
+        defective by workers that have stopped are restored on attaching.
+        """
+        segment = _open_segment(name)
+        preamble = np.ndarray((1,), dtype=_PREAMBLE, buffer=segment.buf)
+        deadline = time.monotonic() + timeout
+        while preamble['state'][0] != _READY:
+            creator = int(preamble['creator_pid'][0])
+            if fcntl is not None and creator and not _process_alive(creator):
+                del preamble
+                segment.close()
+                cls._discard_abandoned(name)
+                raise FileNotFoundError(f"Shared station dataset {name} was abandoned by its creator")
+            if time.monotonic() > deadline:
+                del preamble
+                segment.close()
+                raise TimeoutError(f"Shared station dataset {name} was never completed")
+            time.sleep(0.05)
+        del preamble
+        dataset = cls(segment)
+        dataset.restore_orphaned_statuses()
+        return dataset
+    
+    @staticmethod
+    def _discard_abandoned(name: str) -> None:
+        """Unlink the segment if it is still unfinished and its creator dead"""
+        with _SegmentLock(name):
+            # Another worker may have replaced it while we waited for the lock
+            try:
+                segment = _open_segment(name)
+            except FileNotFoundError:
+                return
+            preamble = np.ndarray((1,), dtype=_PREAMBLE, buffer=segment.buf)
+            state, creator = int(preamble['state'][0]), int(preamble['creator_pid'][0])
+            del preamble
+            if state != _READY and creator and not _process_alive(creator):
+                _unlink_segment(segment)
+            segment.close()
+    
+    @classmethod
+    def open_or_create(
+        cls,
+        name: str,
+        load_stations: Callable[[], Iterable[ChargingStation]]
+    ) -> "SharedStationDataset":
+        """
+        Attach to the dataset, or parse and publish it if no worker has yet
+        
+        Creating a segment is atomic, so when two workers race only one of
+        them publishes its table and the other attaches to it.
+        """
+        try:
+            return cls.attach(name)
+        except FileNotFoundError:
+            pass
+        
+        stations = list(load_stations())
+        # Held while filling, so abandoned segments are never discarded mid-build
+        with _SegmentLock(name):
+            try:
+                return cls.create(name, stations)
+            except FileExistsError:
+                pass
+        return cls.attach(name)
+    
+    def restore_orphaned_statuses(self) -> int:
+        """
+        Mark stations available again whose defective status has no worker
+        
+        Reports and tickets live in the worker that created them, so once
+        that worker stops nobody can resolve the ticket and the station
+        would stay defective for good.
+        
+        Returns:
+            Number of restored stations
+        """
+        if fcntl is None:
+            return 0
+        owners = self.arrays['status_owner']
+        status = self.arrays['status']
+        with self.lock:
+            stopped = [pid for pid in np.unique(owners[owners != 0]) if not _process_alive(int(pid))]
+            orphaned = np.isin(owners, stopped)
+            owners[orphaned] = 0
+            rows = np.flatnonzero(orphaned & (status == STATUS_CODES[StationStatus.DEFECTIVE]))
+            if rows.size == 0:
+                return 0
+            status[rows] = STATUS_CODES[StationStatus.AVAILABLE]
+            self.arrays['updated_at'][rows] = time.time()
+            self.status_version[0] += 1
+        print(f"🔧 Restored {rows.size} stations left defective by stopped workers")
+        return int(rows.size)
+    
+    def close(self) -> None:
+        """Unmap the segment from this process"""
+        self.arrays.clear()
+        self._preamble = None
+        self._segment.close()
+    
+    def unlink(self) -> None:
+        """Remove the segment for good; call once, when all workers stop"""
+        _unlink_segment(self._segment)
+        try:
+            os.remove(self.lock.path)
+        except FileNotFoundError:
+            pass
+
+
+def _unlink_segment(segment: shared_memory.SharedMemory) -> None:
+    if _UNREGISTERED_FROM_TRACKER:
+        # unlink() unregisters again, so hand the name back first
+        from multiprocessing import resource_tracker
+        resource_tracker.register(segment._name, 'shared_memory')
+    segment.unlink()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class _SharedStationView(ChargingStationView):
+    """
+    Station view whose status changes hold the dataset's cross-process lock
+    
+    Marking a station defective records this process as the owner of the
+    status, since the ticket that will restore it lives here.
+    """
+    
+    def mark_as_defective(self) -> None:
+        with self._columns._dataset.lock:
+            super().mark_as_defective()
+            self._columns._status_owner[self._row] = os.getpid()
+    
+    def mark_as_available(self) -> None:
+        with self._columns._dataset.lock:
+            super().mark_as_available()
+            self._columns._status_owner[self._row] = 0
+
+
+class SharedMemoryChargingStationRepository(ColumnarChargingStationRepository):
+    """
+    Columnar station repository over a SharedStationDataset
+    
+    The station set is fixed when the dataset is published; saving a view
+    of this repository persists status changes to all workers, while adding
+    or deleting stations is not supported. Status checks and changes, and
+    the shared status version bump, run under the dataset's lock.
+    """
+    
+    _view_class = _SharedStationView
+    
+    def __init__(self, dataset: SharedStationDataset):
+        """Map the shared columns instead of allocating own storage"""
+        arrays = dataset.arrays
+        self._dataset = dataset
+        self._ids = _SharedStrings(arrays['id_offsets'], arrays['id_blob'], StationId.of)
+        self._strings = _SharedStrings(arrays['string_offsets'], arrays['string_blob'])
+        self._id_hash = arrays['id_hash']
+        self._id_row = arrays['id_row']
+        self._latitude = arrays['latitude']
+        self._longitude = arrays['longitude']
+        self._approximate = arrays['approximate']
+        self._status = arrays['status']
+        self._status_owner = arrays['status_owner']
+        self._postal_code = arrays['postal_code']
+        self._name = arrays['name']
+        self._address = arrays['address']
+        self._created_at = arrays['created_at']
+        self._updated_at = arrays['updated_at']
+        self._alive = np.ones(dataset.count, dtype=np.bool_)
+        self._size = self._capacity = dataset.count
+        self._deleted = 0
+        self._lock = threading.RLock()
+        self._snapshots = SnapshotCache(self._all_views, self._lock)
+        # Built on the first lookup by string; the shared table never changes
+        self._string_codes: Optional[Dict[str, int]] = None
+    
+    @property
+    def _status_version(self) -> int:
+        return int(self._dataset.status_version[0])
+    
+    @_status_version.setter
+    def _status_version(self, version: int) -> None:
+        self._dataset.status_version[0] = version
+    
+    def save(self, station: ChargingStation) -> None:
+        """Save a station; only views of this repository can be saved"""
+        if isinstance(station, ChargingStationView) and station._columns is self:
+            return
+        raise ValueError("Shared station dataset is read-only; stations cannot be added")
+    
+    def save_many(self, stations: Iterable[ChargingStation]) -> None:
+        """Save stations; only views of this repository can be saved"""
+        for station in stations:
+            self.save(station)
+    
+    def find_by_id(self, station_id: StationId) -> Optional[ChargingStation]:
+        """Find a station by its ID using the shared hash index"""
+        row = self._row_of(station_id.value)
+        return None if row is None else self._view_class(self, row)
+    
+    def exists(self, station_id: StationId) -> bool:
+        """Check if a station exists"""
+        return self._row_of(station_id.value) is not None
+    
+    def delete(self, station_id: StationId) -> None:
+        """Stations cannot be removed from a shared dataset"""
+        raise ValueError("Shared station dataset is read-only; stations cannot be removed")
+    
+    def _string_code(self, value: str) -> Optional[int]:
+        if self._string_codes is None:
+            self._string_codes = {string: code for code, string in enumerate(self._strings)}
+        return self._string_codes.get(value)
+    
+    def _intern(self, value: Optional[str]) -> int:
+        raise ValueError("Shared station dataset is read-only; register data cannot change")
+    
+    def _row_of(self, value: str) -> Optional[int]:
+        key = np.uint64(_id_hash(value))
+        slot = int(np.searchsorted(self._id_hash, key))
+        while slot < len(self._id_hash) and self._id_hash[slot] == key:
+            row = int(self._id_row[slot])
+            if self._ids[row].value == value:
+                return row
+            slot += 1
+        return None
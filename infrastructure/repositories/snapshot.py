@@ -0,0 +1,73 @@
+import threading
+from collections.abc import Sequence
+from typing import Callable, Generic, Iterable, Optional, TypeVar, Union
+
+T = TypeVar('T')
+
+
+class Snapshot(Sequence, Generic[T]):
+    """
+    Read-only, versioned view of a repository's contents
+    
+    Snapshots are shared between all readers of the same repository version,
+    so iterating or taking len() of find_all() does not copy the store.
+    """
+    
+    __slots__ = ('_items', '_version')
+    
+    def __init__(self, items: tuple, version: int):
+        self._items = items
+        self._version = version
+    
+    @property
+    def version(self) -> int:
+        """Repository version this snapshot was taken at"""
+        return self._version
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __getitem__(self, index: Union[int, slice]):
+        return self._items[index]
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def __repr__(self) -> str:
+        return f"Snapshot(version={self._version}, size={len(self._items)})"
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Builds a Snapshot lazily and keeps it until the next write
+    
+    Repositories call invalidate() whenever their membership changes; the
+    O(n) rebuild then happens at most once per version instead of once per
+    read.
+    """
+    
+    def __init__(self, source: Callable[[], Iterable[T]], lock: threading.RLock):
+        self._source = source
+        self._lock = lock
+        self._version = 0
+        self._snapshot: Optional[Snapshot[T]] = None
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    def invalidate(self) -> None:
+        """Drop the current snapshot; callers must hold the repository lock"""
+        self._version += 1
+        self._snapshot = None
+    
+    def get(self) -> Snapshot[T]:
+        """Get the snapshot for the current version, building it if needed"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = Snapshot(tuple(self._source()), self._version)
+            return self._snapshot
@@ -0,0 +1,50 @@
+import re
+from typing import List
+
+TOKEN = re.compile(r"\w+")
+# Umlauts and their ASCII spellings fold to the same letter
+FOLDINGS = (("ä", "a"), ("ö", "o"), ("ü", "u"), ("ae", "a"), ("oe", "o"), ("ue", "u"))
+STOPWORDS = frozenset("""
+    aber als am an auch auf aus bei bin bis da das dass dem den der des die doch du
+    ein eine einem einen einer es fur hat hier ich ihr im in ist ja kann man mit nach
+    noch nur oder schon sehr sie sind so um und uns von vom war was wie wir wird zu zum zur
+    a an and are at be but for from has have i in is it my of on or the this to was with
+""".split())
+
+
+def normalize(word: str) -> str:
+    """
+    Normalize a German word for matching
+    
+    Case, umlauts and their ASCII spellings (ä/ae) are folded, ß becomes
+    ss, and common inflection endings are stripped (light stemming after
+    Savoy), so "Kartenleser", "kartenlesern" and "Kartenlesers" match.
+    """
+    return _stem(_fold(word))
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized terms of a text, without stop words and single characters"""
+    terms = []
+    for word in TOKEN.findall(text):
+        folded = _fold(word)
+        if len(folded) > 1 and folded not in STOPWORDS:
+            terms.append(_stem(folded))
+    return terms
+
+
+def _fold(word: str) -> str:
+    word = word.casefold()
+    for umlaut, folded in FOLDINGS:
+        word = word.replace(umlaut, folded)
+    return word
+
+
+def _stem(word: str) -> str:
+    if len(word) > 5 and word.endswith(("ern", "ers")):
+        return word[:-3]
+    if len(word) > 4 and word.endswith(("em", "en", "er", "es")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith(("e", "n", "s")):
+        return word[:-1]
+    return word
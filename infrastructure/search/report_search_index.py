@@ -0,0 +1,189 @@
+import threading
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+from uuid import UUID
+import numpy as np
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.enums.report_status import ReportStatus
+from domain.enums.malfunction_type import MalfunctionType
+from infrastructure.search.german_text import tokenize
+
+STATUSES = list(ReportStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+TYPES = list(MalfunctionType)
+TYPE_CODES = {malfunction_type: code for code, malfunction_type in enumerate(TYPES)}
+
+# BM25 parameters: term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result"""
+    report_id: UUID
+    score: float
+
+
+class _Postings:
+    """Documents containing a term with the term's frequency, in insertion order"""
+    
+    __slots__ = ('documents', 'frequencies', '_arrays')
+    
+    def __init__(self):
+        self.documents: List[int] = []
+        self.frequencies: List[int] = []
+        self._arrays = None
+    
+    def add(self, document: int, frequency: int) -> None:
+        self.documents.append(document)
+        self.frequencies.append(frequency)
+        self._arrays = None
+    
+    def arrays(self):
+        # Converted once per change, not once per query
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self.documents, dtype=np.int64),
+                np.array(self.frequencies, dtype=np.float64),
+            )
+        return self._arrays
+
+
+class ReportSearchIndex:
+    """
+    Inverted index over malfunction report descriptions with BM25 ranking
+    
+    Descriptions are tokenized German-aware (see german_text). Each report
+    gets a document number; station, status and malfunction type are kept
+    in NumPy columns by document number, so filters and scoring run
+    vectorized over the postings of the query terms only. Removed reports
+    are flagged dead and skipped rather than taken out of the postings.
+    """
+    
+    def __init__(self, initial_capacity: int = 1024):
+        self._postings: Dict[str, _Postings] = {}
+        self._document_frequency: Counter = Counter()
+        self._documents: Dict[UUID, int] = {}
+        self._report_ids: List[UUID] = []
+        self._stations: Dict[str, int] = {}
+        self._total_length = 0
+        self._capacity = max(initial_capacity, 1)
+        self._length = np.zeros(self._capacity, dtype=np.int32)
+        self._station = np.zeros(self._capacity, dtype=np.int32)
+        self._status = np.zeros(self._capacity, dtype=np.int8)
+        self._type = np.zeros(self._capacity, dtype=np.int8)
+        self._alive = np.zeros(self._capacity, dtype=np.bool_)
+        self._terms: List[Optional[List[str]]] = []
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def add(self, report: MalfunctionReport) -> None:
+        """Index a report; re-adding a known report only updates its status"""
+        with self._lock:
+            document = self._documents.get(report.report_id)
+            if document is not None:
+                self._status[document] = STATUS_CODES[report.status]
+                return
+            
+            document = len(self._report_ids)
+            if document == self._capacity:
+                self._grow()
+            terms = Counter(tokenize(report.description.value))
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = _Postings()
+                postings.add(document, frequency)
+                self._document_frequency[term] += 1
+            
+            length = sum(terms.values())
+            self._documents[report.report_id] = document
+            self._report_ids.append(report.report_id)
+            self._terms.append(list(terms))
+            self._length[document] = length
+            self._station[document] = self._station_code(report.station_id)
+            self._status[document] = STATUS_CODES[report.status]
+            self._type[document] = TYPE_CODES[report.malfunction_type]
+            self._alive[document] = True
+            self._total_length += length
+    
+    def remove(self, report_id: UUID) -> None:
+        """Drop a report from the results; unknown IDs are ignored"""
+        with self._lock:
+            document = self._documents.pop(report_id, None)
+            if document is None:
+                return
+            self._alive[document] = False
+            self._total_length -= int(self._length[document])
+            for term in self._terms[document]:
+                self._document_frequency[term] -= 1
+            self._terms[document] = None
+    
+    def search(
+        self,
+        query: str,
+        station_id: Optional[StationId] = None,
+        status: Optional[ReportStatus] = None,
+        malfunction_type: Optional[MalfunctionType] = None,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """
+        Rank reports matching any query term by BM25, best first
+        
+        Filters are combined with AND; reports matching none of the terms
+        are not returned.
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._documents)
+            if not terms or count == 0 or limit <= 0:
+                return []
+            
+            size = len(self._report_ids)
+            mask = self._alive[:size].copy()
+            if station_id is not None:
+                code = self._stations.get(station_id.value)
+                if code is None:
+                    return []
+                mask &= self._station[:size] == code
+            if status is not None:
+                mask &= self._status[:size] == STATUS_CODES[status]
+            if malfunction_type is not None:
+                mask &= self._type[:size] == TYPE_CODES[malfunction_type]
+            
+            average_length = self._total_length / count
+            scores = np.zeros(size)
+            matched = np.zeros(size, dtype=np.bool_)
+            for term in terms:
+                postings = self._postings.get(term)
+                frequency = self._document_frequency.get(term, 0)
+                if postings is None or frequency == 0:
+                    continue
+                documents, frequencies = postings.arrays()
+                idf = np.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                norm = K1 * (1 - B + B * self._length[documents] / average_length)
+                scores[documents] += idf * frequencies * (K1 + 1) / (frequencies + norm)
+                matched[documents] = True
+            
+            candidates = np.flatnonzero(matched & mask)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            ranked = candidates[np.lexsort((candidates, -scores[candidates]))]
+            return [SearchHit(self._report_ids[document], float(scores[document])) for document in ranked]
+    
+    def _station_code(self, station_id: StationId) -> int:
+        code = self._stations.get(station_id.value)
+        if code is None:
+            code = self._stations[station_id.value] = len(self._stations)
+        return code
+    
+    def _grow(self) -> None:
+        capacity = self._capacity * 2
+        for column in ('_length', '_station', '_status', '_type', '_alive'):
+            grown = np.zeros(capacity, dtype=getattr(self, column).dtype)
+            grown[:self._capacity] = getattr(self, column)
+            setattr(self, column, grown)
+        self._capacity = capacity
@@ -0,0 +1,113 @@
+import gc
+import tracemalloc
+from uuid import uuid4
+from datetime import datetime
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from domain.enums.station_status import StationStatus
+
+COUNT = 50_000
+
+
+def measure(factory, count=COUNT):
+    """Return the number of bytes allocated per object built by factory"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # The list holding the objects is not part of the per-object cost
+    total -= objects.__sizeof__()
+    return total / count
+
+
+class BaselineStation:
+    """ChargingStation's storage before __slots__: an instance dict and own timestamps"""
+    
+    def __init__(self, station_id, name, postal_code, address=None, latitude=None, longitude=None):
+        self._station_id = station_id
+        self._name = name
+        self._postal_code = postal_code
+        self._address = address
+        self._latitude = latitude
+        self._longitude = longitude
+        self._status = StationStatus.AVAILABLE
+        self._created_at = datetime.now()
+        self._updated_at = datetime.now()
+
+
+class BaselineReport:
+    """MalfunctionReport's storage before __slots__: an instance dict and an eager error list"""
+    
+    def __init__(self, report_id, station_id, malfunction_type, description, reported_by=None):
+        self._report_id = report_id
+        self._station_id = station_id
+        self._malfunction_type = malfunction_type
+        self._description = description
+        self._reported_by = reported_by
+        self._status = ReportStatus.SUBMITTED
+        self._ticket_id = None
+        self._created_at = datetime.now()
+        self._validation_errors = []
+
+
+# Arguments are created up-front so only the entity itself is measured
+station_ids = [StationId(f"BERLIN-10178-{i:06d}") for i in range(COUNT)]
+description = ReportDescription("Payment terminal not working properly")
+report_ids = [uuid4() for _ in range(COUNT)]
+loaded_at = datetime.now()
+
+
+def make_station(i):
+    return ChargingStation(
+        station_id=station_ids[i],
+        name="Test Operator",
+        postal_code="10178",
+        address="Alexanderplatz 1",
+        latitude=52.52,
+        longitude=13.41,
+        created_at=loaded_at
+    )
+
+
+def make_report(i):
+    return MalfunctionReport(
+        report_id=report_ids[i],
+        station_id=station_ids[i],
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=description
+    )
+
+
+def make_baseline_station(i):
+    return BaselineStation(
+        station_id=station_ids[i],
+        name="Test Operator",
+        postal_code="10178",
+        address="Alexanderplatz 1",
+        latitude=52.52,
+        longitude=13.41
+    )
+
+
+def make_baseline_report(i):
+    return BaselineReport(
+        report_id=report_ids[i],
+        station_id=station_ids[i],
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=description
+    )
+
+
+print("=" * 60)
+print("🧮 Entity memory benchmark (baseline -> current)")
+print("=" * 60)
+print(f"ChargingStation:   {measure(make_baseline_station):8.1f} -> {measure(make_station):8.1f} bytes/station")
+print(f"MalfunctionReport: {measure(make_baseline_report):8.1f} -> {measure(make_report):8.1f} bytes/report")
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import time
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.services.malfunction_report_service import MalfunctionReportService
+from infrastructure.api.http_server import ReportHttpServer
+from infrastructure.repositories.columnar_charging_station_repository import ColumnarChargingStationRepository
+from infrastructure.repositories.in_memory_malfunction_report_repository import InMemoryMalfunctionReportRepository
+
+STATIONS = 1_000
+CLIENTS = 32
+REQUESTS_PER_CLIENT = 500
+BATCH_SIZE = 50
+
+
+def build_service() -> MalfunctionReportService:
+    station_repo = ColumnarChargingStationRepository()
+    for number in range(STATIONS):
+        station_repo.save(ChargingStation(
+            station_id=StationId(f"BENCH-{number:05d}"),
+            name="Benchmark Operator",
+            postal_code="10178"
+        ))
+    return MalfunctionReportService(InMemoryMalfunctionReportRepository(), station_repo)
+
+
+def report(number: int) -> dict:
+    return {
+        'station_id': f"BENCH-{number % STATIONS:05d}",
+        'malfunction_type': 'not_charging',
+        'description': 'Firmware self-test failed on connector 1',
+    }
+
+
+async def request(reader, writer, path: str, payload) -> None:
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = next(
+        int(line.split(b":")[1]) for line in head.split(b"\r\n")
+        if line.lower().startswith(b"content-length")
+    )
+    await reader.readexactly(length)
+
+
+async def client(port: int, client_number: int, batch_size: int) -> None:
+    # One keep-alive connection per client
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    base = client_number * REQUESTS_PER_CLIENT
+    for offset in range(0, REQUESTS_PER_CLIENT, batch_size):
+        if batch_size == 1:
+            await request(reader, writer, "/reports", report(base + offset))
+        else:
+            await request(reader, writer, "/reports", [
+                report(base + offset + i) for i in range(batch_size)
+            ])
+    writer.close()
+
+
+async def run(batch_size: int) -> float:
+    server = ReportHttpServer(build_service(), port=0, max_concurrency=CLIENTS)
+    await server.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(client(server.port, number, batch_size) for number in range(CLIENTS)))
+    elapsed = time.perf_counter() - started
+    await server.stop()
+    return CLIENTS * REQUESTS_PER_CLIENT / elapsed
+
+
+print("=" * 60)
+print("🌐 HTTP ingestion benchmark (localhost, keep-alive)")
+print("=" * 60)
+print(f"Single reports:       {asyncio.run(run(1)):10.0f} reports/s")
+print(f"Batches of {BATCH_SIZE:3d}:       {asyncio.run(run(BATCH_SIZE)):10.0f} reports/s")
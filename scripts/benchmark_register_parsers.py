@@ -0,0 +1,60 @@
+import contextlib
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.register_parsers import available_parsers
+
+ROWS = 500_000
+BERLIN_SHARE = 0.1
+REPEATS = 3
+
+HEADER = (
+    "Betreiber;Straße;Hausnummer;Adresszusatz;Postleitzahl;Ort;Bundesland;"
+    "Kreis/kreisfreie Stadt;Breitengrad;Längengrad;Inbetriebnahmedatum;"
+    "Nennleistung Ladeeinrichtung [kW];Art der Ladeeinrichung;Anzahl Ladepunkte"
+)
+
+
+def write_register(path: Path, rows: int) -> None:
+    """Write a synthetic nationwide register with the real column layout"""
+    rng = random.Random(42)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(HEADER + "\n")
+        for number in range(rows):
+            if rng.random() < BERLIN_SHARE:
+                place = f"{rng.randint(10115, 14199)};Berlin;Berlin;Berlin"
+            else:
+                place = f"{rng.randint(20000, 99999)};Musterstadt;Bayern;Landkreis Muster"
+            # The register writes coordinates with a decimal comma
+            latitude = f"{rng.uniform(47, 55):.6f}".replace('.', ',')
+            longitude = f"{rng.uniform(6, 15):.6f}".replace('.', ',')
+            file.write(
+                f"Operator {number % 500};Teststraße {number % 5000};{number};;{place};"
+                f"{latitude};{longitude};01.01.2022;22,0;Normalladeeinrichtung;2\n"
+            )
+
+
+def bench(path: Path, parser_class) -> float:
+    loader = LadesaeulenregisterLoader(path, parser_class())
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        loader.load_berlin_stations()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+with tempfile.TemporaryDirectory() as directory:
+    path = Path(directory) / "Ladesaeulenregister.csv"
+    write_register(path, ROWS)
+    
+    print("=" * 60)
+    print(f"📑 Register parser benchmark ({ROWS:,} rows)")
+    print("=" * 60)
+    for name, parser_class in available_parsers().items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds = bench(path, parser_class)
+        print(f"{name:10s} {seconds:7.2f} s  {ROWS / seconds:12,.0f} rows/s")
@@ -0,0 +1,62 @@
+import random
+import time
+from uuid import uuid4
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from infrastructure.search.report_search_index import ReportSearchIndex
+
+REPORTS = 300_000
+STATIONS = 5_000
+REPEATS = 20
+
+PHRASES = [
+    "QR-Code lässt sich nicht scannen",
+    "Kartenleser reagiert nicht auf die Ladekarte",
+    "Ladesäule zeigt Fehler an und startet neu",
+    "Stecker klemmt im Fahrzeug",
+    "Display bleibt schwarz",
+    "Zahlung wurde abgebucht aber der Ladevorgang startet nicht",
+    "Ladekabel beschädigt, Isolierung offen",
+    "App zeigt die Station als frei, sie ist aber belegt",
+]
+QUERIES = ["QR code", "Kartenleser", "Ladesaeule Fehler", "Stecker klemmt", "Zahlung abgebucht"]
+
+
+def make_report(rng: random.Random) -> MalfunctionReport:
+    description = " ".join(rng.sample(PHRASES, 2))[:500]
+    return MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId.of(f"BERLIN-10178-{rng.randrange(STATIONS):06d}"),
+        malfunction_type=rng.choice(list(MalfunctionType)),
+        description=ReportDescription(description)
+    )
+
+
+def bench(index: ReportSearchIndex, **filters) -> float:
+    """Mean query time in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for query in QUERIES:
+            index.search(query, **filters)
+    return (time.perf_counter() - start) / (REPEATS * len(QUERIES)) * 1000
+
+
+rng = random.Random(42)
+reports = [make_report(rng) for _ in range(REPORTS)]
+index = ReportSearchIndex()
+start = time.perf_counter()
+for report in reports:
+    index.add(report)
+indexing = time.perf_counter() - start
+
+print("=" * 60)
+print(f"🔎 Report search benchmark ({REPORTS:,} reports)")
+print("=" * 60)
+print(f"Indexing:                 {indexing:8.2f} s")
+print(f"Query:                    {bench(index):8.2f} ms")
+print(f"Query, status filter:     {bench(index, status=ReportStatus.SUBMITTED):8.2f} ms")
+print(f"Query, station filter:    {bench(index, station_id=reports[0].station_id):8.2f} ms")
+print(f"Query, type filter:       {bench(index, malfunction_type=MalfunctionType.OTHER):8.2f} ms")
@@ -0,0 +1,48 @@
+import argparse
+from pathlib import Path
+from infrastructure.data.bulk_export import BulkExporter, available_formats
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.register_partitions import iter_partitioned_register
+from infrastructure.repositories.report_archive import ReportArchive
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Export stations and reports for BI tools",
+        epilog="Open reports live only in the running app; export them from its Network Stats tab."
+    )
+    parser.add_argument("output", type=Path, help="Directory for export files")
+    parser.add_argument("--format", dest="formats", action="append", choices=available_formats(),
+                        help="Output format, repeatable (default: csv)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--partitions", type=Path, default=None,
+                          help="Partitioned register with the persisted station state")
+    source.add_argument("--csv", type=Path, default=None,
+                          help="Register CSV; stations as freshly parsed, full export only")
+    parser.add_argument("--archive", type=Path, default=None, help="Report archive directory (finished reports)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only export records changed since the last export")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    if args.incremental and not args.partitions:
+        # Parsed register rows are all AVAILABLE and updated now, so every run would look changed
+        parser.error("--incremental needs --partitions; register CSV stations have no change history")
+    
+    exporter = BulkExporter(args.output, args.formats or ["csv"], args.chunk_size)
+    if args.partitions:
+        stations = iter_partitioned_register(args.partitions)
+    else:
+        stations = LadesaeulenregisterLoader(args.csv).iter_berlin_stations()
+    results = [exporter.export_stations(stations, args.incremental)]
+    if args.archive:
+        results.append(exporter.export_reports(
+            ReportArchive(args.archive).iter_reports(), args.incremental
+        ))
+    
+    for result in results:
+        files = ", ".join(path.name for path in result.files)
+        print(f"📤 Exported {result.rows} {result.kind}: {files}")
+
+
+if __name__ == "__main__":
+    main()
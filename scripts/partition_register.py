@@ -0,0 +1,23 @@
+import argparse
+from pathlib import Path
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.register_partitions import DEFAULT_PREFIX_LENGTH, write_partitioned_register
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the register as postal-code partitions")
+    parser.add_argument("output", type=Path, help="Directory for partition files and manifest")
+    parser.add_argument("--csv", type=Path, default=None, help="Register CSV to ingest")
+    parser.add_argument("--prefix-length", type=int, default=DEFAULT_PREFIX_LENGTH)
+    args = parser.parse_args()
+    
+    stations = LadesaeulenregisterLoader(args.csv).load_berlin_stations()
+    manifest = write_partitioned_register(stations, args.output, args.prefix_length)
+    print(
+        f"🗂️ Wrote {manifest.total_stations} stations into "
+        f"{len(manifest.partitions)} partitions in {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
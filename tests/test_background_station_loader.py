@@ -0,0 +1,79 @@
+import threading
+from domain.value_objects.station_id import StationId
+from infrastructure.data.background_station_loader import BackgroundStationLoader
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader, stable_station_id
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+HEADER = "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad"
+
+
+def write_register(path, count):
+    """Write a synthetic Berlin register with count stations"""
+    rows = [f"Operator;Teststraße;{number};10178;Berlin;Berlin;52,52;13,41" for number in range(count)]
+    path.write_text("\n".join([HEADER] + rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_loads_all_stations_in_batches(tmp_path):
+    """Test the repository is filled batch by batch in the background"""
+    repository = ColumnarChargingStationRepository()
+    batches = []
+    warmup = BackgroundStationLoader(
+        LadesaeulenregisterLoader(write_register(tmp_path / "register.csv", 25)),
+        repository,
+        batch_size=10,
+        on_batch=lambda batch: batches.append(len(batch)),
+        expected_total=25
+    ).start()
+    
+    assert warmup.wait(timeout=5)
+    
+    progress = warmup.progress()
+    assert progress.done and progress.error is None
+    assert progress.loaded == 25
+    assert progress.fraction == 1.0
+    assert batches == [10, 10, 5]
+    assert len(repository.find_all()) == 25
+    assert repository.exists(StationId.of(stable_station_id("10178", "Teststraße", "24")))
+
+
+def test_partial_results_are_visible_while_loading(tmp_path):
+    """Test stations of finished batches can be found before loading ends"""
+    repository = ColumnarChargingStationRepository()
+    first_batch_saved = threading.Event()
+    resume = threading.Event()
+    
+    def pause_after_first_batch(batch):
+        first_batch_saved.set()
+        resume.wait(timeout=5)
+    
+    warmup = BackgroundStationLoader(
+        LadesaeulenregisterLoader(write_register(tmp_path / "register.csv", 20)),
+        repository,
+        batch_size=10,
+        on_batch=pause_after_first_batch,
+        expected_total=20
+    ).start()
+    
+    assert first_batch_saved.wait(timeout=5)
+    assert not warmup.done
+    assert warmup.progress().fraction == 0.5
+    assert len(repository.find_all()) == 10
+    
+    resume.set()
+    assert warmup.wait(timeout=5)
+    assert len(repository.find_all()) == 20
+
+
+def test_errors_are_reported(tmp_path):
+    """Test a failing load finishes with the error in its progress"""
+    path = write_register(tmp_path / "register.csv", 1)
+    loader = LadesaeulenregisterLoader(path)
+    path.unlink()
+    
+    warmup = BackgroundStationLoader(loader, ColumnarChargingStationRepository()).start()
+    
+    assert warmup.wait(timeout=5)
+    assert isinstance(warmup.progress().error, FileNotFoundError)
@@ -0,0 +1,102 @@
+import struct
+import numpy as np
+import pytest
+from infrastructure.data.shapefile import read_shapefile
+from infrastructure.geometry import boundary_geometry
+from infrastructure.geometry.boundary_geometry import BoundaryGeometry
+from infrastructure.geometry.projection import utm_to_wgs84
+
+# A wavy border between two districts, running north along 13.4
+BORDER = [(13.4 + 0.001 * np.sin(i / 3), 52.45 + i * 0.001) for i in range(101)]
+# Rings as in the register shapefiles: clockwise, closed
+WEST = [BORDER[0], (13.3, 52.45), (13.3, 52.55)] + BORDER[::-1]
+EAST = BORDER + [(13.5, 52.55), (13.5, 52.45), BORDER[0]]
+
+
+def write_shapefile(path, rings, names):
+    """Write a minimal polygon shapefile with a name attribute"""
+    records = b""
+    for number, ring in enumerate(rings, 1):
+        points = np.array(ring, dtype='<f8')
+        content = struct.pack('<i4dii', 5, *points.min(axis=0), *points.max(axis=0), 1, len(points))
+        content += struct.pack('<i', 0) + points.tobytes()
+        records += struct.pack('>ii', number, len(content) // 2) + content
+    header = struct.pack('>i', 9994) + bytes(20) + struct.pack('>i', (100 + len(records)) // 2)
+    header += struct.pack('<ii4d', 1000, 5, 13.3, 52.45, 13.5, 52.55) + bytes(32)
+    path.write_bytes(header + records)
+    
+    field = b"name".ljust(11, b"\0") + b"C" + bytes(4) + bytes([20, 0]) + bytes(14)
+    dbf = struct.pack('<B3BIHH', 3, 124, 1, 1, len(names), 32 + 32 + 1, 1 + 20) + bytes(20)
+    dbf += field + b"\r"
+    for name in names:
+        dbf += b" " + name.encode('utf-8').ljust(20)
+    path.with_suffix('.dbf').write_bytes(dbf + b"\x1a")
+    return path
+
+
+@pytest.fixture
+def shapefile(tmp_path):
+    return write_shapefile(tmp_path / "bezirke.shp", [WEST, EAST], ["Westend", "Ostend"])
+
+
+def border_vertices(feature):
+    """Vertices of a feature on the shared border strip"""
+    ring = feature['geometry']['coordinates'][0]
+    return {tuple(point) for point in ring if abs(point[0] - 13.4) < 0.0015}
+
+
+def test_reads_polygons_and_attributes(shapefile):
+    """Test the shapefile reader returns rings with their attributes"""
+    records = read_shapefile(shapefile)
+    
+    assert [record.attributes["name"] for record in records] == ["Westend", "Ostend"]
+    assert len(records[0].rings) == 1
+    np.testing.assert_allclose(records[1].rings[0][0], BORDER[0])
+
+
+def test_levels_simplify_and_keep_shared_borders(shapefile, tmp_path):
+    """Test coarser levels have fewer points and neighbours share identical borders"""
+    geometry = BoundaryGeometry(shapefile, "name", tolerances=(0, 10, 50), cache_dir=tmp_path / "cache")
+    
+    counts = [geometry.point_count(level) for level in range(3)]
+    
+    assert counts[0] == len(WEST) + len(EAST)
+    assert counts[0] > counts[1] > counts[2]
+    for level in range(3):
+        west, east = geometry.geojson(level)['features']
+        assert west['properties'] == {"name": "Westend"}
+        assert border_vertices(west) == border_vertices(east)
+        assert len(border_vertices(west)) >= 2
+
+
+def test_levels_are_cached_on_disk(shapefile, tmp_path, monkeypatch):
+    """Test a second instance reads the cache instead of the shapefile"""
+    cache_dir = tmp_path / "cache"
+    expected = BoundaryGeometry(shapefile, "name", cache_dir=cache_dir).geojson(2)
+    
+    def fail(path):
+        raise AssertionError("shapefile read again")
+    monkeypatch.setattr(boundary_geometry, "read_shapefile", fail)
+    
+    assert BoundaryGeometry(shapefile, "name", cache_dir=cache_dir).geojson(2) == expected
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_level_for_zoom_stays_within_a_pixel(shapefile):
+    """Test the chosen tolerance never exceeds one pixel"""
+    geometry = BoundaryGeometry(shapefile, tolerances=(0, 5, 25, 100, 400), cache_dir=None)
+    
+    assert geometry.level_for_zoom(18) == 0
+    assert geometry.level_for_zoom(10) == 2
+    assert geometry.level_for_zoom(5) == 4
+
+
+def test_utm_to_wgs84():
+    """Test UTM zone 33N conversion at the central meridian and in Berlin"""
+    longitude, latitude = utm_to_wgs84(np.array([500000.0, 389913.0]), np.array([0.0, 5819717.0]), 33)
+    
+    assert longitude[0] == pytest.approx(15.0)
+    assert latitude[0] == pytest.approx(0.0)
+    # Brandenburger Tor
+    assert longitude[1] == pytest.approx(13.3777, abs=1e-3)
+    assert latitude[1] == pytest.approx(52.5163, abs=1e-3)
@@ -0,0 +1,125 @@
+import csv
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from infrastructure.data.bulk_export import BulkExporter, available_formats
+from infrastructure.data.register_partitions import iter_partitioned_register, write_partitioned_register
+from infrastructure.repositories.partitioned_charging_station_repository import (
+    PartitionedChargingStationRepository
+)
+
+LOADED_AT = datetime(2024, 6, 1, 8, 0)
+
+
+def make_stations(count):
+    return [
+        ChargingStation(
+            station_id=StationId(f"STATION-{number:03d}"),
+            name="Test Operator",
+            postal_code="10178",
+            latitude=52.52 if number % 2 else None,
+            longitude=13.41 if number % 2 else None,
+            created_at=LOADED_AT
+        )
+        for number in range(count)
+    ]
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8", newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_full_export_streams_stations_in_chunks(tmp_path):
+    """Test every station is exported with its status"""
+    stations = make_stations(25)
+    stations[3].mark_as_defective()
+    
+    result = BulkExporter(tmp_path, chunk_size=10).export_stations(iter(stations))
+    
+    rows = read_csv(result.files[0])
+    assert result.rows == 25 and len(rows) == 25
+    assert rows[3]["status"] == "defective"
+    assert rows[0]["latitude"] == "" and rows[1]["latitude"] == "52.52"
+    assert result.files[0].name.startswith("stations-full-")
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_incremental_export_only_writes_changes(tmp_path):
+    """Test a second, incremental export only contains updated stations"""
+    stations = make_stations(5)
+    exporter = BulkExporter(tmp_path)
+    exporter.export_stations(stations)
+    assert exporter.watermark("stations") == LOADED_AT
+    
+    stations[2].mark_as_defective()
+    changes = exporter.export_stations(stations, incremental=True)
+    nothing = exporter.export_stations(stations, incremental=True)
+    
+    assert [row["station_id"] for row in read_csv(changes.files[0])] == ["STATION-002"]
+    assert nothing.rows == 0
+    assert exporter.watermark("stations") == stations[2].updated_at
+
+
+def test_incremental_export_from_persisted_partitions(tmp_path):
+    """Test status changes persisted in a partitioned register are exported as changes"""
+    register = tmp_path / "register"
+    write_partitioned_register(make_stations(5), register)
+    exporter = BulkExporter(tmp_path / "export")
+    exporter.export_stations(iter_partitioned_register(register))
+    
+    repository = PartitionedChargingStationRepository(register)
+    station = repository.find_by_id(StationId("STATION-004"))
+    station.mark_as_defective()
+    repository.save(station)
+    repository.flush()
+    changes = exporter.export_stations(iter_partitioned_register(register), incremental=True)
+    
+    rows = read_csv(changes.files[0])
+    assert [(row["station_id"], row["status"]) for row in rows] == [("STATION-004", "defective")]
+
+
+def test_reports_include_resolution_data(tmp_path):
+    """Test reports are exported with ticket and time to resolve"""
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all"),
+        created_at=datetime.now() - timedelta(hours=2)
+    )
+    report.validate(station_exists=True, station_is_operational=True)
+    report.create_ticket(uuid4())
+    report.resolve()
+    
+    result = BulkExporter(tmp_path).export_reports([report])
+    
+    row = read_csv(result.files[0])[0]
+    assert row["ticket_id"] == str(report.ticket_id)
+    assert row["status"] == "resolved"
+    assert float(row["time_to_resolve_seconds"]) == pytest.approx(7200, abs=5)
+
+
+def test_columnar_formats(tmp_path):
+    """Test Parquet and Arrow exports when pyarrow is installed"""
+    pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+    
+    result = BulkExporter(tmp_path, formats=["parquet", "arrow"], chunk_size=4).export_stations(make_stations(10))
+    
+    parquet, arrow = result.files
+    assert pyarrow.parquet.read_table(parquet).num_rows == 10
+    assert pyarrow.ipc.open_file(arrow).read_all().column("station_id").to_pylist()[0] == "STATION-000"
+
+
+def test_unavailable_formats_are_rejected(tmp_path):
+    """Test asking for an unknown format fails before writing anything"""
+    with pytest.raises(ValueError):
+        BulkExporter(tmp_path, formats=["xlsx"])
+    assert "csv" in available_formats()
@@ -0,0 +1,131 @@
+from uuid import uuid4
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.caching_repositories import (
+    LruTtlCache, CachingChargingStationRepository, CachingMalfunctionReportRepository
+)
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+
+class FakeClock:
+    """Manually advanced time source"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class CountingStationRepository(InMemoryChargingStationRepository):
+    """In-memory repository counting backend lookups"""
+    
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+    
+    def find_by_id(self, station_id):
+        self.lookups += 1
+        return super().find_by_id(station_id)
+
+
+def make_station(number):
+    return ChargingStation(
+        station_id=StationId(f"STATION-{number:03d}"),
+        name="Test Operator",
+        postal_code="10178"
+    )
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    """Test LRU bound and TTL expiry with statistics"""
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=2, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    
+    assert cache.get("b") is None
+    clock.now = 11.0
+    assert cache.get("a") is None
+    
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (1, 2, 1, 1)
+    assert stats.size == 1
+    assert stats.hit_ratio == 1 / 3
+
+
+def test_stale_fill_is_not_cached_after_invalidation():
+    """Test a value read before an invalidation is not cached"""
+    cache = LruTtlCache()
+    version = cache.version
+    cache.invalidate("a")
+    
+    cache.put("a", "stale", if_version=version)
+    
+    assert cache.get("a") is None
+
+
+def test_station_lookups_hit_the_cache():
+    """Test repeated find_by_id and exists go to the backend once"""
+    backend = CountingStationRepository()
+    backend.save(make_station(1))
+    repository = CachingChargingStationRepository(backend)
+    
+    for _ in range(5):
+        assert repository.find_by_id(StationId("STATION-001")) is not None
+    assert repository.exists(StationId("STATION-001"))
+    
+    assert backend.lookups == 1
+    assert repository.cache.stats().hits == 5
+
+
+def test_station_save_and_delete_invalidate():
+    """Test writes go through to the backend and drop cached entries"""
+    backend = ColumnarChargingStationRepository()
+    repository = CachingChargingStationRepository(backend)
+    repository.save(make_station(1))
+    repository.find_by_id(StationId("STATION-001"))
+    
+    replacement = make_station(1)
+    replacement.mark_as_defective()
+    repository.save(replacement)
+    
+    assert repository.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+    repository.delete(StationId("STATION-001"))
+    assert not repository.exists(StationId("STATION-001"))
+    # Other methods of the wrapped repository stay available
+    assert repository.health_percentage() == 100.0
+
+
+def test_report_cache_invalidates_on_save():
+    """Test reports are cached by ID and refreshed after save"""
+    repository = CachingMalfunctionReportRepository(InMemoryMalfunctionReportRepository())
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all")
+    )
+    repository.save(report)
+    
+    assert repository.find_by_id(report.report_id) is report
+    assert repository.find_by_id(report.report_id) is report
+    assert repository.cache.stats().hits == 1
+    
+    repository.delete(report.report_id)
+    assert repository.find_by_id(report.report_id) is None
+    assert repository.find_by_station(StationId("STATION-001")) == []
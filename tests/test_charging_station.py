@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime
 from domain.entities.charging_station import ChargingStation
 from domain.value_objects.station_id import StationId
 from domain.enums.station_status import StationStatus
@@ -50,4 +51,33 @@ class TestChargingStation:
         station.mark_as_available()
         
         assert station.status == StationStatus.AVAILABLE
-        assert station.is_operational is True
\ No newline at end of file
+        assert station.is_operational is True
+    
+    def test_station_has_no_instance_dict(self):
+        """Test that stations use slots instead of a per-instance __dict__"""
+        station = ChargingStation(
+            station_id=StationId("STATION-001"),
+            name="Test Station",
+            postal_code="10178"
+        )
+        
+        assert not hasattr(station, "__dict__")
+    
+    def test_stations_share_batch_creation_timestamp(self):
+        """Test that a load batch can share one creation timestamp"""
+        loaded_at = datetime(2024, 1, 1, 12, 0)
+        station1 = ChargingStation(
+            station_id=StationId("STATION-001"),
+            name="Station 1",
+            postal_code="10178",
+            created_at=loaded_at
+        )
+        station2 = ChargingStation(
+            station_id=StationId("STATION-002"),
+            name="Station 2",
+            postal_code="10178",
+            created_at=loaded_at
+        )
+        
+        assert station1._created_at is station2._created_at
+        assert station1._updated_at is loaded_at
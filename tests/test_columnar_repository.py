@@ -0,0 +1,166 @@
+import threading
+import pytest
+import numpy as np
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+
+class TestColumnarChargingStationRepository:
+    """Test NumPy column-backed implementation of station repository"""
+    
+    @pytest.fixture
+    def repository(self):
+        """Create a small repository that has to grow while saving"""
+        repository = ColumnarChargingStationRepository(initial_capacity=2)
+        stations = [
+            ("STATION-001", "Operator A", "10178", 52.52, 13.41),
+            ("STATION-002", "Operator A", "10178", None, None),
+            ("STATION-003", "Operator B", "10785", 52.50, 13.37),
+            ("STATION-004", "Operator B", "01067", 51.05, 13.74),
+        ]
+        for station_id, name, postal_code, lat, lon in stations:
+            repository.save(ChargingStation(
+                station_id=StationId(station_id),
+                name=name,
+                postal_code=postal_code,
+                address="Teststraße 1",
+                latitude=lat,
+                longitude=lon
+            ))
+        return repository
+    
+    def test_find_by_id_returns_view_with_same_properties(self, repository):
+        """Test that views expose the saved station data"""
+        station = repository.find_by_id(StationId("STATION-004"))
+        
+        assert station.station_id == StationId("STATION-004")
+        assert station.name == "Operator B"
+        assert station.postal_code == "01067"
+        assert station.address == "Teststraße 1"
+        assert station.latitude == 51.05
+        assert station.status == StationStatus.AVAILABLE
+        assert repository.find_by_id(StationId("NONEXISTENT")) is None
+    
+    def test_missing_coordinates_stay_none(self, repository):
+        """Test that unknown coordinates round-trip as None"""
+        station = repository.find_by_id(StationId("STATION-002"))
+        
+        assert station.latitude is None
+        assert station.longitude is None
+    
+    def test_view_transitions_write_through(self, repository):
+        """Test that domain transitions on a view update the columns"""
+        station = repository.find_by_id(StationId("STATION-001"))
+        station.mark_as_defective()
+        repository.save(station)
+        
+        reloaded = repository.find_by_id(StationId("STATION-001"))
+        assert reloaded.status == StationStatus.DEFECTIVE
+        assert reloaded.is_operational is False
+        with pytest.raises(ValueError):
+            reloaded.mark_as_defective()
+    
+    def test_find_by_postal_code(self, repository):
+        """Test finding stations by postal code"""
+        stations = repository.find_by_postal_code("10178")
+        
+        assert {s.station_id.value for s in stations} == {"STATION-001", "STATION-002"}
+        assert repository.find_by_postal_code("1017") == []
+        assert repository.find_by_postal_code("Berlin") == []
+    
+    def test_malformed_postal_codes_are_skipped_in_batches(self, repository):
+        """Test one malformed postal code does not abort the rest of a batch"""
+        repository.save_many([
+            ChargingStation(StationId("STATION-005"), "Operator C", "1017"),
+            ChargingStation(StationId("STATION-006"), "Operator C", "12043"),
+        ])
+        
+        assert repository.find_by_id(StationId("STATION-005")) is None
+        assert repository.find_by_id(StationId("STATION-006")).postal_code == "12043"
+        with pytest.raises(ValueError):
+            repository.save(ChargingStation(StationId("STATION-007"), "Operator C", "1017"))
+        assert not repository.exists(StationId("STATION-007"))
+    
+    def test_bulk_queries(self, repository):
+        """Test vectorized whole-network queries"""
+        repository.find_by_id(StationId("STATION-001")).mark_as_defective()
+        repository.find_by_id(StationId("STATION-003")).mark_as_defective()
+        
+        defective = repository.find_by_status_in_postal_codes(
+            StationStatus.DEFECTIVE, ["10178", "01067"]
+        )
+        counts = repository.count_by_status()
+        
+        assert [s.station_id.value for s in defective] == ["STATION-001"]
+        assert counts[StationStatus.DEFECTIVE] == 2
+        assert counts[StationStatus.AVAILABLE] == 2
+        assert repository.health_percentage() == 50.0
+        assert repository.coordinates().shape == (3, 2)
+        np.testing.assert_array_equal(
+            repository.coordinates(operational_only=True), [[51.05, 13.74]]
+        )
+    
+    def test_reads_during_background_load(self):
+        """Test lock-free reads stay consistent while another thread appends"""
+        repository = ColumnarChargingStationRepository(initial_capacity=16)
+        errors = []
+        
+        def load():
+            for number in range(20_000):
+                repository.save(ChargingStation(
+                    station_id=StationId(f"STATION-{number}"),
+                    name="Test Operator",
+                    postal_code="10178",
+                    latitude=52.52,
+                    longitude=13.41
+                ))
+        
+        writer = threading.Thread(target=load)
+        writer.start()
+        try:
+            while writer.is_alive():
+                columns = repository.columns()
+                assert len({len(column) for column in columns.values()}) == 1
+                assert not (columns['postal_code'] == 0).any()
+                assert repository.health_percentage() == 100.0
+                assert sum(repository.count_by_status().values()) >= len(columns['status'])
+                assert len(repository.coordinates(operational_only=True)) >= len(columns['status'])
+                repository.find_by_postal_code("10178")
+        except Exception as error:
+            errors.append(error)
+        finally:
+            writer.join()
+        
+        assert errors == []
+        assert len(repository.find_by_postal_code("10178")) == 20_000
+    
+    def test_status_change_while_columns_grow_is_kept(self):
+        """Test a status flip from another thread cannot land in a column that is being replaced"""
+        class GrowthObservingRepository(ColumnarChargingStationRepository):
+            on_status_swap = None
+            
+            def __setattr__(self, name, value):
+                if name == '_status' and self.on_status_swap is not None:
+                    self.on_status_swap()
+                super().__setattr__(name, value)
+        
+        repository = GrowthObservingRepository(initial_capacity=1)
+        repository.save(ChargingStation(StationId("STATION-001"), "Test Operator", "10178"))
+        view = repository.find_by_id(StationId("STATION-001"))
+        flip = threading.Thread(target=view.mark_as_defective)
+        
+        def flip_between_copy_and_swap():
+            repository.on_status_swap = None
+            flip.start()
+            flip.join(timeout=0.2)
+        
+        repository.on_status_swap = flip_between_copy_and_swap
+        repository.save(ChargingStation(StationId("STATION-002"), "Test Operator", "10178"))
+        flip.join()
+        
+        assert view.status == StationStatus.DEFECTIVE
+        assert repository.status_version == 3
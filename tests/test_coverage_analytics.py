@@ -0,0 +1,64 @@
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from infrastructure.analytics.coverage_analytics import CoverageAnalytics
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+
+@pytest.fixture
+def repository():
+    """Three stations in Mitte, one in Neukölln"""
+    repository = ColumnarChargingStationRepository()
+    for number, postal_code in enumerate(["10178", "10178", "10115", "12043"]):
+        repository.save(ChargingStation(
+            station_id=StationId(f"STATION-{number:03d}"),
+            name="Test Station",
+            postal_code=postal_code
+        ))
+    return repository
+
+
+@pytest.fixture
+def analytics(repository):
+    """Analytics with population for all areas and one PLZ without stations"""
+    return CoverageAnalytics(
+        repository,
+        population={"10178": 10000, "10115": 20000, "12043": 40000, "12045": 10000},
+        districts={"10178": "Mitte", "10115": "Mitte", "12043": "Neukölln", "12045": "Neukölln"}
+    )
+
+
+def test_coverage_per_postal_code(analytics):
+    """Test stations per capita and ranking per PLZ"""
+    rows = analytics.per_postal_code()
+    
+    assert [row.area for row in rows] == ["10178", "10115", "12043", "12045"]
+    assert rows[0].stations == 2
+    assert rows[0].stations_per_10k == pytest.approx(2.0)
+    assert rows[3].stations == 0
+    assert [row.rank for row in rows] == [1, 2, 3, 4]
+
+
+def test_coverage_per_district(analytics):
+    """Test PLZ results are aggregated per district"""
+    rows = analytics.per_district()
+    
+    assert [row.area for row in rows] == ["Mitte", "Neukölln"]
+    assert rows[0].stations == 3
+    assert rows[0].population == 30000
+    assert rows[1].stations_per_10k == pytest.approx(0.2)
+
+
+def test_cache_is_invalidated_on_status_change(repository, analytics):
+    """Test results are cached until a station changes status"""
+    first = analytics.per_postal_code()
+    assert analytics.per_postal_code() is first
+    
+    repository.find_by_id(StationId("STATION-003")).mark_as_defective()
+    rows = {row.area: row for row in analytics.per_postal_code()}
+    
+    assert rows["12043"].defective == 1
+    assert rows["12043"].defective_share == 1.0
+    assert analytics.per_district()[1].defective_share == 1.0
@@ -0,0 +1,99 @@
+import struct
+import numpy as np
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from infrastructure.analytics.coverage_gap_raster import (
+    CoverageGapRaster, BERLIN_BOUNDS, berlin_bounds
+)
+from infrastructure.data.shapefile import BoundingBox
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+BOUNDS = BoundingBox(min_x=13.30, min_y=52.45, max_x=13.50, max_y=52.55)
+LOCATIONS = [(52.46, 13.32), (52.50, 13.40), (52.54, 13.48), (52.52, 13.35)]
+
+
+@pytest.fixture
+def repository():
+    """Columnar repository with four stations spread over the bounds"""
+    repository = ColumnarChargingStationRepository()
+    for number, (latitude, longitude) in enumerate(LOCATIONS):
+        repository.save(ChargingStation(
+            station_id=StationId(f"STATION-{number:03d}"),
+            name="Test Operator",
+            postal_code="10178",
+            latitude=latitude,
+            longitude=longitude
+        ))
+    return repository
+
+
+def set_defective(repository, number):
+    station = repository.find_by_id(StationId(f"STATION-{number:03d}"))
+    station.mark_as_defective()
+    repository.save(station)
+    return station
+
+
+def test_distances_match_brute_force(repository):
+    """Test every cell holds the distance to its nearest station"""
+    raster = CoverageGapRaster(repository, BOUNDS, cell_size=500)
+    grid = raster.grid()
+    
+    centers = grid.cell_centers()
+    meters_per_lon = 111_195.0 * np.cos(np.radians(52.5))
+    expected = np.min([
+        np.hypot((centers[:, 1] - lon) * meters_per_lon, (centers[:, 0] - lat) * 111_195.0)
+        for lat, lon in LOCATIONS
+    ], axis=0)
+    
+    assert grid.distances.shape == (23, 28)
+    np.testing.assert_allclose(grid.distances.ravel(), expected, rtol=1e-6, atol=1e-6)
+    assert raster.distance_at(52.50, 13.40) < 500
+    assert raster.distance_at(60.0, 13.40) is None
+
+
+def test_incremental_updates_match_full_rebuild(repository):
+    """Test status events give the same raster as recomputing from scratch"""
+    raster = CoverageGapRaster(repository, BOUNDS, cell_size=500)
+    bus = InProcessEventBus()
+    raster.subscribe(bus)
+    
+    station = set_defective(repository, 1)
+    bus.publish_all(station.pull_events())
+    after_defect = raster.grid().distances
+    np.testing.assert_array_equal(
+        after_defect, CoverageGapRaster(repository, BOUNDS, cell_size=500).grid().distances
+    )
+    assert raster.distance_at(52.50, 13.40) > 2000
+    
+    station.mark_as_available()
+    repository.save(station)
+    bus.publish_all(station.pull_events())
+    np.testing.assert_array_equal(
+        raster.grid().distances,
+        CoverageGapRaster(repository, BOUNDS, cell_size=500).grid().distances
+    )
+
+
+def test_no_operational_station_means_infinite_distance(repository):
+    """Test cells are unreachable when every station is defective"""
+    raster = CoverageGapRaster(repository, BOUNDS, cell_size=1000)
+    for number in range(len(LOCATIONS)):
+        raster.station_defective(set_defective(repository, number).station_id)
+    
+    assert np.isinf(raster.grid().distances).all()
+
+
+def test_bounds_come_from_shapefile_header(tmp_path):
+    """Test the district shapefile header provides the raster bounds"""
+    path = tmp_path / "bezirksgrenzen.shp"
+    header = struct.pack('>i', 9994) + bytes(20) + struct.pack('>i', 50)
+    header += struct.pack('<ii', 1000, 5) + struct.pack('<4d', *BOUNDS) + bytes(32)
+    path.write_bytes(header)
+    
+    assert berlin_bounds(path) == BOUNDS
+    assert berlin_bounds(tmp_path / "missing.shp") == BERLIN_BOUNDS
@@ -0,0 +1,107 @@
+import threading
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.malfunction_type import MalfunctionType
+from domain.events.domain_events import (
+    DomainEvent, StationMarkedDefective, StationMarkedAvailable, TicketCreated, ReportResolved
+)
+from domain.services.malfunction_report_service import MalfunctionReportService
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+
+def make_station():
+    return ChargingStation(
+        station_id=StationId("STATION-001"),
+        name="Test Station",
+        postal_code="10178"
+    )
+
+
+def test_state_changes_record_events():
+    """Test entities record one event per transition until pulled"""
+    station = make_station()
+    assert station.pull_events() == []
+    
+    station.mark_as_defective()
+    station.mark_as_available()
+    
+    events = station.pull_events()
+    assert [type(e) for e in events] == [StationMarkedDefective, StationMarkedAvailable]
+    assert events[0].station_id == station.station_id
+    assert events[0].postal_code == "10178"
+    assert station.pull_events() == []
+
+
+def test_service_publishes_workflow_events():
+    """Test processing and resolving publish events in order, also for columnar views"""
+    station_repo = ColumnarChargingStationRepository()
+    station_repo.save(make_station())
+    bus = InProcessEventBus()
+    received = []
+    bus.subscribe(DomainEvent, received.append)
+    service = MalfunctionReportService(
+        InMemoryMalfunctionReportRepository(), station_repo, event_publisher=bus
+    )
+    
+    report_id = service.submit_malfunction_report(
+        "STATION-001", MalfunctionType.NOT_CHARGING, "Vehicle not charging at all"
+    )
+    result = service.process_malfunction_report(report_id)
+    service.resolve_malfunction(result.ticket_id)
+    
+    assert [type(e) for e in received] == [
+        TicketCreated, StationMarkedDefective, ReportResolved, StationMarkedAvailable
+    ]
+    assert received[0].ticket_id == result.ticket_id
+    assert received[2].report_id == report_id
+
+
+def test_subscribers_by_type_and_failing_handlers():
+    """Test handlers only get their event types and errors stay with the bus"""
+    bus = InProcessEventBus()
+    defective = []
+    
+    def broken(event):
+        raise RuntimeError("handler bug")
+    
+    bus.subscribe(StationMarkedDefective, broken)
+    bus.subscribe(StationMarkedDefective, defective.append)
+    station = make_station()
+    station.mark_as_defective()
+    station.mark_as_available()
+    
+    bus.publish_all(station.pull_events())
+    
+    assert len(defective) == 1
+
+
+def test_batched_subscriber_receives_events_in_batches():
+    """Test batched subscribers get all events on a worker thread"""
+    bus = InProcessEventBus()
+    batches = []
+    threads = set()
+    
+    def handle(batch):
+        threads.add(threading.current_thread().name)
+        batches.append(batch)
+    
+    bus.subscribe_batched(StationMarkedDefective, handle, max_batch=4, max_delay=0.05)
+    events = []
+    for number in range(10):
+        station = ChargingStation(StationId(f"STATION-{number:03d}"), "Test", "10178")
+        station.mark_as_defective()
+        events.extend(station.pull_events())
+    
+    bus.publish_all(events)
+    assert bus.flush(timeout=5)
+    bus.close()
+    
+    assert [e for batch in batches for e in batch] == events
+    assert all(len(batch) <= 4 for batch in batches)
+    assert threads == {"event-subscriber"}
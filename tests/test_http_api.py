@@ -0,0 +1,224 @@
+import asyncio
+import json
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from domain.services.malfunction_report_service import MalfunctionReportService
+from infrastructure.api.http_server import ReportHttpServer
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+
+@pytest.fixture
+def service():
+    """Create service with two test stations"""
+    station_repo = InMemoryChargingStationRepository()
+    for station_id in ("STATION-001", "STATION-002"):
+        station_repo.save(ChargingStation(
+            station_id=StationId(station_id),
+            name="Test Charging Station",
+            postal_code="10178"
+        ))
+    return MalfunctionReportService(InMemoryMalfunctionReportRepository(), station_repo)
+
+
+class Client:
+    """Minimal HTTP/1.1 client reusing one keep-alive connection"""
+    
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+    
+    async def send(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await self.writer.drain()
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode()
+        status = int(head.split(" ")[1])
+        length = int(head.lower().split("content-length:")[1].split("\r\n")[0])
+        return status, json.loads(await self.reader.readexactly(length))
+
+
+def run_with_client(service, scenario):
+    """Start a server on a free port and run a scenario against it"""
+    async def main():
+        server = ReportHttpServer(service, port=0, max_concurrency=4)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            await scenario(Client(reader, writer))
+            writer.close()
+        finally:
+            await server.stop()
+    asyncio.run(main())
+
+
+def test_submit_process_and_resolve_over_one_connection(service):
+    """Test the full workflow over a single keep-alive connection"""
+    async def scenario(client):
+        status, body = await client.send("POST", "/reports", {
+            "station_id": "STATION-001",
+            "malfunction_type": "payment_failure",
+            "description": "Payment terminal completely unresponsive"
+        })
+        assert status == 201
+        report_id = body["report_id"]
+        
+        status, result = await client.send("POST", f"/reports/{report_id}/process")
+        assert status == 200
+        assert result["success"] is True
+        
+        status, report = await client.send("GET", f"/reports/{report_id}")
+        assert report["status"] == "ticket_created"
+        
+        status, _ = await client.send("POST", f"/tickets/{result['ticket_id']}/resolve", {
+            "operator_notes": "Terminal replaced"
+        })
+        assert status == 200
+        
+        status, reports = await client.send("GET", "/reports?station_id=STATION-001")
+        assert [r["status"] for r in reports] == ["resolved"]
+    
+    run_with_client(service, scenario)
+    station = service._station_repository.find_by_id(StationId("STATION-001"))
+    assert station.status == StationStatus.AVAILABLE
+
+
+def test_batch_submit_reports_each_item(service):
+    """Test a batch is handled in one request with per-item results"""
+    async def scenario(client):
+        status, results = await client.send("POST", "/reports", [
+            {
+                "station_id": "STATION-001",
+                "malfunction_type": "not_charging",
+                "description": "Firmware self-test failed",
+                "process": True
+            },
+            {
+                "station_id": "STATION-002",
+                "malfunction_type": "not_charging",
+                "description": "Bad"
+            },
+            {
+                "station_id": "STATION-002",
+                "malfunction_type": "teleported",
+                "description": "Station moved somewhere else"
+            },
+        ])
+        assert status == 207
+        assert results[0]["success"] is True
+        assert "too short" in results[1]["error"]
+        assert "Unknown malfunction type" in results[2]["error"]
+    
+    run_with_client(service, scenario)
+
+
+def test_errors_are_reported_as_json(service):
+    """Test unknown routes and IDs produce JSON errors"""
+    async def scenario(client):
+        status, body = await client.send("GET", "/unknown")
+        assert status == 404
+        assert "No route" in body["error"]
+        
+        status, body = await client.send("POST", "/reports/not-a-uuid/process")
+        assert status == 400
+        
+        status, body = await client.send("GET", "/health")
+        assert status == 200
+    
+    run_with_client(service, scenario)
+
+
+def test_wrong_field_types_are_rejected_per_item(service):
+    """Test non-string fields give a 400 instead of dropping the connection"""
+    async def scenario(client):
+        status, results = await client.send("POST", "/reports", [
+            {"station_id": 123, "malfunction_type": "not_charging", "description": "Firmware self-test failed"},
+            {"station_id": "STATION-001", "malfunction_type": "not_charging", "description": 123},
+            {"station_id": "STATION-002", "malfunction_type": "not_charging", "description": "Firmware self-test failed"},
+        ])
+        assert status == 207
+        assert "station_id must be a string" in results[0]["error"]
+        assert "description must be a string" in results[1]["error"]
+        assert "report_id" in results[2]
+        
+        status, body = await client.send("POST", "/reports", {
+            "station_id": "STATION-001", "malfunction_type": "not_charging", "description": ["list"]
+        })
+        assert status == 400
+    
+    run_with_client(service, scenario)
+
+
+def test_negative_content_length_is_rejected(service):
+    """Test a negative Content-Length is answered with 400"""
+    async def scenario(client):
+        client.writer.write(b"POST /reports HTTP/1.1\r\nHost: localhost\r\nContent-Length: -5\r\n\r\n")
+        await client.writer.drain()
+        head = (await client.reader.readuntil(b"\r\n\r\n")).decode()
+        assert head.startswith("HTTP/1.1 400")
+    
+    run_with_client(service, scenario)
+
+
+def test_body_that_is_not_utf8_is_rejected(service):
+    """Test a body with invalid UTF-8 is answered with 400"""
+    async def scenario(client):
+        body = b'{"station_id": "\xff"}'
+        client.writer.write(
+            f"POST /reports HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await client.writer.drain()
+        head = (await client.reader.readuntil(b"\r\n\r\n")).decode()
+        assert head.startswith("HTTP/1.1 400")
+    
+    run_with_client(service, scenario)
+
+
+def test_unexpected_errors_are_answered_with_500(service, monkeypatch):
+    """Test a failing service call gives a 500 and keeps the connection usable"""
+    def broken(report_id):
+        raise RuntimeError("storage unavailable")
+    monkeypatch.setattr(service, "get_report", broken)
+    
+    async def scenario(client):
+        status, body = await client.send("GET", "/reports/00000000-0000-0000-0000-000000000001")
+        assert status == 500
+        assert body == {"error": "Internal server error"}
+        
+        status, _ = await client.send("GET", "/health")
+        assert status == 200
+    
+    run_with_client(service, scenario)
+
+
+def test_connections_beyond_the_limit_get_503(service):
+    """Test the number of open connections is capped"""
+    async def main():
+        server = ReportHttpServer(service, port=0, max_connections=1)
+        await server.start()
+        try:
+            first = Client(*await asyncio.open_connection("127.0.0.1", server.port))
+            assert (await first.send("GET", "/health"))[0] == 200
+            
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            head = (await reader.readuntil(b"\r\n\r\n")).decode()
+            assert head.startswith("HTTP/1.1 503")
+            writer.close()
+            
+            first.writer.close()
+            await asyncio.sleep(0.05)
+            third = Client(*await asyncio.open_connection("127.0.0.1", server.port))
+            assert (await third.send("GET", "/health"))[0] == 200
+            third.writer.close()
+        finally:
+            await server.stop()
+    asyncio.run(main())
@@ -0,0 +1,179 @@
+import pytest
+from domain.enums.station_status import StationStatus
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.register_parsers import available_parsers
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+HEADER = "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad"
+ROWS = [
+    "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41",
+    "Operator B;Karl-Marx-Straße;10;12043;Berlin;Berlin;52,48;13,43",
+    "Operator C;Marienplatz;1;80331;München;Bayern;48,13;11,57",
+    "Operator D;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+]
+
+
+def write_register(path, rows):
+    """Write a synthetic register CSV"""
+    path.write_text("\n".join([HEADER] + rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_station_ids_do_not_depend_on_row_order(tmp_path):
+    """Test that reordering the register keeps station IDs stable"""
+    original = LadesaeulenregisterLoader(write_register(tmp_path / "a.csv", ROWS))
+    reordered = LadesaeulenregisterLoader(write_register(tmp_path / "b.csv", ROWS[::-1]))
+    
+    ids = {s.address: s.station_id for s in original.load_berlin_stations()}
+    reordered_ids = {s.address: s.station_id for s in reordered.load_berlin_stations()}
+    
+    assert len(ids) == 3
+    assert ids == reordered_ids
+    assert ids["Alexanderplatz 1"].value.startswith("BERLIN-10178-")
+
+
+def test_locations_differing_in_case_or_spacing_are_one_station(tmp_path):
+    """Test duplicates are detected on the same normalized location the ID hashes"""
+    loader = LadesaeulenregisterLoader(write_register(tmp_path / "register.csv", [
+        "Operator A;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+        "Operator B;unter  den LINDEN;5;10117;Berlin;Berlin;52,52;13,40",
+    ]))
+    
+    stations = loader.load_berlin_stations()
+    
+    assert [station.name for station in stations] == ["Operator A"]
+
+
+@pytest.mark.parametrize("repository_class", [
+    InMemoryChargingStationRepository,
+    ColumnarChargingStationRepository,
+])
+def test_refresh_applies_only_differences(tmp_path, repository_class):
+    """Test that refresh adds, removes and updates stations in place"""
+    repository = repository_class()
+    for station in LadesaeulenregisterLoader(write_register(tmp_path / "a.csv", ROWS)).load_berlin_stations():
+        repository.save(station)
+    by_address = {s.address: s for s in repository.find_all()}
+    alexanderplatz_id = by_address["Alexanderplatz 1"].station_id
+    linden_id = by_address["Unter den Linden 5"].station_id
+    karl_marx = by_address["Karl-Marx-Straße 10"]
+    karl_marx.mark_as_defective()
+    repository.save(karl_marx)
+    
+    new_release = [
+        "Operator A2;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41",
+        "Operator E;Friedrichstraße;100;10117;Berlin;Berlin;52,52;13,38",
+    ]
+    loader = LadesaeulenregisterLoader(write_register(tmp_path / "b.csv", new_release))
+    result = loader.refresh(repository)
+    
+    assert result.changed == [alexanderplatz_id.value]
+    assert len(result.added) == 1
+    assert result.removed == [linden_id.value]
+    # The defective station still has an open ticket and is kept
+    assert result.retained == [karl_marx.station_id.value]
+    assert repository.find_by_id(alexanderplatz_id).name == "Operator A2"
+    assert repository.find_by_id(linden_id) is None
+    assert repository.find_by_id(karl_marx.station_id).status == StationStatus.DEFECTIVE
+    assert len(repository.find_all()) == 3
+
+
+EDGE_CASE_REGISTERS = {
+    "semicolon": (
+        "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad",
+        [
+            "  Operator A ;Alexanderplatz; 1 ;10178;Berlin;Berlin;52,52;13,41",
+            '"Operator; Quoted";Karl-Marx-Straße;10;12043;Berlin-Neukölln;;52,48;abc',
+            "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,53;13,42",
+            ";Unter den Linden;5;10117;;Berlin;;",
+            "Operator C;Marienplatz;1;80331;München;Bayern;48,13;11,57",
+            "Operator D;;;;Berlin;Berlin;52,5;13,4",
+        ],
+    ),
+    "comma_and_strasse": (
+        "Betreiber,Strasse,Hausnummer,Postleitzahl,Ort,Bundesland,Breitengrad,Längengrad",
+        [
+            'Operator A,Alexanderplatz,1,10178,Berlin,Berlin,"52,52","13,41"',
+            "Operator B,Karl-Marx-Straße,10,12043,Berlin,Berlin,52.48,13.43",
+        ],
+    ),
+    "short_row": (
+        "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad",
+        [
+            "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41",
+            "Operator B;Karl-Marx-Straße;10;12043;Berlin;Berlin",
+            "Operator C;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+        ],
+    ),
+    "extra_column": (
+        "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad",
+        [
+            "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41",
+            "Operator B;Karl-Marx-Straße;10;12043;Berlin;Berlin;52,48;13,43;extra",
+            "Operator C;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+        ],
+    ),
+    "bom": (
+        "\ufeffBetreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad",
+        [
+            "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41",
+            "Operator C;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize("parser_name", sorted(available_parsers()))
+@pytest.mark.parametrize("register", sorted(EDGE_CASE_REGISTERS))
+def test_parser_backends_produce_identical_stations(tmp_path, parser_name, register):
+    """Conformance test: every backend loads the same stations as the default"""
+    header, rows = EDGE_CASE_REGISTERS[register]
+    path = tmp_path / "register.csv"
+    path.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+    
+    def load(parser):
+        return [
+            (s.station_id, s.name, s.postal_code, s.address, s.latitude, s.longitude)
+            for s in LadesaeulenregisterLoader(path, parser).load_berlin_stations()
+        ]
+    
+    expected = load(None)
+    
+    assert load(available_parsers()[parser_name]()) == expected
+    assert len(expected) == (2 if register in ("comma_and_strasse", "bom") else 3)
+    if register == "bom":
+        assert [station[1] for station in expected] == ["Operator A", "Operator C"]
+    if register in ("short_row", "extra_column"):
+        assert [station[1] for station in expected] == ["Operator A", "Operator B", "Operator C"]
+    if register == "semicolon":
+        assert expected[0][1:] == ("Operator A", "10178", "Alexanderplatz 1", 52.52, 13.41)
+        assert expected[1][1] == "Operator; Quoted"
+        assert expected[1][5] is None
+        assert expected[2][1] == "Station 10117"
+
+
+@pytest.mark.parametrize("parser_name", sorted(available_parsers()))
+def test_ragged_rows_are_padded_or_truncated(tmp_path, capsys, parser_name):
+    """Test every backend keeps ragged rows like csv.DictReader and reports them"""
+    path = tmp_path / "register.csv"
+    path.write_text("\n".join([
+        HEADER,
+        "Operator A;Alexanderplatz;1;10178;Berlin;Berlin;52,52;13,41;extra;fields",
+        "",
+        "Operator B;Karl-Marx-Straße;10;12043;Berlin",
+        "Operator C;Unter den Linden;5;10117;Berlin;Berlin;52,51;13,39",
+    ]) + "\n", encoding="utf-8")
+    
+    rows = list(available_parsers()[parser_name]().parse(path))
+    
+    assert [tuple(row) for row in rows] == [
+        ("10178", "Alexanderplatz", "1", "Operator A", "52,52", "13,41"),
+        ("12043", "Karl-Marx-Straße", "10", "Operator B", "", ""),
+        ("10117", "Unter den Linden", "5", "Operator C", "52,51", "13,39"),
+    ]
+    assert "Padded or truncated 2 rows" in capsys.readouterr().out
@@ -44,4 +44,28 @@ def test_validate_report_with_existing_station():
     
     # Assert
     assert is_valid is True
-    assert report.status == ReportStatus.VALIDATED
\ No newline at end of file
+    assert report.status == ReportStatus.VALIDATED
+
+def test_validation_errors_allocated_only_on_failure():
+    """Test that error list is only created when validation fails"""
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all")
+    )
+    
+    assert report._validation_errors is None
+    assert report.get_validation_errors() == []
+    
+    report.validate(station_exists=False, station_is_operational=False)
+    
+    assert report.status == ReportStatus.INVALID
+    assert report.get_validation_errors() == [
+        "Charging station does not exist",
+        "Station already marked as defective"
+    ]
+    
+    report.validate(station_exists=True, station_is_operational=True)
+    
+    assert report.get_validation_errors() == []
@@ -5,12 +5,17 @@ from domain.entities.charging_station import ChargingStation
 from domain.value_objects.station_id import StationId
 from domain.enums.malfunction_type import MalfunctionType
 from domain.enums.station_status import StationStatus
+from domain.enums.report_status import ReportStatus
+from domain.services.repair_time_analytics import RepairTimeAnalytics
 from infrastructure.repositories.in_memory_charging_station_repository import (
     InMemoryChargingStationRepository
 )
 from infrastructure.repositories.in_memory_malfunction_report_repository import (
     InMemoryMalfunctionReportRepository
 )
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
 
 
 class TestMalfunctionReportService:
@@ -120,4 +125,67 @@ class TestMalfunctionReportService:
         
         # Station should be available again
         station = service._station_repository.find_by_id(StationId("STATION-001"))
-        assert station.status == StationStatus.AVAILABLE
\ No newline at end of file
+        assert station.status == StationStatus.AVAILABLE
+
+class TestBulkResolution:
+    """Tests for resolving the tickets of several stations at once"""
+    
+    @pytest.fixture
+    def service(self):
+        """Service with five stations of two operators in two postal codes, all with open tickets"""
+        station_repo = ColumnarChargingStationRepository()
+        for number, (operator, postal_code) in enumerate([
+            ("Operator A", "10178"), ("Operator A", "10178"), ("Operator A", "12043"),
+            ("Operator B", "12043"), ("Operator B", "10178"),
+        ]):
+            station_repo.save(ChargingStation(
+                station_id=StationId(f"STATION-{number}"),
+                name=operator,
+                postal_code=postal_code
+            ))
+        service = MalfunctionReportService(
+            report_repository=InMemoryMalfunctionReportRepository(),
+            station_repository=station_repo,
+            repair_analytics=RepairTimeAnalytics()
+        )
+        for number in range(5):
+            report_id = service.submit_malfunction_report(
+                station_id=f"STATION-{number}",
+                malfunction_type=MalfunctionType.PAYMENT_FAILURE,
+                description="Payment terminal rejects all cards"
+            )
+            service.process_malfunction_report(report_id)
+        return service
+    
+    def test_resolve_tickets_for_operator(self, service):
+        """Test only the operator's tickets are resolved and its stations restored"""
+        result = service.resolve_tickets_for_operator("Operator A")
+        
+        assert result.count == 3
+        assert {station_id.value for station_id in result.restored_stations} == {
+            "STATION-0", "STATION-1", "STATION-2"
+        }
+        assert service._station_repository.find_by_id(StationId("STATION-3")).status == StationStatus.DEFECTIVE
+        assert len(service.get_most_urgent_tickets()) == 2
+        assert service._repair_analytics.summary("Operator A").count == 3
+    
+    def test_resolve_tickets_for_postal_code_and_stations(self, service):
+        """Test area and station selections, with already resolved tickets left alone"""
+        by_area = service.resolve_tickets_for_postal_code("12043")
+        by_station = service.resolve_tickets_for_stations(["STATION-2", "STATION-4", "UNKNOWN"])
+        
+        assert {s.value for s in by_area.restored_stations} == {"STATION-2", "STATION-3"}
+        assert [s.value for s in by_station.restored_stations] == ["STATION-4"]
+        assert by_station.count == 1
+        assert service.resolve_tickets_for_operator("Operator C").count == 0
+    
+    def test_resolve_malfunction_uses_ticket_index(self, service):
+        """Test a single ticket is found without scanning all reports"""
+        ticket_id = service.get_most_urgent_tickets(limit=1)[0].ticket_id
+        
+        service.resolve_malfunction(ticket_id)
+        
+        report = service._report_repository.find_by_ticket(ticket_id)
+        assert report.status == ReportStatus.RESOLVED
+        with pytest.raises(ValueError):
+            service.resolve_malfunction(uuid4())
@@ -0,0 +1,90 @@
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from infrastructure.data.register_partitions import (
+    PartitionManifest, partition_path, write_partitioned_register
+)
+from infrastructure.repositories.partitioned_charging_station_repository import (
+    PartitionedChargingStationRepository
+)
+
+POSTAL_CODES = ["10178", "10117", "12043", "80331", "80333", "20095"]
+
+
+def make_station(postal_code, number):
+    """Create a station with a register-style ID"""
+    return ChargingStation(
+        station_id=StationId(f"BERLIN-{postal_code}-{number:010d}"),
+        name=f"Operator {number}",
+        postal_code=postal_code,
+        latitude=52.5,
+        longitude=13.4
+    )
+
+
+@pytest.fixture
+def register(tmp_path):
+    """Partitioned register with two stations per postal code"""
+    stations = [
+        make_station(postal_code, number)
+        for number, postal_code in enumerate(POSTAL_CODES * 2)
+    ]
+    write_partitioned_register(stations, tmp_path)
+    return tmp_path
+
+
+def test_ingestion_writes_one_partition_per_prefix(register):
+    """Test stations are grouped by the first two postal code digits"""
+    manifest = PartitionManifest.load(register)
+    
+    assert manifest.partitions == {"10": 4, "12": 2, "20": 2, "80": 4}
+    assert manifest.total_stations == 12
+    assert partition_path(register, "80").exists()
+
+
+def test_lookups_load_only_needed_partitions(register):
+    """Test find_by_id and find_by_postal_code touch a single partition"""
+    repository = PartitionedChargingStationRepository(register)
+    
+    station = repository.find_by_id(StationId("BERLIN-12043-0000000002"))
+    munich = repository.find_by_postal_code("80331")
+    
+    assert station.name == "Operator 2"
+    assert {s.station_id.value for s in munich} == {
+        "BERLIN-80331-0000000003", "BERLIN-80331-0000000009"
+    }
+    assert repository.loaded_partitions == ["12", "80"]
+    assert repository.find_by_id(StationId("BERLIN-99999-0000000000")) is None
+    assert repository.find_by_postal_code("99999") == []
+
+
+def test_cold_partitions_are_evicted_and_changes_written_back(register):
+    """Test LRU eviction keeps memory within budget without losing changes"""
+    repository = PartitionedChargingStationRepository(register, max_loaded_stations=6)
+    station = repository.find_by_id(StationId("BERLIN-10178-0000000000"))
+    station.mark_as_defective()
+    repository.save(station)
+    
+    repository.find_by_postal_code("12043")
+    repository.find_by_postal_code("80331")
+    
+    assert repository.loaded_partitions == ["12", "80"]
+    reopened = PartitionedChargingStationRepository(register)
+    assert reopened.find_by_id(station.station_id).status == StationStatus.DEFECTIVE
+
+
+def test_save_delete_and_flush_new_partition(register):
+    """Test new partitions and deletions are persisted on flush"""
+    repository = PartitionedChargingStationRepository(register)
+    repository.save(make_station("01067", 100))
+    repository.delete(StationId("BERLIN-20095-0000000005"))
+    repository.delete(StationId("UNKNOWN"))
+    repository.flush()
+    
+    reopened = PartitionedChargingStationRepository(register)
+    
+    assert reopened.exists(StationId("BERLIN-01067-0000000100"))
+    assert not reopened.exists(StationId("BERLIN-20095-0000000005"))
+    assert len(reopened.find_all()) == 12
+    assert PartitionManifest.load(register).partitions["01"] == 1
@@ -0,0 +1,123 @@
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from infrastructure.data.postal_code_centroids import PostalCodeCentroids
+from infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from infrastructure.data.records import station_to_record, record_to_station
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+
+CENTROIDS = PostalCodeCentroids({"10178": (52.52, 13.41), "12043": (52.48, 13.43)})
+
+
+def make_station(postal_code, suffix, latitude=None, longitude=None):
+    return ChargingStation(
+        station_id=StationId(f"BERLIN-{postal_code}-{suffix}"),
+        name="Test Operator",
+        postal_code=postal_code,
+        latitude=latitude,
+        longitude=longitude
+    )
+
+
+def test_reads_centroids_from_coordinate_columns(tmp_path):
+    """Test a CSV with latitude/longitude columns"""
+    path = tmp_path / "plz.csv"
+    path.write_text("PLZ;lat;lon\n10178;52.52;13.41\n", encoding="utf-8")
+    
+    centroids = PostalCodeCentroids.from_csv(path)
+    
+    assert len(centroids) == 1
+    assert centroids.get("10178") == (52.52, 13.41)
+    assert centroids.get("99999") is None
+
+
+def test_skips_unreadable_rows(tmp_path):
+    """Test blank or broken rows are skipped and decimal commas are accepted"""
+    path = tmp_path / "plz.csv"
+    path.write_text(
+        'PLZ;lat;lon\n'
+        '10178;52,52;13,41\n'
+        '10117;;\n'
+        '10115;north;13.38\n'
+        'Berlin;52.5;13.4\n'
+        '10119;52.53;13.40\n',
+        encoding="utf-8"
+    )
+    
+    centroids = PostalCodeCentroids.from_csv(path)
+    
+    assert len(centroids) == 2
+    assert centroids.get("10178") == (52.52, 13.41)
+    assert centroids.get("10117") is None
+
+
+def test_computes_centroids_of_wkt_polygons(tmp_path):
+    """Test polygon centroids are area-weighted and holes are subtracted"""
+    path = tmp_path / "plz.csv"
+    path.write_text(
+        'PLZ;geometry\n'
+        '10178;POLYGON ((13 52, 14 52, 14 53, 13 53, 13 52))\n'
+        '10117;POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (2 0, 2 4, 4 4, 4 0, 2 0))\n',
+        encoding="utf-8"
+    )
+    
+    centroids = PostalCodeCentroids.from_csv(path)
+    
+    assert centroids.get("10178") == pytest.approx((52.5, 13.5))
+    assert centroids.get("10117") == pytest.approx((2.0, 1.0))
+
+
+def test_enrich_fills_only_missing_coordinates():
+    """Test stations without coordinates get their area centroid and are flagged"""
+    stations = [
+        make_station("10178", "A"),
+        make_station("10178", "B", latitude=52.53, longitude=13.42),
+        make_station("80331", "C"),
+        make_station("X", "D"),
+    ]
+    
+    assert CENTROIDS.enrich(stations) == 1
+    
+    assert (stations[0].latitude, stations[0].longitude) == (52.52, 13.41)
+    assert stations[0].coordinates_approximate
+    assert not stations[1].coordinates_approximate and stations[1].latitude == 52.53
+    assert stations[2].latitude is None and not stations[2].coordinates_approximate
+
+
+def test_columnar_repository_fills_coordinates_vectorized():
+    """Test the columnar pass flags filled rows and keeps exact positions"""
+    repository = ColumnarChargingStationRepository()
+    repository.save(make_station("12043", "A"))
+    repository.save(make_station("10178", "B", latitude=52.53, longitude=13.42))
+    
+    assert repository.fill_missing_coordinates(CENTROIDS) == 1
+    
+    station = repository.find_by_id(StationId("BERLIN-12043-A"))
+    assert (station.latitude, station.longitude) == (52.48, 13.43)
+    assert station.coordinates_approximate
+    assert list(repository.columns()['approximate']) == [True, False]
+
+
+def test_approximate_flag_survives_records_and_refresh(tmp_path):
+    """Test the flag is stored and cleared once the register has a real position"""
+    station = make_station("10178", "A")
+    station.approximate_location(52.52, 13.41)
+    assert record_to_station(station_to_record(station)).coordinates_approximate
+    
+    path = tmp_path / "register.csv"
+    header = "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad\n"
+    path.write_text(header + "Operator;Alexanderplatz;1;10178;Berlin;Berlin;;\n", encoding="utf-8")
+    loader = LadesaeulenregisterLoader(path, centroids=CENTROIDS)
+    repository = ColumnarChargingStationRepository()
+    for loaded in loader.load_berlin_stations():
+        repository.save(loaded)
+    assert repository.find_all()[0].coordinates_approximate
+    
+    path.write_text(header + "Operator;Alexanderplatz;1;10178;Berlin;Berlin;52,521;13,411\n", encoding="utf-8")
+    result = loader.refresh(repository)
+    
+    assert len(result.changed) == 1
+    assert not repository.find_all()[0].coordinates_approximate
+    assert repository.find_all()[0].latitude == 52.521
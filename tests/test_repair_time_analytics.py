@@ -0,0 +1,134 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from domain.services.malfunction_report_service import MalfunctionReportService
+from domain.services.quantile_sketch import QuantileSketch
+from domain.services.repair_time_analytics import RepairTimeAnalytics
+from infrastructure.data.records import report_to_record, record_to_report
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    """Test sketch quantiles stay within the configured relative error"""
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(9, 1.5) for _ in range(20000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_merged_sketches_match_single_sketch():
+    """Test merging two sketches equals adding all values to one"""
+    left, right, single = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in range(1, 1001):
+        (left if value % 2 else right).add(value)
+        single.add(value)
+    
+    left.merge(right)
+    
+    assert left.count == single.count
+    assert left.quantile(0.9) == single.quantile(0.9)
+
+
+def test_summary_per_operator_and_type():
+    """Test statistics are kept per operator, type and overall"""
+    analytics = RepairTimeAnalytics()
+    analytics.record("Vattenfall", MalfunctionType.NOT_CHARGING, 3600)
+    analytics.record("Vattenfall", MalfunctionType.DISPLAY_MALFUNCTION, 7200)
+    analytics.record("Allego", MalfunctionType.NOT_CHARGING, 600)
+    
+    assert analytics.operators() == ["Allego", "Vattenfall"]
+    assert analytics.summary("Vattenfall").count == 2
+    assert analytics.summary("Vattenfall").mean == pytest.approx(5400)
+    assert analytics.summary(malfunction_type=MalfunctionType.NOT_CHARGING).count == 2
+    assert analytics.summary().count == 3
+    assert analytics.summary("Unknown").p50 is None
+
+
+def test_service_records_time_to_resolve():
+    """Test resolving a ticket stamps the report and feeds the analytics"""
+    station_repo = InMemoryChargingStationRepository()
+    station_repo.save(ChargingStation(
+        station_id=StationId("STATION-001"),
+        name="Vattenfall",
+        postal_code="10178"
+    ))
+    analytics = RepairTimeAnalytics()
+    service = MalfunctionReportService(
+        InMemoryMalfunctionReportRepository(), station_repo, repair_analytics=analytics
+    )
+    report_id = service.submit_malfunction_report(
+        "STATION-001", MalfunctionType.NOT_CHARGING, "Vehicle not charging at all"
+    )
+    result = service.process_malfunction_report(report_id)
+    service.resolve_malfunction(result.ticket_id)
+    
+    report = service.get_report(report_id)
+    assert report.status == ReportStatus.RESOLVED
+    assert report.resolved_at is not None
+    assert report.time_to_resolve >= timedelta(0)
+    assert analytics.summary("Vattenfall").count == 1
+
+
+def test_resolving_a_ticket_twice_is_rejected():
+    """Test a resolved ticket keeps its resolution time and is observed once"""
+    station_repo = InMemoryChargingStationRepository()
+    station_repo.save(ChargingStation(
+        station_id=StationId("STATION-001"),
+        name="Vattenfall",
+        postal_code="10178"
+    ))
+    analytics = RepairTimeAnalytics()
+    service = MalfunctionReportService(
+        InMemoryMalfunctionReportRepository(), station_repo, repair_analytics=analytics
+    )
+    report_id = service.submit_malfunction_report(
+        "STATION-001", MalfunctionType.NOT_CHARGING, "Vehicle not charging at all"
+    )
+    result = service.process_malfunction_report(report_id)
+    service.resolve_malfunction(result.ticket_id)
+    resolved_at = service.get_report(report_id).resolved_at
+    
+    with pytest.raises(ValueError):
+        service.resolve_malfunction(result.ticket_id)
+    
+    assert service.get_report(report_id).resolved_at == resolved_at
+    assert analytics.summary("Vattenfall").count == 1
+
+
+def test_resolved_at_survives_records():
+    """Test the resolution time round-trips through the record mapping"""
+    report = MalfunctionReport.restore(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all"),
+        reported_by=None,
+        status=ReportStatus.RESOLVED,
+        ticket_id=uuid4(),
+        created_at=datetime(2024, 6, 1, 8, 0),
+        updated_at=datetime(2024, 6, 1, 11, 0),
+        resolved_at=datetime(2024, 6, 1, 11, 0)
+    )
+    
+    restored = record_to_report(report_to_record(report))
+    
+    assert restored.time_to_resolve == timedelta(hours=3)
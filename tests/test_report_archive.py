@@ -0,0 +1,119 @@
+import pytest
+import threading
+from datetime import datetime, timedelta
+from uuid import uuid4
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+from infrastructure.repositories.report_archive import ReportArchive, ReportRetentionPolicy
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def make_report(station_id, resolved_at=None):
+    """Create a report, resolved at the given time if any"""
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId(station_id),
+        malfunction_type=MalfunctionType.CONNECTOR_ISSUE,
+        description=ReportDescription("Connector cable is damaged"),
+        reported_by="user@example.com",
+        created_at=NOW - timedelta(days=60)
+    )
+    if resolved_at is not None:
+        report.validate(station_exists=True, station_is_operational=True)
+        report.create_ticket(uuid4())
+        report.resolve()
+        report._updated_at = resolved_at
+    return report
+
+
+@pytest.fixture
+def repository():
+    """Repository with old and recent resolved reports and an open one"""
+    repository = InMemoryMalfunctionReportRepository()
+    repository.save(make_report("STATION-001", resolved_at=NOW - timedelta(days=40)))
+    repository.save(make_report("STATION-002", resolved_at=NOW - timedelta(days=35)))
+    repository.save(make_report("STATION-001", resolved_at=NOW - timedelta(days=1)))
+    repository.save(make_report("STATION-001"))
+    return repository
+
+
+def test_retention_moves_old_finished_reports(tmp_path, repository):
+    """Test only old resolved reports leave the hot store"""
+    archive = ReportArchive(tmp_path)
+    policy = ReportRetentionPolicy(archive, max_age=timedelta(days=30))
+    
+    archived = policy.apply(repository, now=NOW)
+    
+    assert archived == 2
+    assert len(repository.find_all()) == 2
+    assert len(archive.segments()) == 1
+    assert policy.apply(repository, now=NOW) == 0
+    assert len(archive.segments()) == 1
+
+
+def test_archived_reports_round_trip(tmp_path, repository):
+    """Test archived reports can be streamed back with their state"""
+    originals = {r.report_id: r for r in repository.find_all()}
+    archive = ReportArchive(tmp_path)
+    ReportRetentionPolicy(archive, max_age=timedelta(days=30)).apply(repository, now=NOW)
+    
+    restored = list(archive.iter_reports())
+    
+    assert len(restored) == 2
+    for report in restored:
+        original = originals[report.report_id]
+        assert report.status == ReportStatus.RESOLVED
+        assert report.ticket_id == original.ticket_id
+        assert report.station_id == original.station_id
+        assert report.description == original.description
+        assert report.reported_by == "user@example.com"
+        assert report.created_at == original.created_at
+        assert report.updated_at == original.updated_at
+    assert len(list(archive.iter_reports(StationId("STATION-002")))) == 1
+
+
+def test_segments_are_append_only(tmp_path):
+    """Test every archiving run adds a new segment"""
+    archive = ReportArchive(tmp_path)
+    archive.append([make_report("STATION-001", resolved_at=NOW)])
+    archive.append([make_report("STATION-002", resolved_at=NOW)])
+    
+    assert [p.name for p in archive.segments()] == [
+        "reports-000001.jsonl.gz", "reports-000002.jsonl.gz"
+    ]
+    assert archive.append([]) is None
+    assert len(list(archive.iter_reports())) == 2
+
+
+def test_concurrent_appends_never_share_a_segment(tmp_path):
+    """Test runs that pick the same segment number both keep their reports"""
+    barrier = threading.Barrier(4)
+    
+    class RacingArchive(ReportArchive):
+        def segments(self):
+            # Every run lists the directory before any of them has written
+            segments = super().segments()
+            barrier.wait(timeout=5)
+            return segments
+    
+    archive = RacingArchive(tmp_path)
+    stations = [f"STATION-{i:03d}" for i in range(4)]
+    threads = [
+        threading.Thread(target=archive.append, args=([make_report(station, resolved_at=NOW)],))
+        for station in stations
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(ReportArchive(tmp_path).segments()) == 4
+    assert sorted(r.station_id.value for r in ReportArchive(tmp_path).iter_reports()) == stations
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
@@ -0,0 +1,97 @@
+from uuid import uuid4
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.enums.report_status import ReportStatus
+from infrastructure.search.german_text import normalize, tokenize
+from infrastructure.repositories.indexing_malfunction_report_repository import (
+    IndexingMalfunctionReportRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+
+def make_report(description, station="BERLIN-10178-A", malfunction_type=MalfunctionType.PAYMENT_FAILURE):
+    return MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId(station),
+        malfunction_type=malfunction_type,
+        description=ReportDescription(description)
+    )
+
+
+def test_german_normalization_folds_umlauts_and_endings():
+    """Test spelling and inflection variants map to the same term"""
+    assert normalize("Ladesäule") == normalize("Ladesaeule") == normalize("Ladesäulen")
+    assert normalize("Kartenleser") == normalize("Kartenlesern") == normalize("Kartenlesers")
+    assert normalize("Straße") == normalize("strasse")
+    assert tokenize("Der QR-Code ist nicht lesbar") == ["qr", "cod", "nicht", "lesbar"]
+
+
+def test_search_ranks_matching_reports():
+    """Test reports matching more query terms rank first and non-matches are left out"""
+    repository = IndexingMalfunctionReportRepository(InMemoryMalfunctionReportRepository())
+    both = make_report("QR-Code an der Ladesäule nicht lesbar")
+    one = make_report("Ladesäule zeigt Fehler 42 an")
+    other = make_report("Kartenleser defekt, keine Zahlung")
+    for report in (one, both, other):
+        repository.save(report)
+    
+    results = repository.search("qr code ladesaeule")
+    
+    assert [report for report, _ in results] == [both, one]
+    assert results[0][1] > results[1][1] > 0
+    assert [r for r, _ in repository.search("Kartenlesern")] == [other]
+    assert repository.search("Parkplatz") == []
+
+
+def test_search_filters_by_station_status_and_type():
+    """Test filters are combined and status updates on save are picked up"""
+    repository = IndexingMalfunctionReportRepository(InMemoryMalfunctionReportRepository())
+    first = make_report("Kartenleser reagiert nicht")
+    second = make_report("Kartenleser reagiert nicht", station="BERLIN-12043-B")
+    third = make_report("Kartenleser kaputt", malfunction_type=MalfunctionType.PHYSICAL_DAMAGE)
+    for report in (first, second, third):
+        repository.save(report)
+    
+    by_station = repository.search("kartenleser", station_id=StationId("BERLIN-12043-B"))
+    assert [report for report, _ in by_station] == [second]
+    by_type = repository.search("kartenleser", malfunction_type=MalfunctionType.PHYSICAL_DAMAGE)
+    assert [report for report, _ in by_type] == [third]
+    
+    first.validate(station_exists=True, station_is_operational=True)
+    first.create_ticket(uuid4())
+    repository.save(first)
+    
+    open_tickets = repository.search("kartenleser", status=ReportStatus.TICKET_CREATED)
+    assert [report for report, _ in open_tickets] == [first]
+    assert repository.search("kartenleser", station_id=StationId("BERLIN-99999-X")) == []
+
+
+def test_index_covers_existing_reports_and_deletes():
+    """Test reports stored before wrapping are searchable and deleted ones disappear"""
+    inner = InMemoryMalfunctionReportRepository()
+    report = make_report("Display bleibt schwarz")
+    inner.save(report)
+    repository = IndexingMalfunctionReportRepository(inner)
+    
+    assert [r for r, _ in repository.search("Display")] == [report]
+    
+    repository.delete(report.report_id)
+    
+    assert repository.search("Display") == []
+    assert len(repository.index) == 0
+
+
+def test_search_limit_keeps_best_results():
+    """Test the limit keeps the highest scoring reports in order"""
+    repository = IndexingMalfunctionReportRepository(InMemoryMalfunctionReportRepository())
+    reports = [make_report("Stecker klemmt " + "Stecker " * repeats) for repeats in range(5)]
+    for report in reports:
+        repository.save(report)
+    
+    results = repository.search("Stecker", limit=2)
+    
+    assert [report for report, _ in results] == [reports[4], reports[3]]
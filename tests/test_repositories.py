@@ -1,5 +1,6 @@
 import pytest
 from uuid import uuid4
+from datetime import datetime, timedelta
 from domain.entities.charging_station import ChargingStation
 from domain.entities.malfunction_report import MalfunctionReport
 from domain.value_objects.station_id import StationId
@@ -8,11 +9,35 @@ from domain.enums.malfunction_type import MalfunctionType
 from infrastructure.repositories.in_memory_charging_station_repository import (
     InMemoryChargingStationRepository
 )
+from domain.repositories.i_charging_station_repository import IChargingStationRepository
+from domain.repositories.i_malfunction_report_repository import IMalfunctionReportRepository
 from infrastructure.repositories.in_memory_malfunction_report_repository import (
     InMemoryMalfunctionReportRepository
 )
 
 
+class MinimalReportRepository(IMalfunctionReportRepository):
+    """Implements only the abstract methods, relying on the interface defaults"""
+    
+    def __init__(self):
+        self._reports = {}
+    
+    def save(self, report):
+        self._reports[report.report_id] = report
+    
+    def find_by_id(self, report_id):
+        return self._reports.get(report_id)
+    
+    def find_by_station(self, station_id):
+        return [report for report in self._reports.values() if report.station_id == station_id]
+    
+    def find_all(self):
+        return list(self._reports.values())
+    
+    def delete(self, report_id):
+        self._reports.pop(report_id, None)
+
+
 class TestInMemoryChargingStationRepository:
     """Test in-memory implementation of station repository"""
     
@@ -125,4 +150,185 @@ class TestInMemoryMalfunctionReportRepository:
         
         station_reports = repository.find_by_station(station_id)
         
-        assert len(station_reports) == 2
\ No newline at end of file
+        assert len(station_reports) == 2
+
+class TestRepositorySnapshots:
+    """Test read-only find_all snapshots"""
+    
+    def test_find_all_reuses_snapshot_until_write(self):
+        """Test that readers share one snapshot until the store changes"""
+        repository = InMemoryChargingStationRepository()
+        station = ChargingStation(
+            station_id=StationId("STATION-001"),
+            name="Station 1",
+            postal_code="10178"
+        )
+        repository.save(station)
+        
+        first = repository.find_all()
+        assert repository.find_all() is first
+        
+        # Re-saving the same instance does not change membership
+        station.mark_as_defective()
+        repository.save(station)
+        assert repository.find_all() is first
+        
+        repository.save(ChargingStation(
+            station_id=StationId("STATION-002"),
+            name="Station 2",
+            postal_code="10178"
+        ))
+        second = repository.find_all()
+        
+        assert second is not first
+        assert second.version > first.version
+        assert len(first) == 1
+        assert len(second) == 2
+    
+    def test_snapshot_is_read_only(self):
+        """Test that snapshots cannot be modified by readers"""
+        repository = InMemoryMalfunctionReportRepository()
+        repository.save(MalfunctionReport(
+            report_id=uuid4(),
+            station_id=StationId("STATION-001"),
+            malfunction_type=MalfunctionType.NOT_CHARGING,
+            description=ReportDescription("Test malfunction report")
+        ))
+        snapshot = repository.find_all()
+        
+        with pytest.raises(TypeError):
+            snapshot[0] = None
+        assert not hasattr(snapshot, "append")
+        assert list(snapshot) == [snapshot[0]]
+
+
+class TestReportTimeIndex:
+    """Test time-range queries on the report repository"""
+    
+    @pytest.fixture(params=[InMemoryMalfunctionReportRepository, MinimalReportRepository])
+    def repository(self, request):
+        """Repository with reports created out of order over three hours"""
+        repository = request.param()
+        for minutes in [10, 130, 70, 20, 75]:
+            repository.save(MalfunctionReport(
+                report_id=uuid4(),
+                station_id=StationId("STATION-001"),
+                malfunction_type=MalfunctionType.NOT_CHARGING,
+                description=ReportDescription("Test malfunction report"),
+                created_at=datetime(2024, 6, 1, 8, 0) + timedelta(minutes=minutes)
+            ))
+        return repository
+    
+    def test_find_created_between(self, repository):
+        """Test range query returns reports in creation order"""
+        reports = repository.find_created_between(
+            datetime(2024, 6, 1, 8, 15), datetime(2024, 6, 1, 9, 15)
+        )
+        
+        assert [r.created_at.minute for r in reports] == [20, 10]
+    
+    def test_count_created_per_bucket(self, repository):
+        """Test counts per hourly bucket"""
+        counts = repository.count_created_per_bucket(
+            datetime(2024, 6, 1, 8, 0), datetime(2024, 6, 1, 11, 0), timedelta(hours=1)
+        )
+        
+        assert [count for _, count in counts] == [2, 2, 1]
+        assert counts[1][0] == datetime(2024, 6, 1, 9, 0)
+    
+    def test_deleted_reports_leave_the_index(self, repository):
+        """Test deleting a report removes it from time queries"""
+        start, end = datetime(2024, 6, 1, 9, 0), datetime(2024, 6, 1, 10, 0)
+        report = repository.find_created_between(start, end)[0]
+        
+        repository.delete(report.report_id)
+        
+        assert len(repository.find_created_between(start, end)) == 1
+
+
+class TestBatchOperations:
+    """Test batched writes and the station and ticket indexes"""
+    
+    def make_report(self, station):
+        return MalfunctionReport(
+            report_id=uuid4(),
+            station_id=StationId(station),
+            malfunction_type=MalfunctionType.NOT_CHARGING,
+            description=ReportDescription("Test malfunction report")
+        )
+    
+    def test_find_reports_by_stations_and_ticket(self):
+        """Test the indexes follow saves, ticket creation and deletes"""
+        repository = InMemoryMalfunctionReportRepository()
+        reports = [self.make_report(station) for station in ["STATION-1", "STATION-2", "STATION-3"]]
+        repository.save_many(reports)
+        
+        found = repository.find_by_stations([StationId("STATION-1"), StationId("STATION-3")])
+        assert {r.report_id for r in found} == {reports[0].report_id, reports[2].report_id}
+        
+        ticket_id = uuid4()
+        reports[1].validate(station_exists=True, station_is_operational=True)
+        reports[1].create_ticket(ticket_id)
+        repository.save(reports[1])
+        assert repository.find_by_ticket(ticket_id) is reports[1]
+        
+        repository.delete(reports[1].report_id)
+        assert repository.find_by_ticket(ticket_id) is None
+        assert repository.find_by_station(StationId("STATION-2")) == []
+    
+    def test_save_many_and_find_by_operator(self):
+        """Test stations saved in one batch are found by operator"""
+        repository = InMemoryChargingStationRepository()
+        repository.save_many([
+            ChargingStation(StationId(f"STATION-{number}"), operator, "10178")
+            for number, operator in enumerate(["Operator A", "Operator B", "Operator A"])
+        ])
+        
+        assert [s.station_id.value for s in repository.find_by_operator("Operator A")] == [
+            "STATION-0", "STATION-2"
+        ]
+        assert len(repository.find_all()) == 3
+
+
+class TestInterfaceDefaults:
+    """Test repositories implementing only the abstract methods still work"""
+    
+    def test_report_repository_without_delete(self):
+        """Test a report repository without delete can be used until it is asked to delete"""
+        class LegacyReportRepository(MinimalReportRepository):
+            delete = IMalfunctionReportRepository.delete
+        
+        repository = LegacyReportRepository()
+        
+        assert repository.find_created_between(datetime(2024, 6, 1), datetime(2024, 6, 2)) == []
+        with pytest.raises(NotImplementedError):
+            repository.delete(uuid4())
+    
+    def test_station_repository_without_delete(self):
+        """Test a station repository without delete can be used until it is asked to delete"""
+        class LegacyStationRepository(IChargingStationRepository):
+            def __init__(self):
+                self._stations = {}
+            
+            def save(self, station):
+                self._stations[station.station_id.value] = station
+            
+            def find_by_id(self, station_id):
+                return self._stations.get(station_id.value)
+            
+            def find_by_postal_code(self, postal_code):
+                return [s for s in self._stations.values() if s.postal_code == postal_code]
+            
+            def find_all(self):
+                return list(self._stations.values())
+            
+            def exists(self, station_id):
+                return station_id.value in self._stations
+        
+        repository = LegacyStationRepository()
+        repository.save_many([ChargingStation(StationId("STATION-001"), "Test Station", "10178")])
+        
+        assert repository.exists(StationId("STATION-001"))
+        with pytest.raises(NotImplementedError):
+            repository.delete(StationId("STATION-001"))
+
@@ -0,0 +1,135 @@
+import threading
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.sharded_charging_station_repository import (
+    ShardRouter, ShardedChargingStationRepository
+)
+from infrastructure.repositories.columnar_charging_station_repository import (
+    ColumnarChargingStationRepository
+)
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+
+
+def make_station(postal_code, suffix, station_id=None):
+    return ChargingStation(
+        station_id=StationId(station_id or f"BERLIN-{postal_code}-{suffix}"),
+        name="Test Operator",
+        postal_code=postal_code
+    )
+
+
+@pytest.fixture
+def repository():
+    """Berlin and Brandenburg shards with a catch-all shard"""
+    router = ShardRouter(
+        {
+            "10": "berlin", "12": "berlin", "13": "berlin", "140": "berlin", "141": "berlin",
+            "14": "brandenburg", "15": "brandenburg",
+        },
+        default_shard="other"
+    )
+    repository = ShardedChargingStationRepository({
+        "berlin": ColumnarChargingStationRepository(),
+        "brandenburg": InMemoryChargingStationRepository(),
+        "other": InMemoryChargingStationRepository(),
+    }, router)
+    yield repository
+    repository.close()
+
+
+def test_router_uses_longest_prefix():
+    """Test the most specific prefix wins"""
+    router = ShardRouter({"1": "north-east", "10": "berlin"})
+    
+    assert router.shard_for("10178") == "berlin"
+    assert router.shard_for("14467") == "north-east"
+    assert ShardRouter.by_postal_region().shard_for("80331") == "8"
+    with pytest.raises(ValueError):
+        router.shard_for("80331")
+
+
+def test_stations_are_stored_in_their_region_shard(repository):
+    """Test writes and lookups are routed by postal code"""
+    repository.save(make_station("10178", "A"))
+    repository.save(make_station("14467", "B"))
+    repository.save(make_station("80331", "C"))
+    repository.save(make_station("14193", "D"))
+    
+    assert len(repository.shard("berlin").find_all()) == 2
+    assert repository.shard("brandenburg").exists(StationId("BERLIN-14467-B"))
+    assert repository.find_by_id(StationId("BERLIN-80331-C")).postal_code == "80331"
+    assert [s.postal_code for s in repository.find_by_postal_code("14467")] == ["14467"]
+    assert repository.find_by_id(StationId("BERLIN-10117-X")) is None
+
+
+def test_cross_shard_operations_fan_out_in_parallel(repository):
+    """Test find_all, counts and IDs without a postal code query every shard"""
+    repository.save(make_station("10178", "A"))
+    defective = make_station("14467", "B")
+    defective.mark_as_defective()
+    repository.save(defective)
+    repository.save(make_station("80331", "C", station_id="LEGACY-42"))
+    
+    threads = set()
+    original = InMemoryChargingStationRepository.find_all
+    
+    def recording_find_all(self):
+        threads.add(threading.current_thread().name)
+        return original(self)
+    
+    InMemoryChargingStationRepository.find_all = recording_find_all
+    try:
+        assert len(repository.find_all()) == 3
+    finally:
+        InMemoryChargingStationRepository.find_all = original
+    
+    assert all(name.startswith("shard") for name in threads)
+    assert repository.count() == 3
+    assert repository.count_by_status()[StationStatus.DEFECTIVE] == 1
+    assert repository.count_by_status()[StationStatus.AVAILABLE] == 2
+    assert repository.exists(StationId("LEGACY-42"))
+    repository.delete(StationId("LEGACY-42"))
+    assert not repository.exists(StationId("LEGACY-42"))
+
+
+def test_every_routed_shard_needs_a_repository():
+    """Test a router shard without a repository is rejected"""
+    with pytest.raises(ValueError):
+        ShardedChargingStationRepository({}, ShardRouter({"1": "north-east"}))
+
+
+def test_ids_outside_every_shard_are_not_found():
+    """Test lookups of IDs whose postal code no shard covers find nothing"""
+    repository = ShardedChargingStationRepository(
+        {"berlin": InMemoryChargingStationRepository()}, ShardRouter({"10": "berlin"})
+    )
+    
+    assert repository.find_by_id(StationId("BERLIN-80331-A")) is None
+    assert not repository.exists(StationId("BERLIN-80331-A"))
+    repository.delete(StationId("BERLIN-80331-A"))
+    repository.close()
+
+
+def test_station_id_must_route_to_the_same_shard(repository):
+    """Test a station whose ID names another region's postal code is rejected"""
+    with pytest.raises(ValueError):
+        repository.save(make_station("80331", "A", station_id="BERLIN-10178-A"))
+    with pytest.raises(ValueError):
+        repository.save_many([make_station("80331", "A", station_id="BERLIN-10178-A")])
+
+
+def test_count_uses_shard_counts(repository):
+    """Test counting does not load every station"""
+    repository.save_many(make_station("10178", suffix) for suffix in "ABC")
+    repository.save(make_station("14467", "D"))
+    
+    original = InMemoryChargingStationRepository.find_all
+    InMemoryChargingStationRepository.find_all = lambda self: pytest.fail("loaded all stations")
+    try:
+        assert repository.count() == 4
+    finally:
+        InMemoryChargingStationRepository.find_all = original
@@ -0,0 +1,202 @@
+import multiprocessing
+import os
+import numpy as np
+import pytest
+from uuid import uuid4
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from infrastructure.repositories.shared_memory_charging_station_repository import (
+    SharedStationDataset,
+    SharedMemoryChargingStationRepository,
+    _PREAMBLE,
+    _BUILDING,
+    _open_segment
+)
+
+
+def make_stations():
+    """Create a few stations in two postal codes"""
+    return [
+        ChargingStation(
+            station_id=StationId(f"STATION-{number:03d}"),
+            name=f"Operator {number % 2}",
+            postal_code="10178" if number < 3 else "12043",
+            address=f"Teststraße {number}",
+            latitude=52.5,
+            longitude=13.4
+        )
+        for number in range(6)
+    ]
+
+
+def mark_defective_in_worker(name, station_id):
+    """Attach from another process and flip a station's status"""
+    repository = SharedMemoryChargingStationRepository(SharedStationDataset.attach(name))
+    station = repository.find_by_id(StationId(station_id))
+    station.mark_as_defective()
+    repository.save(station)
+
+
+def toggle_in_worker(name, station_id, times):
+    """Attach from another process and flip a station back and forth"""
+    repository = SharedMemoryChargingStationRepository(SharedStationDataset.attach(name))
+    station = repository.find_by_id(StationId(station_id))
+    for _ in range(times):
+        station.mark_as_defective()
+        station.mark_as_available()
+
+
+def try_mark_defective_in_worker(name, station_id, start):
+    """Wait for the start signal, then race to mark a station defective"""
+    repository = SharedMemoryChargingStationRepository(SharedStationDataset.attach(name))
+    station = repository.find_by_id(StationId(station_id))
+    start.wait()
+    try:
+        station.mark_as_defective()
+    except ValueError:
+        os._exit(1)
+
+
+def start_building_and_crash(name):
+    """Create a segment and die before publishing it"""
+    segment = _open_segment(name, create=True, size=_PREAMBLE.itemsize)
+    preamble = np.ndarray((1,), dtype=_PREAMBLE, buffer=segment.buf)
+    preamble['state'] = _BUILDING
+    preamble['creator_pid'] = os.getpid()
+    os._exit(1)
+
+
+@pytest.fixture
+def dataset_name():
+    """Unique segment name, unlinked after the test"""
+    name = f"chargehub-test-{uuid4().hex[:12]}"
+    yield name
+    SharedStationDataset.attach(name).unlink()
+
+
+def test_workers_share_stations_and_status(dataset_name):
+    """Test a second worker sees the same stations and status flips"""
+    first = SharedMemoryChargingStationRepository(
+        SharedStationDataset.open_or_create(dataset_name, make_stations)
+    )
+    second = SharedMemoryChargingStationRepository(
+        SharedStationDataset.open_or_create(dataset_name, lambda: pytest.fail("parsed twice"))
+    )
+    
+    station = second.find_by_id(StationId("STATION-004"))
+    assert station.name == "Operator 0"
+    assert station.address == "Teststraße 4"
+    assert len(second.find_by_postal_code("12043")) == 3
+    assert second.find_by_id(StationId("NONEXISTENT")) is None
+    
+    first.find_by_id(StationId("STATION-004")).mark_as_defective()
+    
+    assert station.status == StationStatus.DEFECTIVE
+    assert second.count_by_status()[StationStatus.DEFECTIVE] == 1
+    assert second.status_version == first.status_version
+
+
+def test_status_flip_from_other_process(dataset_name):
+    """Test a status change made in another process is visible here"""
+    repository = SharedMemoryChargingStationRepository(
+        SharedStationDataset.create(dataset_name, make_stations())
+    )
+    
+    worker = multiprocessing.Process(
+        target=mark_defective_in_worker, args=(dataset_name, "STATION-001")
+    )
+    worker.start()
+    worker.join(timeout=30)
+    
+    assert worker.exitcode == 0
+    assert repository.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+
+
+def test_dataset_is_read_only(dataset_name):
+    """Test stations cannot be added to or removed from the shared table"""
+    repository = SharedMemoryChargingStationRepository(
+        SharedStationDataset.create(dataset_name, make_stations())
+    )
+    
+    with pytest.raises(ValueError):
+        repository.save(make_stations()[0])
+    with pytest.raises(ValueError):
+        repository.delete(StationId("STATION-001"))
+    with pytest.raises(ValueError):
+        repository.find_by_id(StationId("STATION-001")).update_details("New", None, None, None)
+
+
+def test_status_version_counts_every_flip_across_processes(dataset_name):
+    """Test concurrent workers never lose a shared status version bump"""
+    repository = SharedMemoryChargingStationRepository(
+        SharedStationDataset.create(dataset_name, make_stations())
+    )
+    
+    workers = [
+        multiprocessing.Process(target=toggle_in_worker, args=(dataset_name, f"STATION-00{number}", 2000))
+        for number in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+    
+    assert [worker.exitcode for worker in workers] == [0] * 4
+    assert repository.status_version == 4 * 2000 * 2
+
+
+def test_only_one_worker_marks_a_station_defective(dataset_name):
+    """Test the defective check and the status change are one atomic step"""
+    SharedStationDataset.create(dataset_name, make_stations())
+    start = multiprocessing.Event()
+    
+    workers = [
+        multiprocessing.Process(target=try_mark_defective_in_worker, args=(dataset_name, "STATION-002", start))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join(timeout=30)
+    
+    assert sorted(worker.exitcode for worker in workers) == [0, 1, 1, 1]
+
+
+def test_segment_abandoned_by_crashed_creator_is_rebuilt(dataset_name):
+    """Test a worker replaces a segment whose creator died while building it"""
+    crashed = multiprocessing.Process(target=start_building_and_crash, args=(dataset_name,))
+    crashed.start()
+    crashed.join(timeout=30)
+    
+    repository = SharedMemoryChargingStationRepository(
+        SharedStationDataset.open_or_create(dataset_name, make_stations)
+    )
+    
+    assert len(repository.find_all()) == 6
+
+
+def test_defective_status_of_stopped_worker_is_restored_on_attach(dataset_name):
+    """Test stations whose ticket died with its worker do not stay defective"""
+    repository = SharedMemoryChargingStationRepository(
+        SharedStationDataset.create(dataset_name, make_stations())
+    )
+    repository.find_by_id(StationId("STATION-002")).mark_as_defective()
+    
+    worker = multiprocessing.Process(
+        target=mark_defective_in_worker, args=(dataset_name, "STATION-001")
+    )
+    worker.start()
+    worker.join(timeout=30)
+    assert worker.exitcode == 0
+    assert repository.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+    version = repository.status_version
+    
+    restarted = SharedMemoryChargingStationRepository(SharedStationDataset.attach(dataset_name))
+    
+    # Only the stopped worker's station is restored; this process still holds its ticket
+    assert restarted.find_by_id(StationId("STATION-001")).status == StationStatus.AVAILABLE
+    assert repository.find_by_id(StationId("STATION-002")).status == StationStatus.DEFECTIVE
+    assert repository.status_version == version + 1
+    assert SharedStationDataset.attach(dataset_name).restore_orphaned_statuses() == 0
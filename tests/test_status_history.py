@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+import pytest
+from domain.entities.charging_station import ChargingStation
+from domain.value_objects.station_id import StationId
+from domain.enums.station_status import StationStatus
+from domain.events.domain_events import StationMarkedDefective
+from infrastructure.analytics.status_history import StatusHistoryStore
+from infrastructure.events.in_process_event_bus import InProcessEventBus
+
+T0 = datetime(2026, 9, 1)
+
+
+def make_station(suffix, operator="Operator A"):
+    return ChargingStation(
+        station_id=StationId(f"BERLIN-10178-{suffix}"),
+        name=operator,
+        postal_code="10178",
+        created_at=T0
+    )
+
+
+@pytest.fixture
+def store():
+    """History of two operators' stations, with the clock at T0 + 10 days"""
+    store = StatusHistoryStore(initial_capacity=2, clock=lambda: (T0 + timedelta(days=10)).timestamp())
+    store.track([make_station("A"), make_station("B"), make_station("C", operator="Operator B")])
+    # A is down for a day, C for two and a half days
+    store.record(StationId("BERLIN-10178-A"), StationStatus.DEFECTIVE, T0 + timedelta(days=2))
+    store.record(StationId("BERLIN-10178-A"), StationStatus.AVAILABLE, T0 + timedelta(days=3))
+    store.record(StationId("BERLIN-10178-C"), StationStatus.DEFECTIVE, T0 + timedelta(days=5))
+    store.record(StationId("BERLIN-10178-C"), StationStatus.AVAILABLE, T0 + timedelta(days=7, hours=12))
+    return store
+
+
+def test_only_transitions_are_stored(store):
+    """Test repeated statuses are run-length encoded away"""
+    store.record(StationId("BERLIN-10178-A"), StationStatus.AVAILABLE, T0 + timedelta(days=4))
+    
+    assert len(store) == 7
+    assert store.history(StationId("BERLIN-10178-A")) == [
+        (T0, StationStatus.AVAILABLE),
+        (T0 + timedelta(days=2), StationStatus.DEFECTIVE),
+        (T0 + timedelta(days=3), StationStatus.AVAILABLE),
+    ]
+
+
+def test_uptime_of_station_operator_and_network(store):
+    """Test uptime is clipped to the window and to the current time"""
+    start, end = T0, T0 + timedelta(days=30)
+    
+    station = store.uptime(start, end, station_id=StationId("BERLIN-10178-A"))
+    assert station.observed == timedelta(days=10)
+    assert station.downtime == timedelta(days=1)
+    assert station.availability == pytest.approx(0.9)
+    
+    assert store.uptime(start, end, operator="Operator A").availability == pytest.approx(19 / 20)
+    assert store.uptime(start, end).downtime == timedelta(days=3, hours=12)
+    
+    window = store.uptime(T0 + timedelta(days=2, hours=12), T0 + timedelta(days=6), StationId("BERLIN-10178-A"))
+    assert window.observed == timedelta(days=3, hours=12)
+    assert window.downtime == timedelta(hours=12)
+    assert store.uptime(start, end, station_id=StationId("UNKNOWN")).availability is None
+
+
+def test_uptime_grouped_per_station_and_operator(store):
+    """Test the grouped sums match the single queries"""
+    start, end = T0, T0 + timedelta(days=10)
+    
+    by_station = store.uptime_by_station(start, end)
+    by_operator = store.uptime_by_operator(start, end)
+    
+    assert by_station["BERLIN-10178-B"].availability == 1.0
+    assert by_station["BERLIN-10178-C"].downtime == timedelta(days=2, hours=12)
+    assert by_operator["Operator B"].availability == pytest.approx(0.75)
+    assert by_operator["Operator A"] == store.uptime(start, end, operator="Operator A")
+
+
+def test_events_are_recorded():
+    """Test transitions arrive through the event bus, also for untracked stations"""
+    store = StatusHistoryStore(clock=lambda: (T0 + timedelta(days=1)).timestamp())
+    bus = InProcessEventBus()
+    store.subscribe(bus)
+    
+    bus.publish(StationMarkedDefective(T0, StationId("BERLIN-10178-X"), "10178"))
+    
+    assert store.history(StationId("BERLIN-10178-X")) == [(T0, StationStatus.DEFECTIVE)]
+    assert store.uptime_by_operator(T0, T0 + timedelta(days=1)) == {}
+    bus.close()
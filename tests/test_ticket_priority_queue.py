@@ -0,0 +1,142 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from domain.entities.charging_station import ChargingStation
+from domain.entities.malfunction_report import MalfunctionReport
+from domain.value_objects.station_id import StationId
+from domain.value_objects.report_description import ReportDescription
+from domain.enums.malfunction_type import MalfunctionType
+from domain.services.malfunction_report_service import MalfunctionReportService
+from domain.services.ticket_priority_queue import (
+    ImpactScorer, ImpactWeights, TicketPriorityQueue
+)
+from infrastructure.data.regional_statistics_loader import RegionalStatisticsLoader
+from infrastructure.repositories.in_memory_charging_station_repository import (
+    InMemoryChargingStationRepository
+)
+from infrastructure.repositories.in_memory_malfunction_report_repository import (
+    InMemoryMalfunctionReportRepository
+)
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def make_ticket(created_at):
+    """Create a report with a ticket, submitted at the given time"""
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all"),
+        created_at=created_at
+    )
+    report.validate(station_exists=True, station_is_operational=True)
+    report.create_ticket(uuid4())
+    return report
+
+
+@pytest.fixture
+def scorer():
+    """Dense, quiet 10178 versus a busy 12043 with a single station"""
+    return ImpactScorer(
+        stations_per_postal_code={"10178": 4, "12043": 1},
+        population={"10178": 10000, "12043": 20000},
+        traffic={"12043": 500},
+        weights=ImpactWeights(age_per_hour=0.1)
+    )
+
+
+def test_impact_favours_busy_areas_with_few_alternatives(scorer):
+    """Test impact grows with demand and shrinks with station density"""
+    assert scorer.impact("12043") == pytest.approx(3.0)
+    assert scorer.impact("10178") == pytest.approx(1.5 / 4)
+    assert scorer.impact("99999") == pytest.approx(1.0)
+
+
+def test_top_returns_highest_score_first(scorer):
+    """Test the queue orders tickets by impact plus age"""
+    queue = TicketPriorityQueue(scorer)
+    busy = make_ticket(NOW)
+    quiet_old = make_ticket(NOW - timedelta(hours=40))
+    quiet_new = make_ticket(NOW)
+    queue.push(quiet_new, "10178")
+    queue.push(busy, "12043")
+    queue.push(quiet_old, "10178")
+    
+    top = queue.top(3, now=NOW)
+    
+    # 0.375 + 4.0 age bonus beats 3.0 impact
+    assert [t.ticket_id for t in top] == [
+        quiet_old.ticket_id, busy.ticket_id, quiet_new.ticket_id
+    ]
+    assert top[0].score == pytest.approx(4.375)
+    assert len(queue) == 3
+
+
+def test_removed_tickets_are_skipped(scorer):
+    """Test resolved tickets no longer appear in the top list"""
+    queue = TicketPriorityQueue(scorer)
+    first = make_ticket(NOW)
+    second = make_ticket(NOW)
+    queue.push(first, "12043")
+    queue.push(second, "10178")
+    
+    queue.remove(first.ticket_id)
+    queue.remove(uuid4())
+    
+    assert [t.ticket_id for t in queue.top(5, now=NOW)] == [second.ticket_id]
+    assert first.ticket_id not in queue
+
+
+def test_service_keeps_queue_in_sync(scorer):
+    """Test processing and resolving reports updates the queue"""
+    station_repo = InMemoryChargingStationRepository()
+    station_repo.save(ChargingStation(
+        station_id=StationId("STATION-001"),
+        name="Test Station",
+        postal_code="12043"
+    ))
+    service = MalfunctionReportService(
+        InMemoryMalfunctionReportRepository(),
+        station_repo,
+        TicketPriorityQueue(scorer)
+    )
+    report_id = service.submit_malfunction_report(
+        "STATION-001", MalfunctionType.NOT_CHARGING, "Vehicle not charging at all"
+    )
+    result = service.process_malfunction_report(report_id)
+    
+    assert [r.report_id for r in service.get_most_urgent_tickets()] == [report_id]
+    
+    service.resolve_malfunction(result.ticket_id)
+    
+    assert service.get_most_urgent_tickets() == []
+
+
+def test_statistics_loader_sums_per_postal_code(tmp_path):
+    """Test population and traffic are read per postal code"""
+    (tmp_path / "plz_einwohner.csv").write_text(
+        "plz;einwohner\n10178;12345\n12043;20000\n", encoding="utf-8"
+    )
+    (tmp_path / "Verkehrsaufkommen.csv").write_text(
+        "PLZ;DTV\n12043;300\n12043;200,5\n", encoding="utf-8"
+    )
+    loader = RegionalStatisticsLoader(tmp_path)
+    
+    assert loader.load_population() == {"10178": 12345.0, "12043": 20000.0}
+    assert loader.load_traffic() == {"12043": 500.5}
+    assert RegionalStatisticsLoader(tmp_path / "missing").load_population() == {}
+
+
+def test_statistics_loader_reads_thousands_and_matches_whole_column_names(tmp_path):
+    """Test 12.345 is read as twelve thousand and loosely similar headers are ignored"""
+    (tmp_path / "plz_einwohner.csv").write_text(
+        "plz_name;plz;einwohner (2023)\nMitte;10178;12.345\nNeukölln;12043;1.234,5\n", encoding="utf-8"
+    )
+    (tmp_path / "Verkehrsaufkommen.csv").write_text(
+        "PLZ;Zählstellen-Account\n12043;3\n", encoding="utf-8"
+    )
+    loader = RegionalStatisticsLoader(tmp_path)
+    
+    assert loader.load_population() == {"10178": 12345.0, "12043": 1234.5}
+    assert loader.load_traffic() == {}
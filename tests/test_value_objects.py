@@ -62,4 +62,19 @@ def test_description_too_long_raises_error():
 def test_empty_description_raises_error():
     """Test empty description rejection"""
     with pytest.raises(ValueError):
-        ReportDescription("")
\ No newline at end of file
+        ReportDescription("")
+
+def test_interned_station_id_is_canonical():
+    """Test that the interning factory returns one instance per value"""
+    first = StationId.of("STATION-001")
+    second = StationId.of("STATION-001")
+    
+    assert first is second
+    assert first == StationId("STATION-001")
+    assert StationId.of("STATION-002") is not first
+
+
+def test_interned_station_id_is_validated():
+    """Test that the interning factory still rejects invalid values"""
+    with pytest.raises(ValueError):
+        StationId.of("   ")